@@ -0,0 +1,91 @@
+# @file     kway_merge.py
+# @brief    A file for implementing a streaming k-way merge of sorted sources
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import heapq
+from enum import Enum
+from functools import cmp_to_key
+
+# ---------------------------------------------------------------------------- #
+
+class CMPValues(Enum):
+    """
+    The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that 
+    takes 2 variables & outputs which of the variables is less than, equal 
+    to, or greater than the other.
+    """
+    LESS = -1
+    EQUAL = 0
+    GREATER = 1
+
+# ---------------------------------------------------------------------------- #
+
+def kway_merge(*sources, cmp_fn, unique = False):
+    """
+    MERGES any number of sorted sources into ONE sorted stream of keys via a
+    min-heap holding the FRONT key of every source, i.e. O(k) memory &
+    O(n log k) time for `n` keys over `k` sources. A source is anything that
+    iterates its keys in sorted order, such as an `SLL`, `DLL`, `ULL`,
+    `SkipList`, `BST`, `AVL` or a plain `list`. On ties, keys are yielded in
+    the order of their sources, which keeps the merge STABLE.
+
+    :Parameters:
+        - `sources`: the sorted ITERABLES to be merged
+        - `cmp_fn`: a function for COMPARING keys, which outputs `1` if the
+          1st key is GREATER, `0` if they are EQUAL & `-1` if it is LESS
+        - `unique` (optional): if `True`, only the 1st of every group of
+          EQUAL keys is yielded (default `False`)
+
+    :Return:
+        A GENERATOR of the merged keys
+
+    :Raises:
+        - `TypeError`: if `cmp_fn` is NOT a function
+    """
+
+    # STEP 1: Ensure `cmp_fn` is a function
+    if (not callable(cmp_fn)):
+        raise TypeError("`cmp_fn` must be of TYPE 'function'")
+    wrap = cmp_to_key(cmp_fn)
+
+    def merge():
+        """
+        YIELDS the merged keys of `sources`, see `kway_merge`.
+        """
+
+        # STEP 1: Seed the heap with the 1st key of every non-empty source,
+        #         the source index breaks ties so iterators are NEVER compared
+        heap = []
+        for index, source in enumerate(sources):
+            iterator = iter(source)
+            for key in iterator:
+                heap.append((wrap(key), index, key, iterator))
+                break
+        heapq.heapify(heap)
+
+        # STEP 2: Repeatedly yield the SMALLEST front key & refill from it's
+        #         source
+        last = None
+        while (heap):
+            _, index, key, iterator = heap[0]
+
+            # STEP 3: Skip keys EQUAL to the last one yielded (if `unique`)
+            if ((not unique) or (last is None)
+                or (cmp_fn(key, last[0]) != CMPValues.EQUAL.value)):
+                last = (key,)
+                yield key
+
+            # CASE A: The source has more keys, replace it's front key in place
+            for key in iterator:
+                heapq.heapreplace(heap, (wrap(key), index, key, iterator))
+                break
+
+            # CASE B: The source is EXHAUSTED, drop it from the heap
+            else:
+                heapq.heappop(heap)
+
+    # STEP 2: Return the merging GENERATOR, so a bad `cmp_fn` is raised here
+    #         rather than at the 1st `next`
+    return merge()
@@ -0,0 +1,46 @@
+# @file     test_kway_merge.py
+# @brief    A file for testing the streaming k-way merge
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from kway_merge import kway_merge
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_matches_sorted():
+    rng = random.Random(8)
+    for _ in range(50):
+        sources = [sorted(rng.randrange(100) for _ in range(rng.randint(0, 30)))
+                   for _ in range(rng.randint(0, 6))]
+        merged = list(kway_merge(*sources, cmp_fn = cmp_fn))
+        assert merged == sorted(key for source in sources for key in source)
+
+def test_unique_drops_equal_keys():
+    merged = kway_merge([1, 1, 3], [1, 2, 3], [4], cmp_fn = cmp_fn, unique = True)
+    assert list(merged) == [1, 2, 3, 4]
+
+def test_ties_follow_source_order():
+    by_key = lambda a, b: cmp_fn(a[0], b[0])
+    merged = kway_merge([(1, 'a'), (2, 'a')], [(1, 'b'), (2, 'b')],
+                        cmp_fn = by_key)
+    assert list(merged) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+
+def test_streams_lazily():
+    def endless(start):
+        while (True):
+            yield start
+            start += 2
+    merged = kway_merge(endless(0), endless(1), cmp_fn = cmp_fn)
+    assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+
+def test_rejects_bad_cmp_fn_when_called():
+    with pytest.raises(TypeError):
+        kway_merge([1], cmp_fn = None)
@@ -0,0 +1,43 @@
+# @file     bench_adll.py
+# @brief    A benchmark of object-node vs array-backed doubly linked-lists
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_adll.py [n_items]
+# ---------------------------------------------------------------------------- #
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "linked_lists"))
+from adll import ADLL
+from dll import DLL
+
+# ---------------------------------------------------------------------------- #
+
+def run(name, make, n):
+    objects = len(gc.get_objects())
+    start = time.perf_counter()
+    dll = make(lambda v1, v2: (v1 > v2) - (v1 < v2))
+    for i in range(n):
+        dll.insert_tail(i)
+    fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gc.collect()
+    collect = time.perf_counter() - start
+    print("{:<12} fill {:>8.3f} s   gc.collect {:>8.3f} s   +{} GC objects"
+          .format(name, fill, collect, len(gc.get_objects()) - objects))
+    return dll
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 1_000_000
+    dll = run("DLL", DLL, n)
+    del dll
+    gc.collect()
+    run("ADLL('q')", lambda cmp_fn: ADLL(cmp_fn, 'q'), n)
+
+if __name__ == "__main__":
+    main()
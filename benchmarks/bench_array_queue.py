@@ -0,0 +1,48 @@
+# @file     bench_array_queue.py
+# @brief    A benchmark of filling & draining an array-based queue
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_array_queue.py [n_items]
+# ---------------------------------------------------------------------------- #
+
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "stacks_and_queues"))
+from array_queue import ArrQueue
+
+# ---------------------------------------------------------------------------- #
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 10_000_000
+    for shrink in (False, True):
+        queue = ArrQueue(shrink = shrink)
+        name = "shrink" if shrink else "no shrink"
+
+        start = time.perf_counter()
+        for i in range(n):
+            queue.enqueue(i)
+        print("{:<10} {:<24} {:>10.3f} s".format(name, "enqueue x{}".format(n),
+                                                 time.perf_counter() - start))
+
+        start = time.perf_counter()
+        while (queue.len() > 0):
+            queue.dequeue()
+        print("{:<10} {:<24} {:>10.3f} s".format(name, "drain x{}".format(n),
+                                                 time.perf_counter() - start))
+
+    # Typed storage, moving batches of 10k floats per call
+    queue = ArrQueue(typecode = 'd')
+    batch = array('d', [0.0]) * 10_000
+    start = time.perf_counter()
+    for _ in range(n // len(batch)):
+        queue.enqueue_many(batch)
+        queue.dequeue_many(len(batch))
+    print("{:<10} {:<24} {:>10.3f} s".format("typed 'd'", "batches x{}".format(n),
+                                             time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# @file     bench_async_queues.py
+# @brief    A benchmark of the asyncio queue adapters vs `asyncio.Queue`
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_async_queues.py [n_items] [batch]
+# ---------------------------------------------------------------------------- #
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "stacks_and_queues"))
+from dllq import AsyncDLLQ
+from dlls import AsyncDLLS
+
+# ---------------------------------------------------------------------------- #
+
+async def produce(q, count):
+    for i in range(count):
+        await q.put(i)
+
+async def consume_asyncio(q, n, batch):
+    # The usual batching pattern for `asyncio.Queue`, i.e. await the 1st
+    # item & then take whatever else is ready WITHOUT suspending
+    while (n > 0):
+        items = [await q.get()]
+        while ((len(items) < batch) and not q.empty()):
+            items.append(q.get_nowait())
+        n -= len(items)
+
+async def consume_batch(q, n, batch):
+    while (n > 0):
+        n -= len(await q.get_batch(batch))
+
+async def run(name, q, n, producers, consume, batch):
+    per_producer = n // producers
+    start = time.perf_counter()
+    await asyncio.gather(consume(q, per_producer * producers, batch),
+                         *(produce(q, per_producer) for _ in range(producers)))
+    elapsed = time.perf_counter() - start
+    print("{:<20} {:>2} producers {:>8.3f} s   {:>10,.0f} items/s"
+          .format(name, producers, elapsed, per_producer * producers / elapsed))
+
+async def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 200_000
+    batch = int(sys.argv[2]) if (len(sys.argv) > 2) else 256
+    maxsize = 1024
+    cmp_fn = lambda v1, v2: (v1 > v2) - (v1 < v2)
+    for producers in (1, 4, 16):
+        await run("asyncio.Queue", asyncio.Queue(maxsize), n, producers,
+                  consume_asyncio, batch)
+        await run("AsyncDLLQ get_batch", AsyncDLLQ(cmp_fn, maxsize = maxsize), n,
+                  producers, consume_batch, batch)
+        await run("AsyncDLLS get_batch", AsyncDLLS(cmp_fn, maxsize = maxsize), n,
+                  producers, consume_batch, batch)
+        print()
+
+if __name__ == "__main__":
+    asyncio.run(main())
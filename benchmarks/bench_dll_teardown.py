@@ -0,0 +1,45 @@
+# @file     bench_dll_teardown.py
+# @brief    A benchmark of the GC pause left behind by dropping a large DLL
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_dll_teardown.py [n_items]
+# ---------------------------------------------------------------------------- #
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "linked_lists"))
+from dll import DLL
+
+# ---------------------------------------------------------------------------- #
+
+def run(name, n, weak_prev = False, clear = False):
+    dll = DLL(lambda v1, v2: (v1 > v2) - (v1 < v2), weak_prev = weak_prev)
+    dll.extend(range(n))
+    gc.collect()
+
+    # The teardown itself, i.e. `clear` (if any) & dropping the last reference
+    start = time.perf_counter()
+    if (clear):
+        dll.clear()
+    del dll
+    teardown = time.perf_counter() - start
+
+    # The pause the cyclic collector then needs to reclaim what is left
+    start = time.perf_counter()
+    freed = gc.collect()
+    pause = time.perf_counter() - start
+    print("{:<16} teardown {:>8.3f} s   gc pause {:>8.3f} s   {:>9} freed by GC"
+          .format(name, teardown, pause, freed))
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 1_000_000
+    run("drop", n)
+    run("clear + drop", n, clear = True)
+    run("weak_prev drop", n, weak_prev = True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# @file     bench_kd_tree.py
+# @brief    A benchmark of KDT range & nearest queries against brute force
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_kd_tree.py [n_points] [n_queries]
+# ---------------------------------------------------------------------------- #
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "trees", "kd_trees"))
+from kd_tree import KDT
+
+# ---------------------------------------------------------------------------- #
+
+def brute_range(points, lows, highs):
+    return [p for p in points
+            if all(lo <= x <= hi for lo, x, hi in zip(lows, p, highs))]
+
+def brute_nearest(points, point, k):
+    dist = lambda p: sum((a - b) * (a - b) for a, b in zip(point, p))
+    return sorted(points, key = dist)[:k]
+
+def timed(label, fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    print("{:<32} {:>10.3f} ms/query".format(label, 1000 * elapsed / repeat))
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 1_000_000
+    queries = int(sys.argv[2]) if (len(sys.argv) > 2) else 10
+    rng = random.Random(0)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    start = time.perf_counter()
+    kdt = KDT(2, points)
+    print("{:<32} {:>10.3f} s".format("build ({} points)".format(n),
+                                      time.perf_counter() - start))
+
+    boxes = []
+    for _ in range(queries):
+        x, y = rng.random(), rng.random()
+        boxes.append(((x, y), (x + 0.01, y + 0.01)))
+    targets = [(rng.random(), rng.random()) for _ in range(queries)]
+
+    it = iter(boxes)
+    timed("KDT.range_search", lambda: kdt.range_search(next(it)), queries)
+    it = iter(boxes)
+    timed("brute-force range", lambda: brute_range(points, *next(it)), queries)
+    it = iter(targets)
+    timed("KDT.nearest (k=10)", lambda: kdt.nearest(next(it), 10), queries)
+    it = iter(targets)
+    timed("brute-force nearest (k=10)",
+          lambda: brute_nearest(points, next(it), 10), queries)
+
+if __name__ == "__main__":
+    main()
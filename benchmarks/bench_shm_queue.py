@@ -0,0 +1,98 @@
+# @file     bench_shm_queue.py
+# @brief    A benchmark of the shared-memory ring vs `multiprocessing.Queue`
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_shm_queue.py [n_records] [record_size]
+# ---------------------------------------------------------------------------- #
+
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "stacks_and_queues"))
+from shm_queue import ShmQueue
+
+# ---------------------------------------------------------------------------- #
+
+def consume_shm(name, n):
+    q = ShmQueue.attach(name)
+    checksum = 0
+    while (n > 0):
+        record = q.peek()
+        if (record is None):
+            os.sched_yield()
+            continue
+        checksum += record[0]
+        record.release()
+        q.dequeue()
+        n -= 1
+    q.close()
+
+def consume_shm_batch(name, n, batch):
+    q = ShmQueue.attach(name)
+    checksum = 0
+    while (n > 0):
+        records = q.dequeue_many(batch)
+        if (not records):
+            os.sched_yield()
+            continue
+        checksum += records[0]
+        n -= len(records) // q.record_size
+    q.close()
+
+def consume_mp(q, n):
+    checksum = 0
+    for _ in range(n):
+        checksum += q.get()[0]
+
+def run(name, q, consume, args, n, record, batch = 1):
+    consumer = multiprocessing.Process(target = consume, args = args)
+    consumer.start()
+    start = time.perf_counter()
+    if (isinstance(q, ShmQueue) and (batch > 1)):
+        records = memoryview(record * batch)
+        for _ in range(n // batch):
+            sent = 0
+            while (sent < len(records)):
+                added = q.enqueue_many(records[sent:])
+                if (added == 0):
+                    os.sched_yield()
+                sent += added * len(record)
+    elif (isinstance(q, ShmQueue)):
+        for _ in range(n):
+            while (q.full()):
+                os.sched_yield()
+            q.enqueue(record)
+    else:
+        for _ in range(n):
+            q.put(record)
+    consumer.join()
+    elapsed = time.perf_counter() - start
+    print("{:<22} {:>8.3f} s   {:>10,.0f} records/s"
+          .format(name, elapsed, n / elapsed))
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 200_000
+    record_size = int(sys.argv[2]) if (len(sys.argv) > 2) else 64
+    batch = 64
+    n -= n % batch
+    record = bytes(range(256)) * (record_size // 256) + bytes(record_size % 256)
+
+    mp_queue = multiprocessing.Queue(1024)
+    run("multiprocessing.Queue", mp_queue, consume_mp, (mp_queue, n), n, record)
+
+    shm_queue = ShmQueue(record_size, 1024)
+    run("ShmQueue", shm_queue, consume_shm, (shm_queue.name, n), n, record)
+    shm_queue.close()
+    shm_queue.unlink()
+
+    shm_queue = ShmQueue(record_size, 1024)
+    run("ShmQueue (batch {})".format(batch), shm_queue, consume_shm_batch,
+        (shm_queue.name, n, batch), n, record, batch)
+    shm_queue.close()
+    shm_queue.unlink()
+
+if __name__ == "__main__":
+    main()
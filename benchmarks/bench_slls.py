@@ -0,0 +1,35 @@
+# @file     bench_slls.py
+# @brief    A benchmark of filling & draining a singly linked-list stack
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_slls.py [n_items]
+# ---------------------------------------------------------------------------- #
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "stacks_and_queues"))
+from slls import SLLS
+
+# ---------------------------------------------------------------------------- #
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 1_000_000
+    stack = SLLS(lambda v1, v2: (v1 > v2) - (v1 < v2))
+
+    start = time.perf_counter()
+    for i in range(n):
+        stack.push(i)
+    print("{:<24} {:>10.3f} s".format("push x{}".format(n),
+                                      time.perf_counter() - start))
+
+    start = time.perf_counter()
+    while (not stack.is_empty()):
+        stack.pop()
+    print("{:<24} {:>10.3f} s".format("drain x{}".format(n),
+                                      time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# @file     bench_sync_queues.py
+# @brief    A benchmark of lock contention on the thread-safe blocking queues
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+#           Usage: python bench_sync_queues.py [n_items] [batch]
+# ---------------------------------------------------------------------------- #
+
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "data_structures", "stacks_and_queues"))
+from array_queue import SyncArrQueue
+from dllq import SyncDLLQ
+
+# ---------------------------------------------------------------------------- #
+
+def produce(q, count):
+    for i in range(count):
+        q.put(i)
+
+def consume_get(q, n):
+    for _ in range(n):
+        q.get()
+
+def consume_drain(q, n, batch):
+    while (n > 0):
+        n -= len(q.drain(batch, block = True))
+
+def run(name, q, n, producers, consume):
+    per_producer = n // producers
+    threads = [threading.Thread(target = produce, args = (q, per_producer))
+               for _ in range(producers)]
+    consumer = threading.Thread(target = consume, args = (q, per_producer * producers))
+
+    start = time.perf_counter()
+    consumer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    consumer.join()
+    elapsed = time.perf_counter() - start
+    print("{:<24} {:>2} producers {:>8.3f} s   {:>10,.0f} items/s"
+          .format(name, producers, elapsed, per_producer * producers / elapsed))
+
+def main():
+    n = int(sys.argv[1]) if (len(sys.argv) > 1) else 200_000
+    batch = int(sys.argv[2]) if (len(sys.argv) > 2) else 256
+    maxsize = 1024
+    cmp_fn = lambda v1, v2: (v1 > v2) - (v1 < v2)
+    for producers in (1, 2, 4, 8, 16):
+        run("queue.Queue get", queue.Queue(maxsize), n, producers, consume_get)
+        run("SyncArrQueue get", SyncArrQueue(maxsize = maxsize), n, producers,
+            consume_get)
+        run("SyncArrQueue drain", SyncArrQueue(maxsize = maxsize), n, producers,
+            lambda q, count: consume_drain(q, count, batch))
+        run("SyncDLLQ drain", SyncDLLQ(cmp_fn, maxsize = maxsize), n, producers,
+            lambda q, count: consume_drain(q, count, batch))
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+# @file     lfu_cache.py
+# @brief    A file for implementing a least-frequently used (LFU) cache
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+class LFUCache(object):
+    """
+    An INTERFACE for a least-frequently used (LFU) cache: a `dict` index from
+    keys to entries, where the entries are kept in a doubly linked-list (DLL)
+    of FREQUENCY buckets, each holding a DLL of entries from oldest to newest.
+    """
+
+    class Entry(object):
+        """
+        A Doubly Linked-List (DLL) node holding one cache entry.
+        """
+
+        def __init__(self, key, value = None):
+            self._key = key
+            self._value = value
+            self._bucket = None
+            self._next = None
+            self._prev = None
+
+        @property
+        def key(self):
+            """
+            The KEY the cache entry is indexed by.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @property
+        def value(self):
+            """
+            The VALUE stored in the cache entry.
+            """
+            return self._value
+
+        @value.setter
+        def value(self, new_value):
+            self._value = new_value
+
+        @property
+        def bucket(self):
+            """
+            A POINTER to the frequency bucket the entry belongs to.
+            """
+            return self._bucket
+
+        @bucket.setter
+        def bucket(self, new_bucket):
+
+            # STEP 1: Ensure `new_bucket` is of type `LFUCache.Bucket` or `None`
+            if (isinstance(new_bucket, LFUCache.Bucket) or (new_bucket is None)):
+                self._bucket = new_bucket
+                return
+
+            # STEP 2: `new_bucket` is an INAPPROPRIATE type
+            raise TypeError("`new_bucket` must be of TYPE `LFUCache.Bucket` or `None`")
+
+        @property
+        def next(self):
+            """
+            A POINTER to the next NEWER entry in the same bucket.
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of type `LFUCache.Entry` or `None`
+            if (isinstance(new_next, LFUCache.Entry) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `LFUCache.Entry` or `None`")
+
+        @property
+        def prev(self):
+            """
+            A POINTER to the previous OLDER entry in the same bucket.
+            """
+            return self._prev
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # STEP 1: Ensure the `new_prev` is type `LFUCache.Entry` or `None`
+            if (isinstance(new_prev, LFUCache.Entry) or (new_prev is None)):
+                self._prev = new_prev
+                return
+
+            # STEP 2: `new_prev` is an INAPPROPRIATE type
+            raise TypeError("`new_prev` must be of TYPE `LFUCache.Entry` or `None`")
+
+    class Bucket(object):
+        """
+        A Doubly Linked-List (DLL) node holding every entry with the SAME
+        access frequency.
+        """
+
+        def __init__(self, freq):
+            self._freq = freq
+            self._head = None
+            self._tail = None
+            self._next = None
+            self._prev = None
+
+        @property
+        def freq(self):
+            """
+            The access FREQUENCY shared by every entry in the bucket.
+            """
+            return self._freq
+
+        @freq.setter
+        def freq(self, new_freq):
+            self._freq = new_freq
+
+        @property
+        def head(self):
+            """
+            The OLDEST entry in the bucket (i.e. next to be evicted).
+            """
+            return self._head
+
+        @head.setter
+        def head(self, new_head):
+
+            # STEP 1: Ensure `new_head` is of type `LFUCache.Entry` or `None`
+            if (isinstance(new_head, LFUCache.Entry) or (new_head is None)):
+                self._head = new_head
+                return
+
+            # STEP 2: `new_head` is an INAPPROPRIATE type
+            raise TypeError("`new_head` must be of TYPE `LFUCache.Entry` or `None`")
+
+        @property
+        def tail(self):
+            """
+            The NEWEST entry in the bucket.
+            """
+            return self._tail
+
+        @tail.setter
+        def tail(self, new_tail):
+
+            # STEP 1: Ensure `new_tail` is of type `LFUCache.Entry` or `None`
+            if (isinstance(new_tail, LFUCache.Entry) or (new_tail is None)):
+                self._tail = new_tail
+                return
+
+            # STEP 2: `new_tail` is an INAPPROPRIATE type
+            raise TypeError("`new_tail` must be of TYPE `LFUCache.Entry` or `None`")
+
+        @property
+        def next(self):
+            """
+            A POINTER to the bucket with the next HIGHER frequency.
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of type `LFUCache.Bucket` or `None`
+            if (isinstance(new_next, LFUCache.Bucket) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `LFUCache.Bucket` or `None`")
+
+        @property
+        def prev(self):
+            """
+            A POINTER to the bucket with the next LOWER frequency.
+            """
+            return self._prev
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # STEP 1: Ensure the `new_prev` is type `LFUCache.Bucket` or `None`
+            if (isinstance(new_prev, LFUCache.Bucket) or (new_prev is None)):
+                self._prev = new_prev
+                return
+
+            # STEP 2: `new_prev` is an INAPPROPRIATE type
+            raise TypeError("`new_prev` must be of TYPE `LFUCache.Bucket` or `None`")
+
+        def is_empty(self):
+            """
+            CHECKS if the bucket holds NO entries.
+            """
+            return (self.head is None)
+
+        def append(self, entry):
+            """
+            LINKS `entry` as the NEWEST entry of the bucket in O(1).
+            """
+            entry.bucket = self
+            entry.next = None
+            entry.prev = self.tail
+            if (self.tail != None):
+                self.tail.next = entry
+            else:
+                self.head = entry
+            self.tail = entry
+
+        def remove(self, entry):
+            """
+            UNLINKS `entry` from the bucket in O(1).
+            """
+            if (entry.prev != None):
+                entry.prev.next = entry.next
+            else:
+                self.head = entry.next
+            if (entry.next != None):
+                entry.next.prev = entry.prev
+            else:
+                self.tail = entry.prev
+            entry.next = entry.prev = entry.bucket = None
+
+    def __init__(self, max_items, aging_interval = None, on_evict = None):
+
+        # STEP 1: Ensure `max_items` is a positive `int`
+        if (not isinstance(max_items, int)):
+            raise TypeError("`max_items` must be of TYPE `int`")
+        elif (max_items < 1):
+            raise ValueError("`max_items` must be at LEAST 1")
+
+        # STEP 2: Ensure `aging_interval` (if any) is a positive `int`
+        if (aging_interval is not None):
+            if (not isinstance(aging_interval, int)):
+                raise TypeError("`aging_interval` must be of TYPE `int` or `None`")
+            elif (aging_interval < 1):
+                raise ValueError("`aging_interval` must be at LEAST 1")
+
+        # STEP 3: Ensure `on_evict` (if any) is a function
+        if ((on_evict is not None) and (not callable(on_evict))):
+            raise TypeError("`on_evict` must be of TYPE 'function' or `None`")
+
+        # STEP 4: Assign class attributes
+        self._max_items = max_items
+        self._aging_interval = aging_interval
+        self._on_evict = on_evict
+        self._index = {}
+        self._head = None
+        self._ops = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_items(self):
+        """
+        The MAXIMUM number of entries in the cache.
+        """
+        return self._max_items
+
+    @property
+    def aging_interval(self):
+        """
+        The number of `get` & `put` calls between every HALVING of all entry
+        frequencies, or `None` if frequencies never decay.
+        """
+        return self._aging_interval
+
+    @property
+    def head(self):
+        """
+        The bucket with the LOWEST frequency in the cache.
+        """
+        return self._head
+
+    @property
+    def hits(self):
+        """
+        The number of `get` calls that FOUND their key.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of `get` calls that did NOT find their key.
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        The number of entries EVICTED to keep the cache within `max_items`.
+        """
+        return self._evictions
+
+    @property
+    def hit_ratio(self):
+        """
+        The FRACTION of `get` calls that were hits, or 0 if there were none.
+        """
+        total = self._hits + self._misses
+        return (self._hits / total) if total else 0.0
+
+    def __len__(self):
+        """
+        RETRIEVES the number of entries in the cache.
+        """
+        return len(self._index)
+
+    def __contains__(self, key):
+        """
+        CHECKS if `key` is cached, WITHOUT counting an access.
+        """
+        return (key in self._index)
+
+    def __iter__(self):
+        """
+        YIELDS every cached key in EVICTION order, i.e. from the LEAST to the
+        MOST frequently used & from the oldest to the newest on ties.
+        """
+        bucket = self._head
+        while (bucket != None):
+            entry = bucket.head
+            while (entry != None):
+                yield entry.key
+                entry = entry.next
+            bucket = bucket.next
+
+    def frequency(self, key):
+        """
+        RETRIEVES the access frequency of `key`, or `None` if NOT cached.
+        """
+        entry = self._index.get(key)
+        return None if (entry is None) else entry.bucket.freq
+
+    def __link_bucket_after(self, bucket, new_bucket):
+        """
+        LINKS `new_bucket` directly after `bucket`, or as the HEAD if
+        `bucket` is `None`.
+        """
+        if (bucket is None):
+            new_bucket.next = self._head
+            if (self._head != None):
+                self._head.prev = new_bucket
+            self._head = new_bucket
+        else:
+            new_bucket.prev = bucket
+            new_bucket.next = bucket.next
+            if (bucket.next != None):
+                bucket.next.prev = new_bucket
+            bucket.next = new_bucket
+
+    def __unlink_bucket(self, bucket):
+        """
+        UNLINKS an EMPTY `bucket` from the bucket list in O(1).
+        """
+        if (bucket.prev != None):
+            bucket.prev.next = bucket.next
+        else:
+            self._head = bucket.next
+        if (bucket.next != None):
+            bucket.next.prev = bucket.prev
+        bucket.next = bucket.prev = None
+
+    def __touch(self, entry):
+        """
+        MOVES `entry` into the bucket for it's NEXT frequency in O(1).
+        """
+
+        # STEP 1: Find or create the bucket with the next frequency
+        bucket = entry.bucket
+        target = bucket.next
+        if ((target is None) or (target.freq != bucket.freq + 1)):
+            target = LFUCache.Bucket(bucket.freq + 1)
+            self.__link_bucket_after(bucket, target)
+
+        # STEP 2: Move the entry & drop it's old bucket if now empty
+        bucket.remove(entry)
+        target.append(entry)
+        if (bucket.is_empty()):
+            self.__unlink_bucket(bucket)
+
+    def __tick(self):
+        """
+        COUNTS one `get` or `put` & ages the cache every `aging_interval`.
+        """
+        self._ops += 1
+        if ((self._aging_interval is not None)
+            and (self._ops % self._aging_interval == 0)):
+            self.age()
+
+    def age(self):
+        """
+        HALVES the frequency of every entry (to a minimum of 1), so keys that
+        were hot in the past stop shielding themselves from eviction. Buckets
+        that collapse onto the same frequency are MERGED, keeping the
+        previously lower-frequency entries as the older ones.
+        """
+
+        # STEP 1: Walk the buckets in ascending frequency order
+        bucket = self._head
+        while (bucket != None):
+            next_bucket = bucket.next
+            bucket.freq = max(1, bucket.freq // 2)
+
+            # STEP 2: Merge into the previous bucket if the frequencies meet
+            prev = bucket.prev
+            if ((prev != None) and (prev.freq == bucket.freq)):
+                while (not bucket.is_empty()):
+                    entry = bucket.head
+                    bucket.remove(entry)
+                    prev.append(entry)
+                self.__unlink_bucket(bucket)
+            bucket = next_bucket
+
+    def get(self, key, default = None):
+        """
+        RETRIEVES the value cached under `key` & INCREMENTS it's frequency.
+
+        :Parameters:
+            - `key`: the KEY to look up
+            - `default` (optional): the value returned on a MISS
+
+        :Return:
+            - The cached VALUE, OR
+            - `default`: if `key` is NOT cached
+        """
+
+        # CASE A: Cache MISS
+        entry = self._index.get(key)
+        if (entry is None):
+            self._misses += 1
+            self.__tick()
+            return default
+
+        # CASE B: Cache HIT, promote the entry to the next frequency
+        self._hits += 1
+        self.__touch(entry)
+        self.__tick()
+        return entry.value
+
+    def put(self, key, value):
+        """
+        CACHES `value` under `key`, evicting the LEAST frequently used entry
+        (the OLDEST on ties) if the cache is full.
+
+        :Parameters:
+            - `key`: the KEY to cache the value under
+            - `value`: the VALUE to be cached
+
+        :Return:
+            A POINTER to the cache entry holding `value`
+        """
+
+        # CASE A: `key` is already cached, update it & count an access
+        entry = self._index.get(key)
+        if (entry != None):
+            entry.value = value
+            self.__touch(entry)
+            self.__tick()
+            return entry
+
+        # CASE B: `key` is NEW, make room first
+        if (len(self._index) >= self._max_items):
+            self.evict()
+
+        # STEP 1: New entries start in the frequency 1 bucket
+        if ((self._head is None) or (self._head.freq != 1)):
+            self.__link_bucket_after(None, LFUCache.Bucket(1))
+        entry = LFUCache.Entry(key, value)
+        self._head.append(entry)
+        self._index[key] = entry
+        self.__tick()
+        return entry
+
+    def delete(self, key):
+        """
+        REMOVES `key` from the cache, WITHOUT calling `on_evict`.
+
+        :Parameters:
+            - `key`: the KEY to be removed
+
+        :Return:
+            - The removed VALUE, OR
+            - `None`: if `key` is NOT cached
+        """
+        entry = self._index.pop(key, None)
+        if (entry is None):
+            return None
+        bucket = entry.bucket
+        bucket.remove(entry)
+        if (bucket.is_empty()):
+            self.__unlink_bucket(bucket)
+        return entry.value
+
+    def evict(self):
+        """
+        EVICTS the OLDEST entry of the LOWEST frequency bucket in O(1) &
+        passes it to `on_evict`.
+
+        :Return:
+            - The evicted `(key, value)` PAIR, OR
+            - `None`: if the cache is EMPTY
+        """
+
+        # STEP 1: Check if the cache is empty
+        if (self._head is None):
+            return None
+
+        # STEP 2: Remove the entry from it's bucket & the index
+        entry = self._head.head
+        key, value = entry.key, entry.value
+        self.delete(key)
+        self._evictions += 1
+
+        # STEP 3: Notify the eviction callback
+        if (self._on_evict is not None):
+            self._on_evict(key, value)
+        return (key, value)
@@ -0,0 +1,391 @@
+# @file     lru_cache.py
+# @brief    A file for implementing a least-recently used (LRU) cache
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+class LRUCache(object):
+    """
+    An INTERFACE for a least-recently used (LRU) cache: a `dict` index from
+    keys to the nodes of a doubly linked-list (DLL) kept in RECENCY order.
+    """
+
+    class Node(object):
+        """
+        A Doubly Linked-List (DLL) node holding one cache entry.
+        """
+
+        def __init__(self, key, value = None, weight = 1):
+            self._key = key
+            self._value = value
+            self._weight = weight
+            self._next = None
+            self._prev = None
+
+        @property
+        def key(self):
+            """
+            The KEY the cache entry is indexed by.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def value(self):
+            """
+            The VALUE stored in the cache entry.
+            """
+            return self._value
+
+        @value.setter
+        def value(self, new_value):
+            self._value = new_value
+
+        @value.deleter
+        def value(self):
+            del self._value
+
+        @property
+        def weight(self):
+            """
+            The WEIGHT (e.g. size in bytes) of the cache entry.
+            """
+            return self._weight
+
+        @weight.setter
+        def weight(self, new_weight):
+            self._weight = new_weight
+
+        @weight.deleter
+        def weight(self):
+            del self._weight
+
+        @property
+        def next(self):
+            """
+            A POINTER to the next LESS recently used node.
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of type `LRUCache.Node` or `None`
+            if (isinstance(new_next, LRUCache.Node) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `LRUCache.Node` or `None`")
+
+        @next.deleter
+        def next(self):
+            del self._next
+
+        @property
+        def prev(self):
+            """
+            A POINTER to the previous MORE recently used node.
+            """
+            return self._prev
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # STEP 1: Ensure the `new_prev` is type `LRUCache.Node` or `None`
+            if (isinstance(new_prev, LRUCache.Node) or (new_prev is None)):
+                self._prev = new_prev
+                return
+
+            # STEP 2: `new_prev` is an INAPPROPRIATE type
+            raise TypeError("`new_prev` must be of TYPE `LRUCache.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, max_items = None, max_weight = None, on_evict = None):
+
+        # STEP 1: Ensure `max_items` (if any) is a positive `int`
+        if (max_items is not None):
+            if ((not isinstance(max_items, int)) or isinstance(max_items, bool)):
+                raise TypeError("`max_items` must be of TYPE `int` or `None`")
+            elif (max_items < 1):
+                raise ValueError("`max_items` must be at LEAST 1")
+
+        # STEP 2: Ensure `max_weight` (if any) is a positive number
+        if (max_weight is not None):
+            LRUCache.__check_weight(max_weight, "max_weight")
+
+        # STEP 3: Ensure `on_evict` (if any) is a function
+        if ((on_evict is not None) and (not callable(on_evict))):
+            raise TypeError("`on_evict` must be of TYPE 'function' or `None`")
+
+        # STEP 4: Assign class attributes
+        self._max_items = max_items
+        self._max_weight = max_weight
+        self._on_evict = on_evict
+        self._index = {}
+        self._head = None
+        self._tail = None
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def __check_weight(weight, name):
+        """
+        CHECKS a `weight` (or weight limit) called `name` is a positive
+        NUMBER, as a `bool`, zero, negative or NaN weight would corrupt the
+        running total.
+        """
+        if ((not isinstance(weight, (int, float))) or isinstance(weight, bool)):
+            raise TypeError("`{}` must be a NUMBER".format(name))
+        elif (not (weight > 0)):
+            raise ValueError("`{}` must be GREATER than 0".format(name))
+
+    @property
+    def max_items(self):
+        """
+        The MAXIMUM number of entries, or `None` if unlimited.
+        """
+        return self._max_items
+
+    @property
+    def max_weight(self):
+        """
+        The MAXIMUM total weight of all entries, or `None` if unlimited.
+        """
+        return self._max_weight
+
+    @property
+    def head(self):
+        """
+        The MOST recently used node in the cache.
+        """
+        return self._head
+
+    @property
+    def tail(self):
+        """
+        The LEAST recently used node in the cache (i.e. next to be evicted).
+        """
+        return self._tail
+
+    @property
+    def weight(self):
+        """
+        The TOTAL weight of all entries in the cache.
+        """
+        return self._weight
+
+    @property
+    def hits(self):
+        """
+        The number of `get` calls that FOUND their key.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of `get` calls that did NOT find their key.
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        The number of entries EVICTED to keep the cache within it's limits.
+        """
+        return self._evictions
+
+    def __len__(self):
+        """
+        RETRIEVES the number of entries in the cache.
+        """
+        return len(self._index)
+
+    def __contains__(self, key):
+        """
+        CHECKS if `key` is cached, WITHOUT updating it's recency.
+        """
+        return (key in self._index)
+
+    def __iter__(self):
+        """
+        YIELDS every cached key from the MOST to the LEAST recently used.
+        """
+        curr = self._head
+        while (curr != None):
+            yield curr.key
+            curr = curr.next
+
+    def __unlink(self, node):
+        """
+        UNLINKS `node` from the recency list in O(1).
+        """
+        if (node.prev != None):
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if (node.next != None):
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+        node.next = node.prev = None
+
+    def __link_head(self, node):
+        """
+        LINKS `node` as the MOST recently used node in O(1).
+        """
+        node.next = self._head
+        if (self._head != None):
+            self._head.prev = node
+        else:
+            self._tail = node
+        self._head = node
+
+    def __over_limit(self):
+        """
+        CHECKS if the cache is over EITHER of it's size limits.
+        """
+        return (((self._max_items is not None) and (len(self._index) > self._max_items))
+                or ((self._max_weight is not None) and (self._weight > self._max_weight)))
+
+    def get(self, key, default = None):
+        """
+        RETRIEVES the value cached under `key` & marks it MOST recently used.
+
+        :Parameters:
+            - `key`: the KEY to look up
+            - `default` (optional): the value returned on a MISS
+
+        :Return:
+            - The cached VALUE, OR
+            - `default`: if `key` is NOT cached
+        """
+
+        # CASE A: Cache MISS
+        node = self._index.get(key)
+        if (node is None):
+            self._misses += 1
+            return default
+
+        # CASE B: Cache HIT, move the entry to the FRONT
+        self._hits += 1
+        if (node is not self._head):
+            self.__unlink(node)
+            self.__link_head(node)
+        return node.value
+
+    def put(self, key, value, weight = 1):
+        """
+        CACHES `value` under `key` as the MOST recently used entry, evicting
+        the LEAST recently used entries while over either size limit.
+
+        :Parameters:
+            - `key`: the KEY to cache the value under
+            - `value`: the VALUE to be cached
+            - `weight` (optional): the WEIGHT of the entry (default 1)
+
+        :Return:
+            A POINTER to the cache node holding `value`
+        """
+
+        # STEP 1: Ensure `weight` is positive & the entry could ever FIT
+        LRUCache.__check_weight(weight, "weight")
+        if ((self._max_weight is not None) and (weight > self._max_weight)):
+            raise ValueError("`weight` must NOT exceed `max_weight`")
+
+        # CASE A: `key` is already cached, update it in place
+        node = self._index.get(key)
+        if (node != None):
+            self._weight += weight - node.weight
+            node.value = value
+            node.weight = weight
+            if (node is not self._head):
+                self.__unlink(node)
+                self.__link_head(node)
+
+        # CASE B: `key` is NEW, add it at the FRONT
+        else:
+            node = LRUCache.Node(key, value, weight)
+            self._index[key] = node
+            self._weight += weight
+            self.__link_head(node)
+
+        # STEP 2: Evict from the BACK until within both limits
+        while (self.__over_limit()):
+            self.evict()
+        return node
+
+    def move_to_front(self, key):
+        """
+        MARKS `key` as the MOST recently used entry, without counting a hit.
+
+        :Parameters:
+            - `key`: the KEY to be moved
+
+        :Return:
+            - `True`: if `key` was cached, OR
+            - `False`: if `key` is NOT cached
+        """
+        node = self._index.get(key)
+        if (node is None):
+            return False
+        if (node is not self._head):
+            self.__unlink(node)
+            self.__link_head(node)
+        return True
+
+    def delete(self, key):
+        """
+        REMOVES `key` from the cache, WITHOUT calling `on_evict`.
+
+        :Parameters:
+            - `key`: the KEY to be removed
+
+        :Return:
+            - The removed VALUE, OR
+            - `None`: if `key` is NOT cached
+        """
+        node = self._index.pop(key, None)
+        if (node is None):
+            return None
+        self.__unlink(node)
+        self._weight -= node.weight
+        return node.value
+
+    def evict(self):
+        """
+        EVICTS the LEAST recently used entry & passes it to `on_evict`.
+
+        :Return:
+            - The evicted `(key, value)` PAIR, OR
+            - `None`: if the cache is EMPTY
+        """
+
+        # STEP 1: Check if the cache is empty
+        node = self._tail
+        if (node is None):
+            return None
+
+        # STEP 2: Remove the entry from both the list & the index
+        self.__unlink(node)
+        del self._index[node.key]
+        self._weight -= node.weight
+        self._evictions += 1
+
+        # STEP 3: Notify the eviction callback
+        if (self._on_evict is not None):
+            self._on_evict(node.key, node.value)
+        return (node.key, node.value)
@@ -0,0 +1,96 @@
+# @file     test_lfu_cache.py
+# @brief    A file for testing the least-frequently used (LFU) cache
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from lfu_cache import LFUCache
+
+# ---------------------------------------------------------------------------- #
+
+def test_rejects_bad_parameters():
+    with pytest.raises(TypeError):
+        LFUCache(2.0)
+    with pytest.raises(ValueError):
+        LFUCache(0)
+    with pytest.raises(ValueError):
+        LFUCache(2, aging_interval = 0)
+    with pytest.raises(TypeError):
+        LFUCache(2, on_evict = 1)
+
+def test_evicts_least_frequently_used():
+    evicted = []
+    cache = LFUCache(2, on_evict = lambda k, v: evicted.append(k))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert evicted == ["b"]
+    assert (cache.frequency("a"), cache.frequency("c")) == (2, 1)
+    assert cache.get("b", "miss") == "miss"
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    assert cache.hit_ratio == 0.5
+
+def test_matches_a_reference_model():
+    rng = random.Random(0)
+    cache = LFUCache(8)
+    model = {}
+    clock = 0
+    for _ in range(5000):
+        key = rng.randrange(20)
+        clock += 1
+
+        # NOTE: an entry joins the BACK of it's bucket on every access, so
+        #       ties are broken by the time of the LAST access
+        if (rng.random() < 0.5):
+            value = cache.get(key)
+            if (key in model):
+                freq, _, stored = model[key]
+                model[key] = (freq + 1, clock, stored)
+                assert value == stored
+            else:
+                assert value is None
+        else:
+            if (key in model):
+                model[key] = (model[key][0] + 1, clock, clock)
+            else:
+                if (len(model) == 8):
+                    victim = min(model, key = lambda k: model[k][:2])
+                    assert cache.evict() == (victim, model.pop(victim)[2])
+                model[key] = (1, clock, clock)
+            cache.put(key, clock)
+        assert list(cache) == sorted(model, key = lambda k: model[k][:2])
+    assert all(cache.frequency(k) == model[k][0] for k in model)
+
+def test_aging_halves_frequencies():
+    cache = LFUCache(4, aging_interval = 10)
+    cache.put("hot", 0)
+    for _ in range(7):
+        cache.get("hot")
+    cache.put("cold", 0)
+    assert cache.frequency("hot") == 8
+    cache.get("cold")
+    assert (cache.frequency("hot"), cache.frequency("cold")) == (4, 1)
+
+def test_age_merges_buckets_oldest_first():
+    cache = LFUCache(4)
+    cache.put("a", 0)
+    cache.put("b", 0)
+    cache.get("b")
+    cache.age()
+    assert list(cache) == ["a", "b"]
+    assert (cache.frequency("a"), cache.frequency("b")) == (1, 1)
+    assert (cache.head.next is None)
+
+def test_delete_skips_on_evict():
+    evicted = []
+    cache = LFUCache(2, on_evict = lambda k, v: evicted.append(k))
+    cache.put("a", 1)
+    assert cache.delete("a") == 1
+    assert cache.delete("a") is None
+    assert (len(cache), cache.head, cache.evict()) == (0, None, None)
+    assert evicted == []
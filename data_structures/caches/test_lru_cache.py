@@ -0,0 +1,63 @@
+# @file     test_lru_cache.py
+# @brief    A file for testing the least recently used (LRU) cache
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import pytest
+
+from lru_cache import LRUCache
+
+# ---------------------------------------------------------------------------- #
+
+def test_evicts_least_recently_used():
+    evicted = []
+    cache = LRUCache(max_items = 2, on_evict = lambda k, v: evicted.append(k))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert evicted == ["b"]
+    assert list(cache) == ["c", "a"]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 0, 1)
+
+def test_evicts_by_weight():
+    cache = LRUCache(max_weight = 10)
+    cache.put("a", 1, weight = 4)
+    cache.put("b", 2, weight = 4)
+    cache.put("a", 1, weight = 6)
+    assert cache.weight == 10
+    cache.put("c", 3, weight = 2.5)
+    assert list(cache) == ["c", "a"]
+    assert cache.weight == 8.5
+
+@pytest.mark.parametrize("max_items", [2.5, True, "3"])
+def test_max_items_rejects_non_int(max_items):
+    with pytest.raises(TypeError):
+        LRUCache(max_items = max_items)
+
+@pytest.mark.parametrize("max_items", [0, -1])
+def test_max_items_rejects_non_positive(max_items):
+    with pytest.raises(ValueError):
+        LRUCache(max_items = max_items)
+
+@pytest.mark.parametrize("max_weight, error", [
+    (True, TypeError), ("1", TypeError),
+    (0, ValueError), (-2.0, ValueError), (float("nan"), ValueError)])
+def test_max_weight_rejects_invalid(max_weight, error):
+    with pytest.raises(error):
+        LRUCache(max_weight = max_weight)
+
+@pytest.mark.parametrize("weight, error", [
+    (None, TypeError), ("2", TypeError), (False, TypeError),
+    (0, ValueError), (-1, ValueError), (float("nan"), ValueError)])
+def test_put_rejects_invalid_weight(weight, error):
+    cache = LRUCache(max_weight = 10)
+    with pytest.raises(error):
+        cache.put("a", 1, weight = weight)
+    assert (len(cache), cache.weight) == (0, 0)
+
+def test_put_rejects_weight_over_limit():
+    cache = LRUCache(max_weight = 10)
+    with pytest.raises(ValueError):
+        cache.put("a", 1, weight = 11)
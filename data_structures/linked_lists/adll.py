@@ -0,0 +1,660 @@
+# @file     adll.py
+# @brief    A file for implementing an array-backed doubly linked-list (ADLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from array import array
+from enum import Enum
+
+# ---------------------------------------------------------------------------- #
+
+class ADLL(object):
+    """
+    An INTERFACE for an array-backed doubly linked-list (ADLL). Instead of a
+    `Node` object per key, the keys & the `next`/`prev` links are kept in 3
+    PARALLEL buffers & a node is just an `int` CURSOR into them, so millions
+    of keys cost the garbage collector a handful of objects. Deleted slots
+    are chained into a FREE list & reused by later insertions.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    # The cursor value standing in for a `None` link
+    NIL = -1
+
+    def __init__(self, cmp_fn, typecode = None):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Ensure `typecode` (if any) is an `array` typecode
+        if ((typecode is not None) and (not isinstance(typecode, str))):
+            raise TypeError("`typecode` must be of TYPE `str` or `None`")
+        elif ((typecode is not None) and (typecode not in "bBhHiIlLqQfd")):
+            raise ValueError("`typecode` must be an `array` typecode")
+
+        # STEP 3: Assign class attributes, keys are held in a typed `array`
+        #         if there is a `typecode` & a `list` otherwise
+        self._cmp_fn = cmp_fn
+        self._typecode = typecode
+        self._keys = [] if (typecode is None) else array(typecode)
+        self._next = array('q')
+        self._prev = array('q')
+        self._free = ADLL.NIL
+        self._head = ADLL.NIL
+        self._tail = ADLL.NIL
+        self._size = 0
+        self._finger = None
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING ADLL keys.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`
+            - `0`: if `v1` & `v2` are EQUAL
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @cmp_fn.setter
+    def cmp_fn(self, new_cmp_fn):
+
+        # STEP 1: Ensure `new_cmp_fn` is of type 'function'
+        if (not callable(new_cmp_fn)):
+            raise TypeError("`new_cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign the new comparison function
+        self._cmp_fn = new_cmp_fn
+
+    @cmp_fn.deleter
+    def cmp_fn(self):
+        del self._cmp_fn
+
+    @property
+    def typecode(self):
+        """
+        The `array` typecode of the key buffer, or `None` if keys are held in
+        a `list` (i.e. may be ANY object).
+        """
+        return self._typecode
+
+    @property
+    def capacity(self):
+        """
+        The number of SLOTS allocated, whether in use or on the free list.
+        """
+        return len(self._next)
+
+    @property
+    def head(self):
+        """
+        The cursor of the FIRST node in the ADLL, or `None` if empty.
+        """
+        return None if (self._head == ADLL.NIL) else self._head
+
+    @property
+    def tail(self):
+        """
+        The cursor of the LAST node in the ADLL, or `None` if empty.
+        """
+        return None if (self._tail == ADLL.NIL) else self._tail
+
+    def key(self, cursor):
+        """
+        RETRIEVES the key of the node at `cursor`.
+        """
+        return self._keys[cursor]
+
+    def next(self, cursor):
+        """
+        RETRIEVES the cursor of the successor of the node at `cursor`, or
+        `None` if it is the TAIL.
+        """
+        nxt = self._next[cursor]
+        return None if (nxt == ADLL.NIL) else nxt
+
+    def prev(self, cursor):
+        """
+        RETRIEVES the cursor of the predecessor of the node at `cursor`, or
+        `None` if it is the HEAD.
+        """
+        prv = self._prev[cursor]
+        return None if (prv == ADLL.NIL) else prv
+
+    def is_empty(self):
+        """
+        CHECKS if the ADLL is empty.
+
+        :Return:
+            - `True`: if the ADLL is empty
+            - `False`: if the ADLL is NOT empty
+        """
+        return (self._head == ADLL.NIL)
+
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the ADLL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS the key of every ADLL node from the HEAD to the TAIL.
+        """
+        keys, nxt = self._keys, self._next
+        curr = self._head
+        while (curr != ADLL.NIL):
+            yield keys[curr]
+            curr = nxt[curr]
+
+    def __reversed__(self):
+        """
+        YIELDS the key of every ADLL node from the TAIL to the HEAD.
+        """
+        keys, prv = self._keys, self._prev
+        curr = self._tail
+        while (curr != ADLL.NIL):
+            yield keys[curr]
+            curr = prv[curr]
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any ADLL node's key MATCHES `target_key` via `cmp_fn`.
+        """
+        return (self.search(target_key) != None)
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the key of the ADLL node at index `i`. Walks start from the
+        CLOSEST of the HEAD, the TAIL, or a cached "finger" cursor, so
+        SEQUENTIAL indexing (in either direction) is O(1) amortized.
+
+        :Parameters:
+            - `i`: an `int` index (negative counts from the TAIL), or a `slice`
+
+        :Return:
+            - The KEY at index `i`, OR
+            - A `list` of keys: if `i` is a `slice`
+        """
+
+        # CASE A: `i` is a `slice`, walk the ADLL just ONCE
+        if (isinstance(i, slice)):
+            keys = list(self)
+            return keys[i]
+
+        # CASE B: `i` is an INAPPROPRIATE type
+        elif (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int` or `slice`")
+
+        # STEP 1: Ensure `i` is within the ADLL
+        if (i < 0):
+            i += self._size
+        if ((i < 0) or (i >= self._size)):
+            raise IndexError("ADLL index out of range")
+
+        # STEP 2: Pick the CLOSEST starting point to `i`
+        index, curr = 0, self._head
+        if ((self._size - 1 - i) < i):
+            index, curr = self._size - 1, self._tail
+        if ((self._finger != None)
+            and (abs(self._finger[0] - i) < abs(index - i))):
+            index, curr = self._finger
+
+        # STEP 3: Walk FORWARDS or BACKWARDS to `i`
+        while (index < i):
+            curr = self._next[curr]
+            index += 1
+        while (index > i):
+            curr = self._prev[curr]
+            index -= 1
+
+        # STEP 4: Remember where the walk ended for the next lookup
+        self._finger = (index, curr)
+        return self._keys[curr]
+
+    def __new_slot(self, new_key):
+        """
+        ALLOCATES a slot holding `new_key`, popped from the free list if
+        possible & appended to the buffers otherwise.
+
+        :Return:
+            The CURSOR of the slot, with NO links
+        """
+
+        # CASE A: Reuse a freed slot
+        slot = self._free
+        if (slot != ADLL.NIL):
+            self._free = self._next[slot]
+            self._keys[slot] = new_key
+            self._next[slot] = ADLL.NIL
+            return slot
+
+        # CASE B: Grow every buffer by one slot
+        self._keys.append(new_key)
+        self._next.append(ADLL.NIL)
+        self._prev.append(ADLL.NIL)
+        return len(self._next) - 1
+
+    def __free_slot(self, slot):
+        """
+        PUSHES a deleted slot onto the free list, which is chained through
+        the `next` buffer.
+        """
+        if (self._typecode is None):
+            self._keys[slot] = None
+        self._prev[slot] = ADLL.NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def insert_head(self, new_key):
+        """
+        INSERTS a new HEAD (i.e. FIRST) node in the ADLL.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new HEAD
+              ADLL node
+
+        :Return:
+            The CURSOR of the newly added ADLL HEAD node
+        """
+
+        # STEP 1: Initialise the new slot's links
+        new_head = self.__new_slot(new_key)
+        self._next[new_head] = self._head
+
+        # CASE A: This is the 1st ADLL node insertion
+        if (self._head == ADLL.NIL):
+            self._tail = new_head
+
+        # CASE B: NOT the 1st ADLL node insertion
+        else:
+            self._prev[self._head] = new_head
+
+        # STEP 2: Adjust the ADLL head cursor
+        self._head = new_head
+
+        # STEP 3: Every index is SHIFTED along by one, including the finger's
+        self._size += 1
+        if (self._finger != None):
+            self._finger = (self._finger[0] + 1, self._finger[1])
+        return new_head
+
+    def insert_tail(self, new_key):
+        """
+        INSERTS a new TAIL (i.e. END) node in the ADLL.
+
+        :Parameters:
+            - `new_key`: is the INFORMATION to be associated with the new
+              TAIL ADLL node
+
+        :Return:
+            The CURSOR of the NEWLY added ADLL TAIL node
+        """
+
+        # STEP 1: Initialise the new slot's links
+        new_tail = self.__new_slot(new_key)
+        self._prev[new_tail] = self._tail
+
+        # CASE A: This is the 1st ADLL node insertion
+        if (self._tail == ADLL.NIL):
+            self._head = new_tail
+
+        # CASE B: NOT the 1st ADLL node insertion
+        else:
+            self._next[self._tail] = new_tail
+
+        # STEP 2: Return the NEWLY added ADLL TAIL node
+        self._tail = new_tail
+        self._size += 1
+        return new_tail
+
+    def extend(self, iterable):
+        """
+        INSERTS a new TAIL node for every key in `iterable`.
+
+        :Parameters:
+            - `iterable`: the KEYS to be appended, in order
+
+        :Return:
+            The CURSOR of the ADLL TAIL node (`None` if still empty)
+        """
+        for new_key in iterable:
+            self.insert_tail(new_key)
+        return self.tail
+
+    def delete_head(self):
+        """
+        DELETES the HEAD (i.e. FIRST) node of the ADLL.
+
+        :Return:
+            - The CURSOR of the new ADLL HEAD node, OR
+            - `None`: if the ADLL has NO nodes to delete
+        """
+
+        # STEP 1: Check if the ADLL is empty
+        if (self._head == ADLL.NIL):
+            return None
+
+        # STEP 2: Advance the head cursor
+        old_head = self._head
+        self._head = self._next[old_head]
+
+        # CASE A: The only ADLL node got deleted
+        if (self._head == ADLL.NIL):
+            self._tail = ADLL.NIL
+
+        # CASE B: At LEAST 2 ADLL nodes remaining
+        else:
+            self._prev[self._head] = ADLL.NIL
+
+        # STEP 3: Free the deleted slot, every index SHIFTS back by one & the
+        #         finger may be deleted
+        self.__free_slot(old_head)
+        self._size -= 1
+        if (self._finger != None):
+            index, curr = self._finger
+            self._finger = (index - 1, curr) if (index > 0) else None
+
+        # STEP 4: Return the new ADLL HEAD node
+        return self.head
+
+    def delete_tail(self):
+        """
+        DELETES the TAIL (i.e. END) node of the ADLL.
+
+        :Return:
+            - The CURSOR of the new ADLL TAIL node, OR
+            - `None`: if the ADLL has NO nodes to delete
+        """
+
+        # STEP 1: Check if the ADLL is empty
+        if (self._tail == ADLL.NIL):
+            return None
+
+        # STEP 2: Retreat the tail cursor
+        old_tail = self._tail
+        self._tail = self._prev[old_tail]
+
+        # CASE A: The only ADLL node got deleted
+        if (self._tail == ADLL.NIL):
+            self._head = ADLL.NIL
+
+        # CASE B: At LEAST 2 ADLL nodes remaining
+        else:
+            self._next[self._tail] = ADLL.NIL
+
+        # STEP 3: Free the deleted slot & discard the finger if it was at it
+        self.__free_slot(old_tail)
+        self._size -= 1
+        if ((self._finger != None) and (self._finger[0] >= self._size)):
+            self._finger = None
+
+        # STEP 4: Return the new ADLL TAIL node
+        return self.tail
+
+    def __iterative_search(self, target_key):
+        """
+        ITERATIVELY searches the ADLL & returns a cursor whose key MATCHES the
+        target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ADLL
+
+        :Return:
+            - The CURSOR of the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # STEP 1: Linear search the ADLL up to the TAIL node
+        keys, nxt = self._keys, self._next
+        curr = self._head
+        while (curr != ADLL.NIL):
+
+            # STEP 2: Check if a MATCH was detected
+            if (self.cmp_fn(keys[curr], target_key) == ADLL.CMPValues.EQUAL.value):
+                return curr
+
+            # STEP 3: NO match detected, move to the next node
+            curr = nxt[curr]
+
+        # STEP 4: Indicate that NO matches were detected
+        return None
+
+    def __recursive_search(self, target_key, curr):
+        """
+        RECURSIVELY searches the ADLL & returns a cursor whose key MATCHES the
+        target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ADLL
+            - `curr`: is the cursor of the CURRENT node (i.e. initially HEAD)
+
+        :Return:
+            - The CURSOR of the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # BASE CASE 1: Went beyond the TAIL node OR ZERO nodes remain
+        if (curr == ADLL.NIL):
+            return None
+
+        # BASE CASE 2: Found a match
+        if (self.cmp_fn(self._keys[curr], target_key) == ADLL.CMPValues.EQUAL.value):
+            return curr
+
+        # RECURSIVE CASE: Still more ADLL nodes to search
+        return self.__recursive_search(target_key, self._next[curr])
+
+    def search(self, target_key, mode = 'i'):
+        """
+        SEARCHES the ADLL & returns the 1st instance of an ADLL node who's key
+        MATCHES the target search key.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ADLL
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the ADLL search is conducted iteratively 'i' (default), or
+              recursively 'r'
+
+        :Return:
+            - The CURSOR of the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE search method
+        elif (mode == 'i'):
+            return self.__iterative_search(target_key)
+
+        # CASE C: Use the RECURSIVE search method
+        elif (mode == 'r'):
+            return self.__recursive_search(target_key, self._head)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+    def __iterative_reverse(self):
+        """
+        ITERATIVELY reverses the node ORDER in an ADLL.
+        """
+
+        # STEP 1: Swap the head & tail cursors
+        nxt, prv = self._next, self._prev
+        curr = self._head
+        self._head, self._tail = self._tail, self._head
+
+        # STEP 2: Swap the links of every node up to the ORIGINAL TAIL
+        while (curr != ADLL.NIL):
+            following = nxt[curr]
+            nxt[curr], prv[curr] = prv[curr], following
+            curr = following
+
+    def __recursive_reverse(self, curr):
+        """
+        RECURSIVELY reverses the node ORDER in an ADLL.
+
+        :Parameters:
+            - `curr`: is the cursor of the CURRENT node (i.e. initially HEAD)
+        """
+
+        # BASE CASE: Went beyond the ORIGINAL TAIL node
+        if (curr == ADLL.NIL):
+            self._head, self._tail = self._tail, self._head
+            return
+
+        # RECURSIVE CASE: Swap the current node's links & move along
+        following = self._next[curr]
+        self._next[curr], self._prev[curr] = self._prev[curr], following
+        self.__recursive_reverse(following)
+
+    def reverse(self, mode = 'i'):
+        """
+        REVERSES the node order of the ADLL.
+
+        :Parameters:
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the ADLL node reversal is conducted iteratively 'i' (default),
+              or recursively 'r'
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE reverse method
+        elif (mode == 'i'):
+            self.__iterative_reverse()
+
+        # CASE C: Use the RECURSIVE reverse method
+        elif (mode == 'r'):
+            self.__recursive_reverse(self._head)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+        # STEP 2: The finger's node now sits at the MIRRORED index
+        if (self._finger != None):
+            index, curr = self._finger
+            self._finger = (self._size - 1 - index, curr)
+
+    def __merge_runs(self, left, right, cmp_fn):
+        """
+        MERGES two sorted, `NIL` terminated chains of cursors by relinking
+        the `next` buffer. Ties are taken from `left` first, which keeps the
+        merge STABLE.
+
+        :Return:
+            A `tuple` of the HEAD & TAIL cursors of the merged chain
+        """
+        keys, nxt = self._keys, self._next
+        less = ADLL.CMPValues.LESS.value
+
+        # CASE A: At least one of the chains is empty
+        if ((left == ADLL.NIL) or (right == ADLL.NIL)):
+            head = left if (left != ADLL.NIL) else right
+            tail = head
+            while ((tail != ADLL.NIL) and (nxt[tail] != ADLL.NIL)):
+                tail = nxt[tail]
+            return (head, tail)
+
+        # STEP 1: Pick the merged HEAD
+        if (cmp_fn(keys[right], keys[left]) == less):
+            head, right = right, nxt[right]
+        else:
+            head, left = left, nxt[left]
+        tail = head
+
+        # STEP 2: Repeatedly append the SMALLER front node of the 2 chains
+        while ((left != ADLL.NIL) and (right != ADLL.NIL)):
+            if (cmp_fn(keys[right], keys[left]) == less):
+                nxt[tail] = right
+                tail, right = right, nxt[right]
+            else:
+                nxt[tail] = left
+                tail, left = left, nxt[left]
+
+        # STEP 3: Append whichever chain still has nodes & find the new TAIL
+        nxt[tail] = left if (left != ADLL.NIL) else right
+        while (nxt[tail] != ADLL.NIL):
+            tail = nxt[tail]
+        return (head, tail)
+
+    def __split_run(self, start, width):
+        """
+        CUTS the chain of cursors beginning at `start` after `width` nodes.
+
+        :Return:
+            The cursor of the 1st node AFTER the cut, or `NIL` if none
+        """
+        nxt = self._next
+        while ((start != ADLL.NIL) and (width > 1)):
+            start = nxt[start]
+            width -= 1
+        if (start == ADLL.NIL):
+            return ADLL.NIL
+        rest = nxt[start]
+        nxt[start] = ADLL.NIL
+        return rest
+
+    def sort(self, cmp_fn = None):
+        """
+        SORTS the ADLL in place with a STABLE, bottom-up merge sort in
+        O(n log n) time. Only the link buffers are rewritten, the keys never
+        move & NO recursion is used.
+
+        :Parameters:
+            - `cmp_fn` (optional): the function for COMPARING keys,
+              defaulting to the ADLL's own `cmp_fn`
+        """
+
+        # STEP 1: Ensure `cmp_fn` (if any) is a function
+        if (cmp_fn is None):
+            cmp_fn = self.cmp_fn
+        elif (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Merge adjacent runs of `width` nodes, doubling each pass
+        head, tail = self._head, self._tail
+        width = 1
+        while (width < self._size):
+            curr, head, tail = head, ADLL.NIL, ADLL.NIL
+            while (curr != ADLL.NIL):
+                left = curr
+                right = self.__split_run(left, width)
+                curr = self.__split_run(right, width)
+                run_head, run_tail = self.__merge_runs(left, right, cmp_fn)
+                if (tail == ADLL.NIL):
+                    head = run_head
+                else:
+                    self._next[tail] = run_head
+                tail = run_tail
+            width *= 2
+
+        # STEP 3: Restore the `prev` buffer & discard the finger
+        self._head, self._tail = head, tail
+        prv, curr = ADLL.NIL, head
+        while (curr != ADLL.NIL):
+            self._prev[curr] = prv
+            prv, curr = curr, self._next[curr]
+        self._finger = None
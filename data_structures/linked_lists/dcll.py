@@ -0,0 +1,441 @@
+# @file     dcll.py
+# @brief    A file for implementing a doubly circular linked-list (DCLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from enum import Enum
+
+from node_pool import check_pool, node_allocator
+
+# ---------------------------------------------------------------------------- #
+
+class DCLL(object):
+    """
+    An INTERFACE for a doubly circular linked-list (DCLL), where the TAIL
+    node links back to the HEAD & vice versa. Only the HEAD (i.e. the CURRENT
+    node of a round-robin) is stored, the TAIL is always `head.prev`, so
+    moving the current node either way is a single POINTER write.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    class Node(object):
+        """
+        A Doubly Circular Linked-List (DCLL) node.
+        """
+
+        def __init__(self, key):
+            self._key = key
+            self._next = None
+            self._prev = None
+
+        @property
+        def key(self):
+            """
+            Contains the DATA associated with an DCLL node.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def next(self):
+            """
+            A POINTER to an DCLL successor node (NEVER `None` while linked).
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of TYPE `DCLL.Node` or `None`
+            if (isinstance(new_next, DCLL.Node) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `DCLL.Node` or `None`")
+
+        @next.deleter
+        def next(self):
+            del self._next
+
+        @property
+        def prev(self):
+            """
+            A POINTER to a DCLL predecessor node (NEVER `None` while linked).
+            """
+            return self._prev
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # STEP 1: Ensure the `new_prev` is type `DCLL.Node` or `None`
+            if (isinstance(new_prev, DCLL.Node) or (new_prev is None)):
+                self._prev = new_prev
+                return
+
+            # STEP 2: `new_prev` is an INAPPROPRIATE type
+            raise TypeError("`new_prev` must be of TYPE `DCLL.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, cmp_fn, pool = None):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Assign class attributes
+        self._cmp_fn = cmp_fn
+        self._pool = pool
+        self.__new_node = node_allocator(DCLL.Node, pool)
+        self._head = None
+        self._size = 0
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING `DCLL.Node` keys.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`
+            - `0`: if `v1` & `v2` are EQUAL
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @cmp_fn.setter
+    def cmp_fn(self, new_cmp_fn):
+
+        # STEP 1: Ensure `new_cmp_fn` is of type 'function'
+        if (not callable(new_cmp_fn)):
+            raise TypeError("`new_cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign the new comparison function
+        self._cmp_fn = new_cmp_fn
+
+    @cmp_fn.deleter
+    def cmp_fn(self):
+        del self._cmp_fn
+
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @property
+    def head(self):
+        """
+        The FIRST (i.e. CURRENT) node in the DCLL.
+        """
+        return self._head
+
+    @property
+    def current(self):
+        """
+        The CURRENT node of the round-robin, an alias of `head`.
+        """
+        return self.head
+
+    @property
+    def tail(self):
+        """
+        The LAST node in the DCLL, i.e. the node BEFORE the current node.
+        """
+        return None if (self._head is None) else self._head.prev
+
+    def is_empty(self):
+        """
+        CHECKS if the DCLL is empty.
+
+        :Return:
+            - `True`: if the DCLL is empty
+            - `False`: if the DCLL is NOT empty
+        """
+        return (self._head is None)
+
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the DCLL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS the key of every DCLL node for ONE lap, from the HEAD to the
+        TAIL.
+        """
+        curr = self.head
+        for _ in range(self._size):
+            yield curr.key
+            curr = curr.next
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any DCLL node's key MATCHES `target_key` via `cmp_fn`.
+        """
+        return (self.search(target_key) != None)
+
+    def __link_before(self, node, new_key):
+        """
+        LINKS a new node holding `new_key` directly BEFORE `node` in O(1), or
+        as the ONLY node if `node` is `None`.
+
+        :Return:
+            A POINTER to the newly added DCLL node
+        """
+
+        # STEP 1: Initialise the new node
+        new_node = self.__new_node(new_key)
+
+        # CASE A: 1st insertion, the node links to itself both ways
+        if (node is None):
+            new_node.next = new_node.prev = new_node
+            self._head = new_node
+
+        # CASE B: NOT the 1st insertion, link it between `node.prev` & `node`
+        else:
+            new_node.prev = node.prev
+            new_node.next = node
+            node.prev.next = new_node
+            node.prev = new_node
+        self._size += 1
+        return new_node
+
+    def insert_tail(self, new_key):
+        """
+        INSERTS a new TAIL node in O(1), i.e. directly BEFORE the current
+        node, so it is visited LAST in the current lap.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new TAIL
+              DCLL node
+
+        :Return:
+            A POINTER to the newly added DCLL TAIL node
+        """
+        return self.__link_before(self._head, new_key)
+
+    def insert_head(self, new_key):
+        """
+        INSERTS a new HEAD node in O(1), which becomes the CURRENT node.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new HEAD
+              DCLL node
+
+        :Return:
+            A POINTER to the newly added DCLL HEAD node
+        """
+        self._head = self.__link_before(self._head, new_key)
+        return self._head
+
+    def remove(self, node):
+        """
+        DELETES any `node` of the DCLL in O(1). If it is the CURRENT node,
+        it's successor becomes the current node.
+
+        :Parameters:
+            - `node`: the DCLL node to be deleted, which must be in this DCLL
+
+        :Return:
+            - A POINTER to the current node, OR
+            - `None`: if the DCLL has NO nodes left
+        """
+
+        # STEP 1: Ensure `node` is a `DCLL.Node`
+        if (not isinstance(node, DCLL.Node)):
+            raise TypeError("`node` must be of TYPE `DCLL.Node`")
+
+        # CASE A: The only DCLL node got deleted
+        if (node.next is node):
+            self._head = None
+
+        # CASE B: At LEAST 2 DCLL nodes remaining, bypass the node
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            if (node is self._head):
+                self._head = node.next
+
+        # STEP 2: Recycle the deleted node & return the current node
+        node.next = node.prev = None
+        self._size -= 1
+        if (self._pool is not None):
+            self._pool.release(node)
+        return self._head
+
+    def remove_current(self):
+        """
+        DELETES the CURRENT (i.e. HEAD) node in O(1), making it's successor
+        the current node.
+
+        :Return:
+            - A POINTER to the new current node, OR
+            - `None`: if the DCLL has NO nodes left
+        """
+        if (self._head is None):
+            return None
+        return self.remove(self._head)
+
+    def rotate(self, k = 1):
+        """
+        MOVES the current node `k` places along the DCLL, forwards if `k` is
+        positive & backwards if NEGATIVE. Whichever direction is shorter is
+        walked, so this is O(min(k mod n, n - k mod n)).
+
+        :Parameters:
+            - `k` (optional): the number of places to advance (default 1)
+
+        :Return:
+            - A POINTER to the new current node, OR
+            - `None`: if the DCLL is empty
+        """
+
+        # STEP 1: Ensure `k` is an `int`
+        if (not isinstance(k, int)):
+            raise TypeError("`k` must be of TYPE `int`")
+
+        # STEP 2: Check if the DCLL is empty
+        if (self._head is None):
+            return None
+
+        # STEP 3: Step the HEAD along the SHORTER way round
+        head = self._head
+        k %= self._size
+        if (k <= self._size - k):
+            for _ in range(k):
+                head = head.next
+        else:
+            for _ in range(self._size - k):
+                head = head.prev
+        self._head = head
+        return head
+
+    def cycle(self):
+        """
+        YIELDS the key of the current node & then advances it, FOREVER (or
+        until the DCLL is emptied). Each step is O(1) with NO tail check.
+
+        The current node advances LAZILY, i.e. when the generator is RESUMED
+        rather than when it yields: after `next(g)` returns a key, `head`
+        STILL points at the node holding that key (also once `g` is
+        abandoned). This lets the consumer call `remove_current` on the
+        yielded node, after which it's successor is yielded next rather
+        than skipped. The generator only advances a node that is STILL
+        current, so a `rotate` between steps is respected too.
+        """
+        while (self._head is not None):
+
+            # STEP 1: Hand out the current node
+            node = self._head
+            yield node.key
+
+            # STEP 2: Advance ONLY if the node is still current
+            if (self._head is node):
+                self._head = node.next
+
+    def __iterative_search(self, target_key):
+        """
+        ITERATIVELY searches one lap of the DCLL & returns a node that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the DCLL
+
+        :Return:
+            - A POINTER to the DCLL node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+        curr = self.head
+        for _ in range(self._size):
+            if (self.cmp_fn(curr.key, target_key) == DCLL.CMPValues.EQUAL.value):
+                return curr
+            curr = curr.next
+        return None
+
+    def __recursive_search(self, target_key, curr, remaining):
+        """
+        RECURSIVELY searches one lap of the DCLL & returns a node that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the DCLL
+            - `curr`: is the CURRENT node being compared
+            - `remaining`: is the number of nodes LEFT in the lap
+
+        :Return:
+            - A POINTER to the DCLL node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # BASE CASE 1: The lap is complete
+        if (remaining == 0):
+            return None
+
+        # BASE CASE 2: Found a match
+        if (self.cmp_fn(curr.key, target_key) == DCLL.CMPValues.EQUAL.value):
+            return curr
+
+        # RECURSIVE CASE: Still more DCLL nodes to search
+        return self.__recursive_search(target_key, curr.next, remaining - 1)
+
+    def search(self, target_key, mode = 'i'):
+        """
+        SEARCHES one lap of the DCLL from the HEAD & returns the 1st DCLL
+        node who's key MATCHES the target search key.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the DCLL
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the DCLL search is conducted iteratively 'i' (default), or
+              recursively 'r'
+
+        :Return:
+            - A POINTER to the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE search method
+        elif (mode == 'i'):
+            return self.__iterative_search(target_key)
+
+        # CASE C: Use the RECURSIVE search method
+        elif (mode == 'r'):
+            return self.__recursive_search(target_key, self.head, self._size)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
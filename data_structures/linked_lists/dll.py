@@ -4,8 +4,11 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
+import weakref
 from enum import Enum
 
+from node_pool import check_pool, node_allocator, release_chain
+
 # ---------------------------------------------------------------------------- #
 
 class DLL(object):
@@ -47,7 +50,7 @@ class DLL(object):
         @key.deleter
         def key(self):
             del self._key
-        
+
         @property
         def next(self):
             """
@@ -92,16 +95,68 @@ class DLL(object):
         def prev(self):
             del self._prev
 
-    def __init__(self, cmp_fn):
+    class WeakNode(Node):
+        """
+        A DLL node whose `prev` POINTER is held as a WEAK reference, so a
+        chain of nodes has NO reference cycles & is freed by reference
+        counting alone, without waiting for the cyclic garbage collector.
+        """
+
+        @property
+        def prev(self):
+            """
+            A POINTER to a DLL predecessor node, held weakly.
+            """
+            return None if (self._prev is None) else self._prev()
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # CASE A: Clear the back-pointer
+            if (new_prev is None):
+                self._prev = None
+
+            # CASE B: Ensure the `new_prev` is type `DLL.Node`
+            elif (isinstance(new_prev, DLL.Node)):
+                self._prev = weakref.ref(new_prev)
+
+            # CASE C: `new_prev` is an INAPPROPRIATE type
+            else:
+                raise TypeError("`new_prev` must be of TYPE `DLL.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, cmp_fn, pool = None, heuristic = None, weak_prev = False):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Ensure `heuristic` (if any) is a known heuristic
+        DLL.__check_heuristic(heuristic)
+
+        # STEP 4: Ensure `weak_prev` is a `bool`
+        if (not isinstance(weak_prev, bool)):
+            raise TypeError("`weak_prev` must be of TYPE `bool`")
+
+        # STEP 5: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self._node_cls = DLL.WeakNode if weak_prev else DLL.Node
+        self.__new_node = node_allocator(self._node_cls, pool)
+        self._heuristic = heuristic
+        self._searches = 0
+        self._probes = 0
+        self._hits = {}
         self._head = None
         self._tail = None
+        self._size = 0
+        self._finger = None
 
     @property
     def cmp_fn(self):
@@ -133,6 +188,89 @@ class DLL(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @property
+    def weak_prev(self):
+        """
+        CHECKS if the DLL nodes hold their `prev` POINTERS weakly (i.e. are
+        of TYPE `DLL.WeakNode`).
+        """
+        return (self._node_cls is DLL.WeakNode)
+
+    @staticmethod
+    def __check_heuristic(heuristic):
+        """
+        RAISES an error if `heuristic` is NOT `None`, 'mtf', 'transpose' or
+        'count'.
+        """
+        if (heuristic is None):
+            return
+        elif (not isinstance(heuristic, str)):
+            raise TypeError("`heuristic` must be of TYPE `str` or `None`")
+        elif (heuristic not in ("mtf", "transpose", "count")):
+            raise ValueError("`heuristic` must be of VALUE 'mtf', 'transpose' "
+                             "or 'count'")
+
+    @property
+    def heuristic(self):
+        """
+        The OPTIONAL self-organizing heuristic applied on every search hit:
+            - `None`: the node order is NEVER changed by a search
+            - 'mtf': the found node is MOVED to the front
+            - 'transpose': the found node is SWAPPED with it's predecessor
+            - 'count': nodes are kept in DESCENDING order of search hits
+        """
+        return self._heuristic
+
+    @heuristic.setter
+    def heuristic(self, new_heuristic):
+
+        # STEP 1: Ensure `new_heuristic` is a known heuristic
+        DLL.__check_heuristic(new_heuristic)
+
+        # STEP 2: Assign the new heuristic, search hits are only kept while
+        #         it is 'count'
+        self._heuristic = new_heuristic
+        if (new_heuristic != "count"):
+            self._hits.clear()
+
+    @property
+    def searches(self):
+        """
+        The number of `search` calls since the last `reset_counters`.
+        """
+        return self._searches
+
+    @property
+    def probes(self):
+        """
+        The number of node keys COMPARED by `search` since the last
+        `reset_counters`, i.e. the total ACCESS cost.
+        """
+        return self._probes
+
+    @property
+    def mean_probes(self):
+        """
+        The MEAN access cost (i.e. `probes` per search), or 0 if there were
+        NO searches.
+        """
+        return (self._probes / self._searches) if self._searches else 0.0
+
+    def reset_counters(self):
+        """
+        RESETS the `searches` & `probes` access-cost counters to 0.
+        """
+        self._searches = 0
+        self._probes = 0
+
     @property
     def head(self):
         """
@@ -187,6 +325,92 @@ class DLL(object):
         """
         return ((self.head == None) and (self.tail == None))
 
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the DLL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS the key of every DLL node from the HEAD to the TAIL.
+        """
+        curr = self.head
+        while (curr != None):
+            yield curr.key
+            curr = curr.next
+
+    def __reversed__(self):
+        """
+        YIELDS the key of every DLL node from the TAIL to the HEAD.
+        """
+        curr = self.tail
+        while (curr != None):
+            yield curr.key
+            curr = curr.prev
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any DLL node's key MATCHES `target_key` via `cmp_fn`. Unlike
+        `search`, a membership test NEITHER reorders the nodes under a
+        `heuristic` NOR counts towards `searches` & `probes`.
+        """
+        curr = self._head
+        while (curr != None):
+            if (self._cmp_fn(curr.key, target_key) == DLL.CMPValues.EQUAL.value):
+                return True
+            curr = curr.next
+        return False
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the key of the DLL node at index `i`. Walks start from the
+        CLOSEST of the HEAD, the TAIL, or a cached "finger" node, so
+        SEQUENTIAL indexing (in either direction) is O(1) amortized.
+
+        :Parameters:
+            - `i`: an `int` index (negative counts from the TAIL), or a `slice`
+
+        :Return:
+            - The KEY at index `i`, OR
+            - A `list` of keys: if `i` is a `slice`
+        """
+
+        # CASE A: `i` is a `slice`, walk the DLL just ONCE
+        if (isinstance(i, slice)):
+            keys = list(self)
+            return keys[i]
+
+        # CASE B: `i` is an INAPPROPRIATE type
+        elif (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int` or `slice`")
+
+        # STEP 1: Ensure `i` is within the DLL
+        if (i < 0):
+            i += self._size
+        if ((i < 0) or (i >= self._size)):
+            raise IndexError("DLL index out of range")
+
+        # STEP 2: Pick the CLOSEST starting point to `i`
+        index, curr = 0, self.head
+        if ((self._size - 1 - i) < i):
+            index, curr = self._size - 1, self.tail
+        if ((self._finger != None) 
+            and (abs(self._finger[0] - i) < abs(index - i))):
+            index, curr = self._finger
+
+        # STEP 3: Walk FORWARDS or BACKWARDS to `i`
+        while (index < i):
+            curr = curr.next
+            index += 1
+        while (index > i):
+            curr = curr.prev
+            index -= 1
+
+        # STEP 4: Remember where the walk ended for the next lookup
+        self._finger = (index, curr)
+        return curr.key
+
     def insert_head(self, new_key):
         """
         INSERTS a new HEAD (i.e. FIRST) node in the DLL.
@@ -200,7 +424,7 @@ class DLL(object):
         """
         
         # STEP 1: Initialise the POINTER variables
-        new_head = DLL.Node(new_key)
+        new_head = self.__new_node(new_key)
         new_head.next = self.head
         new_head.prev = None
 
@@ -214,6 +438,11 @@ class DLL(object):
         
         # STEP 2: Adjust the DLL head pointer
         self.head = new_head
+
+        # STEP 3: Every index is SHIFTED along by one, including the finger's
+        self._size += 1
+        if (self._finger != None):
+            self._finger = (self._finger[0] + 1, self._finger[1])
         return self.head
 
     def insert_tail(self, new_key):
@@ -229,7 +458,7 @@ class DLL(object):
         """
         
         # STEP 1: Adjust the DLL head pointer
-        new_tail = DLL.Node(new_key)
+        new_tail = self.__new_node(new_key)
         new_tail.next = None
         new_tail.prev = self.tail
 
@@ -241,6 +470,7 @@ class DLL(object):
         else:
             self.tail.next = new_tail
             self.tail = new_tail
+        self._size += 1
         
         # STEP 2: Return the NEWLY added DLL TAIL node
         return self.tail
@@ -270,7 +500,19 @@ class DLL(object):
         else:
             self.head.prev = None
 
-        # STEP 3: Return the new DLL HEAD node
+        # STEP 3: Every index SHIFTS back by one & the finger may be deleted
+        self._size -= 1
+        if (self._finger != None):
+            index, node = self._finger
+            self._finger = (index - 1, node) if (index > 0) else None
+
+        # NOTE: The deleted node's search hits are dropped, so they do NOT
+        #       keep it alive
+        self._hits.pop(old_head, None)
+
+        # STEP 4: Recycle the deleted node & return the new DLL HEAD node
+        if (self._pool is not None):
+            self._pool.release(old_head)
         return self.head
 
     def delete_tail(self):
@@ -298,9 +540,36 @@ class DLL(object):
         else:
             self.tail.next = None
 
-        # STEP 3: Return the new DLL TAIL node
+        # STEP 3: Discard the finger if it was at the deleted node
+        self._size -= 1
+        if ((self._finger != None) and (self._finger[0] >= self._size)):
+            self._finger = None
+
+        # NOTE: The deleted node's search hits are dropped, so they do NOT
+        #       keep it alive
+        self._hits.pop(old_tail, None)
+
+        # STEP 4: Recycle the deleted node & return the new DLL TAIL node
+        if (self._pool is not None):
+            self._pool.release(old_tail)
         return self.tail
 
+    def clear(self):
+        """
+        DELETES every node of the DLL in O(n), breaking the `next` & `prev`
+        links ITERATIVELY so the nodes are freed by reference counting rather
+        than left as reference cycles for the garbage collector.
+        """
+
+        # STEP 1: Unlink (& recycle) every node from the HEAD to the TAIL
+        release_chain(self.head, self._pool)
+
+        # STEP 2: Reset the DLL to empty
+        self._size = 0
+        self._finger = None
+        self._hits.clear()
+        self.head = self.tail = None
+
     def __iterative_search(self, target_key):
         """
         ITERATIVELY searches the DLL & returns a node that MATCHES the target 
@@ -319,6 +588,7 @@ class DLL(object):
         while (curr):
 
             # STEP 2: Check if a MATCH was detected
+            self._probes += 1
             if (self.cmp_fn(curr.key, target_key) == DLL.CMPValues.EQUAL.value):
                 return curr
 
@@ -347,16 +617,77 @@ class DLL(object):
             return None
         
         # BASE CASE 2: Found a match
+        self._probes += 1
         if (self.cmp_fn(self_head.key, target_key) == DLL.CMPValues.EQUAL.value):
             return self_head
 
         # RECURSIVE CASE: Still more DLL nodes to search
         return self.__recursive_search(target_key, self_head.next)
 
+    def __reorganize(self, node):
+        """
+        APPLIES the self-organizing `heuristic` to a node just found by a
+        search, in O(1) for 'mtf' & 'transpose'.
+
+        :Parameters:
+            - `node`: the DLL node that was found
+        """
+
+        # STEP 1: Count the hit in the side `dict` ('count' ONLY, so NO other
+        #         mode costs memory per node), the HEAD node NEVER moves
+        #         forward
+        hits = self._hits
+        if (self._heuristic == "count"):
+            hits[node] = hits.get(node, 0) + 1
+        if (node is self.head):
+            return
+        prev = node.prev
+
+        # CASE A: Move-to-front, re-link the node as the new HEAD
+        if (self._heuristic == "mtf"):
+            slot = None
+
+        # CASE B: Transpose, re-link the node before it's predecessor
+        elif (self._heuristic == "transpose"):
+            slot = prev.prev
+
+        # CASE C: Count, walk BACKWARDS to the 1st node with at least as many
+        #         hits (i.e. ties keep their order)
+        else:
+            slot = prev
+            while ((slot != None) and (hits.get(slot, 0) < hits[node])):
+                slot = slot.prev
+            if (slot is prev):
+                return
+
+        # STEP 2: Unlink the node from it's current position
+        prev.next = node.next
+        if (node.next != None):
+            node.next.prev = prev
+        else:
+            self.tail = prev
+
+        # STEP 3: Re-link the node after `slot`
+        if (slot is None):
+            node.prev = None
+            node.next = self.head
+            self.head.prev = node
+            self.head = node
+        else:
+            node.prev = slot
+            node.next = slot.next
+            slot.next.prev = node
+            slot.next = node
+
+        # STEP 4: Node positions have changed, so discard the finger
+        self._finger = None
+
     def search(self, target_key, mode = 'i'):
         """
         SEARCHES the DLL & returns the 1st instance of a DLL node who's key 
         MATCHES the target search key.
+        If a self-organizing `heuristic` is set, the found node is then
+        moved according to it.
 
         :Parameters:
             - `target_key`: is the DESIRED search data to be queried in the DLL
@@ -375,32 +706,41 @@ class DLL(object):
 
         # CASE B: Use the ITERATIVE search method
         elif (mode == 'i'):
-            return self.__iterative_search(target_key)
+            node = self.__iterative_search(target_key)
 
         # CASE C: Use the RECURSIVE search method
         elif (mode == 'r'):
-            return self.__recursive_search(target_key, self.head)
+            node = self.__recursive_search(target_key, self.head)
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
             raise ValueError("`mode` must be of VALUE 'i' or 'r'")
 
+        # STEP 2: Count the search & reorganize the DLL around a hit
+        self._searches += 1
+        if ((node != None) and (self._heuristic is not None)):
+            self.__reorganize(node)
+        return node
+
     def __iterative_reverse(self):
         """
         ITERATIVELY reverses the node ORDER in a DLL.
         """
 
         # STEP 1: Initialise the POINTER variables
-        curr = self.head
-        self.head = self.tail
-        self.tail = curr
-
-        # STEP 2: Iterate all the way until the TAIL (i.e. LAST) DLL node
+        curr = self.tail
+        self.tail = self.head
+        self.head = curr
+
+        # STEP 2: Iterate BACKWARDS all the way until the ORIGINAL HEAD node,
+        #         so every node is already held by it's new predecessor's
+        #         `next` before it's old one lets go (i.e. safe for weak
+        #         `prev` pointers)
         while (curr != None):
-            next = curr.next
-            curr.next = curr.prev
-            curr.prev = next
-            curr = next
+            prev = curr.prev
+            curr.prev = curr.next
+            curr.next = prev
+            curr = prev
 
     def __recursive_reverse(self, self_head):
         """
@@ -452,4 +792,318 @@ class DLL(object):
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
-            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
\ No newline at end of file
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+        # STEP 2: The finger's node now sits at the MIRRORED index
+        if (self._finger != None):
+            index, node = self._finger
+            self._finger = (self._size - 1 - index, node)
+
+    def __split_run(self, start, width):
+        """
+        CUTS the chain of nodes beginning at `start` after `width` nodes.
+
+        :Return:
+            - A POINTER to the 1st node AFTER the cut, OR
+            - `None`: if the chain has `width` nodes or fewer
+        """
+        while ((start != None) and (width > 1)):
+            start = start._next
+            width -= 1
+        if (start is None):
+            return None
+        rest = start._next
+        start._next = None
+        return rest
+
+    def __merge_runs(self, left, right, cmp_fn):
+        """
+        MERGES two sorted, `None` terminated chains of nodes by relinking
+        their `next` pointers. Ties are taken from `left` first, which keeps
+        the merge STABLE.
+
+        :Return:
+            A `tuple` of the HEAD & TAIL nodes of the merged chain
+        """
+
+        # CASE A: At least one of the chains is empty
+        if ((left is None) or (right is None)):
+            head = left if (left != None) else right
+            tail = head
+            while ((tail != None) and (tail.next != None)):
+                tail = tail.next
+            return (head, tail)
+
+        # STEP 1: Pick the merged HEAD without a sentinel node (the links
+        #         are known to be `DLL.Node` or `None`, so the type-checking
+        #         setters are bypassed)
+        less = DLL.CMPValues.LESS.value
+        if (cmp_fn(right._key, left._key) == less):
+            head, right = right, right._next
+        else:
+            head, left = left, left._next
+        tail = head
+
+        # STEP 2: Repeatedly append the SMALLER front node of the 2 chains
+        while ((left is not None) and (right is not None)):
+            if (cmp_fn(right._key, left._key) == less):
+                tail._next = right
+                tail, right = right, right._next
+            else:
+                tail._next = left
+                tail, left = left, left._next
+
+        # STEP 3: Append whichever chain still has nodes & find the new TAIL
+        tail._next = left if (left != None) else right
+        while (tail._next != None):
+            tail = tail._next
+        return (head, tail)
+
+    def __fix_prev_links(self):
+        """
+        RESTORES every `prev` pointer after the `next` chain was relinked,
+        through the setter so weak back-pointers stay weak.
+        """
+        prev, curr = None, self.head
+        while (curr != None):
+            curr.prev = prev
+            prev, curr = curr, curr._next
+
+    def sort(self, cmp_fn = None):
+        """
+        SORTS the DLL in place with a STABLE, bottom-up merge sort in
+        O(n log n) time. Nodes are relinked rather than copied, NO nodes are
+        allocated & NO recursion is used.
+
+        :Parameters:
+            - `cmp_fn` (optional): the function for COMPARING node keys,
+              defaulting to the DLL's own `cmp_fn`
+        """
+
+        # STEP 1: Ensure `cmp_fn` (if any) is a function
+        if (cmp_fn is None):
+            cmp_fn = self.cmp_fn
+        elif (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Merge adjacent runs of `width` nodes, doubling each pass
+        head, tail = self.head, self.tail
+        width = 1
+        while (width < self._size):
+            curr, head, tail = head, None, None
+            while (curr != None):
+                left = curr
+                right = self.__split_run(left, width)
+                curr = self.__split_run(right, width)
+                run_head, run_tail = self.__merge_runs(left, right, cmp_fn)
+                if (tail is None):
+                    head = run_head
+                else:
+                    tail._next = run_head
+                tail = run_tail
+            width *= 2
+
+        # STEP 3: Fix the DLL pointers, node positions have changed so the
+        #         finger is discarded
+        self.head, self.tail = head, tail
+        self.__fix_prev_links()
+        self._finger = None
+
+    def merge_sorted(self, other):
+        """
+        MERGES the nodes of another DLL into this one in O(n + m), assuming
+        BOTH are already sorted by this DLL's `cmp_fn`. The nodes of `other`
+        are relinked (NOT copied), leaving `other` EMPTY. On ties, the nodes
+        of this DLL come first.
+
+        :Parameters:
+            - `other`: the sorted DLL to be merged in
+
+        :Return:
+            A POINTER to the HEAD node of the merged DLL
+        """
+
+        # STEP 1: Ensure `other` is a different DLL
+        if (not isinstance(other, DLL)):
+            raise TypeError("`other` must be of TYPE `DLL`")
+        elif (other is self):
+            raise ValueError("`other` must NOT be the same DLL")
+
+        # STEP 2: Relink both chains into one
+        head, tail = self.__merge_runs(self.head, other.head, self.cmp_fn)
+        self.head, self.tail = head, tail
+        self.__fix_prev_links()
+        self._size += other._size
+        self._finger = None
+
+        # STEP 3: Empty `other`, which NO longer owns any nodes
+        other.head = other.tail = None
+        other._size = 0
+        other._finger = None
+        other._hits.clear()
+        return self.head
+
+    def extend(self, iterable):
+        """
+        INSERTS a new TAIL node for every key in `iterable`, building the new
+        chain in a single pass & linking it to the DLL just once.
+
+        :Parameters:
+            - `iterable`: the KEYS to be appended, in order
+
+        :Return:
+            A POINTER to the DLL TAIL node (`None` if the DLL is still empty)
+        """
+
+        # STEP 1: Build the new chain, the `next` links are known to be
+        #         `DLL.Node` or `None`, so that type-checking setter is bypassed
+        first = last = None
+        count = 0
+        for new_key in iterable:
+            node = self.__new_node(new_key)
+            if (last is None):
+                first = node
+            else:
+                last._next = node
+                node.prev = last
+            last = node
+            count += 1
+
+        # STEP 2: Check if there was anything to append
+        if (first is None):
+            return self.tail
+
+        # STEP 3: Link the chain after the old TAIL, existing indices are
+        #         unchanged so the finger stays valid
+        if (self.tail == None):
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self._size += count
+        return self.tail
+
+    def concat(self, other):
+        """
+        LINKS every node of another DLL after this DLL's TAIL in O(1). The
+        nodes of `other` are moved (NOT copied), leaving `other` EMPTY.
+
+        :Parameters:
+            - `other`: the DLL to be appended
+
+        :Return:
+            A POINTER to the DLL TAIL node
+        """
+
+        # STEP 1: Ensure `other` is a different DLL
+        if (not isinstance(other, DLL)):
+            raise TypeError("`other` must be of TYPE `DLL`")
+        elif (other is self):
+            raise ValueError("`other` must NOT be the same DLL")
+
+        # CASE A: `other` has NO nodes to move
+        if (other.is_empty()):
+            return self.tail
+
+        # CASE B: This DLL is empty, take over `other`'s chain
+        if (self.is_empty()):
+            self.head = other.head
+
+        # CASE C: Link `other`'s HEAD after this DLL's TAIL
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self._size += other._size
+
+        # STEP 2: Empty `other`, which NO longer owns any nodes
+        other.head = other.tail = None
+        other._size = 0
+        other._finger = None
+        other._hits.clear()
+        return self.tail
+
+    def splice(self, start_node, end_node, dest, after_node = None, count = None):
+        """
+        MOVES the run of nodes from `start_node` to `end_node` (inclusive) out
+        of this DLL & into `dest`, directly after `after_node`. This is O(1)
+        when `count` is given.
+
+        :Parameters:
+            - `start_node`: the FIRST node of the run, which must be in this
+              DLL
+            - `end_node`: the LAST node of the run, which must be `start_node`
+              or come after it
+            - `dest`: the DLL receiving the run, which may be this DLL
+            - `after_node` (optional): the node in `dest` to place the run
+              after, or `None` (default) to place it at `dest`'s HEAD. It
+              must NOT be part of the run
+            - `count` (optional): the number of nodes in the run, if known.
+              Without it the run is walked to count it
+        """
+
+        # STEP 1: Ensure the arguments are of the appropriate types
+        if (not (isinstance(start_node, DLL.Node) and isinstance(end_node, DLL.Node))):
+            raise TypeError("`start_node` & `end_node` must be of TYPE `DLL.Node`")
+        elif (not isinstance(dest, DLL)):
+            raise TypeError("`dest` must be of TYPE `DLL`")
+        elif (not (isinstance(after_node, DLL.Node) or (after_node is None))):
+            raise TypeError("`after_node` must be of TYPE `DLL.Node` or `None`")
+        elif ((count is not None) and (not isinstance(count, int))):
+            raise TypeError("`count` must be of TYPE `int` or `None`")
+        elif ((count is not None) and (count < 1)):
+            raise ValueError("`count` must be at LEAST 1")
+
+        # STEP 2: Count the run if needed, checking `end_node` is reached
+        if (count is None):
+            count, curr = 1, start_node
+            while (curr is not end_node):
+                if ((curr is after_node) or (curr.next is None)):
+                    raise ValueError("`end_node` must FOLLOW `start_node` & "
+                                     "`after_node` must NOT be in the run")
+                curr = curr.next
+                count += 1
+            if (end_node is after_node):
+                raise ValueError("`after_node` must NOT be in the run")
+
+        # STEP 3: Unlink the run from this DLL in O(1)
+        before, after = start_node.prev, end_node.next
+        if (before is None):
+            self.head = after
+        else:
+            before.next = after
+        if (after is None):
+            self.tail = before
+        else:
+            after.prev = before
+        start_node.prev = end_node.next = None
+        self._size -= count
+
+        # STEP 4: Link the run into `dest` after `after_node`
+        if (after_node is None):
+            successor = dest.head
+            dest.head = start_node
+            start_node.prev = None
+        else:
+            successor = after_node.next
+            after_node.next = start_node
+            start_node.prev = after_node
+        end_node.next = successor
+        if (successor is None):
+            dest.tail = end_node
+        else:
+            successor.prev = end_node
+        dest._size += count
+
+        # STEP 5: Node positions have changed, so discard both fingers
+        self._finger = None
+        dest._finger = None
+
+        # STEP 6: Search hits are counted per list, so the run drops it's
+        #         hits on leaving this one
+        if (self._hits and (dest is not self)):
+            curr = start_node
+            for _ in range(count):
+                self._hits.pop(curr, None)
+                curr = curr.next
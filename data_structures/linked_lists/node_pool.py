@@ -0,0 +1,168 @@
+# @file     node_pool.py
+# @brief    A file for implementing a free-list allocator of linked-list nodes
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import functools
+
+# ---------------------------------------------------------------------------- #
+
+class NodePool(object):
+    """
+    An INTERFACE for a node pool: a free-list that RECYCLES the nodes deleted
+    from one linked structure into the nodes inserted into another. A single
+    pool can be shared by any mix of `SLL`, `DLL`, `SLLQ`, `SLLS`, `DLLQ` &
+    `DLLS` instances, as the free nodes are kept apart by node TYPE.
+
+    A structure with a pool RECYCLES every node it deletes, so a caller must
+    read a node's key BEFORE deleting it & NOT use the node afterwards.
+    """
+
+    def __init__(self, cap = 1024):
+
+        # STEP 1: Ensure `cap` is a non-negative `int`
+        if (not isinstance(cap, int)):
+            raise TypeError("`cap` must be of TYPE `int`")
+        elif (cap < 0):
+            raise ValueError("`cap` must be at LEAST 0")
+
+        # STEP 2: Assign class attributes
+        self._cap = cap
+        self._free = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cap(self):
+        """
+        The MAXIMUM number of free nodes held by the pool, across all types.
+        """
+        return self._cap
+
+    @property
+    def hits(self):
+        """
+        The number of `acquire` calls served by a RECYCLED node.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of `acquire` calls that had to ALLOCATE a new node.
+        """
+        return self._misses
+
+    def __len__(self):
+        """
+        RETRIEVES the number of free nodes currently held by the pool.
+        """
+        return self._size
+
+    def acquire(self, node_cls, key):
+        """
+        RETRIEVES a node of TYPE `node_cls` holding `key`, recycling a free
+        node if one is available.
+
+        :Parameters:
+            - `node_cls`: the node CLASS to be acquired (e.g. `DLL.Node`)
+            - `key`: the INFORMATION to be associated with the node
+
+        :Return:
+            A POINTER to a node with NO links
+        """
+
+        # CASE A: A free node of this type exists, it's links were already
+        #         cleared on release so only the key is set
+        free = self._free.get(node_cls)
+        if (free):
+            node = free.pop()
+            node.key = key
+            self._size -= 1
+            self._hits += 1
+            return node
+
+        # CASE B: NO free node exists, allocate a new one
+        self._misses += 1
+        return node_cls(key)
+
+    def release(self, node):
+        """
+        RETURNS an UNLINKED `node` to the pool, dropping it instead if the
+        pool is already at `cap`. The caller must NOT use `node` afterwards.
+
+        :Parameters:
+            - `node`: the node to be recycled
+        """
+
+        # STEP 1: The pool is FULL, let the node be garbage collected
+        if (self._size >= self.cap):
+            return
+
+        # STEP 2: Clear the node's key & links so nothing is kept alive
+        node.key = None
+        node.next = None
+        if (hasattr(node, "prev")):
+            node.prev = None
+        self._free.setdefault(type(node), []).append(node)
+        self._size += 1
+
+    def clear(self):
+        """
+        DISCARDS every free node held by the pool.
+        """
+        self._free = {}
+        self._size = 0
+
+# ---------------------------------------------------------------------------- #
+
+def check_pool(pool):
+    """
+    RAISES an error if `pool` is NEITHER `None` NOR able to `acquire` &
+    `release` nodes (e.g. a `NodePool`).
+
+    :Parameters:
+        - `pool`: the pool passed to a linked structure
+    """
+    if ((pool is not None) and not (callable(getattr(pool, "acquire", None))
+                                    and callable(getattr(pool, "release", None)))):
+        raise TypeError("`pool` must provide `acquire` & `release` methods")
+
+def node_allocator(node_cls, pool = None):
+    """
+    RETRIEVES the function that allocates a `node_cls` node from a key. A
+    structure binds it ONCE, so it's inserts never check for a `pool`.
+
+    :Parameters:
+        - `node_cls`: the node CLASS to be allocated (e.g. `DLL.Node`)
+        - `pool` (optional): the pool to RECYCLE nodes from
+
+    :Return:
+        - `node_cls` itself: if there is NO `pool`, OR
+        - `pool.acquire` bound to `node_cls`
+    """
+    if (pool is None):
+        return node_cls
+    return functools.partial(pool.acquire, node_cls)
+
+def release_chain(head, pool = None):
+    """
+    UNLINKS every node of the doubly linked chain starting at `head` in
+    O(n), breaking the `next` & `prev` links ITERATIVELY so the nodes are
+    freed by reference counting rather than left as reference cycles for
+    the garbage collector. This holds even once `pool` is at it's `cap` &
+    starts dropping the nodes.
+
+    :Parameters:
+        - `head`: the FIRST node of the chain, or `None`
+        - `pool` (optional): the pool to RECYCLE every unlinked node into
+    """
+    curr = head
+    while (curr is not None):
+        following = curr.next
+        curr.next = curr.prev = None
+        if (pool is not None):
+            pool.release(curr)
+        curr = following
@@ -0,0 +1,390 @@
+# @file     scll.py
+# @brief    A file for implementing a singly circular linked-list (SCLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from enum import Enum
+
+from node_pool import check_pool, node_allocator
+
+# ---------------------------------------------------------------------------- #
+
+class SCLL(object):
+    """
+    An INTERFACE for a singly circular linked-list (SCLL), where the TAIL
+    node links back to the HEAD. Only the TAIL is stored, the HEAD (i.e. the
+    CURRENT node of a round-robin) is always `tail.next`, so moving the
+    current node along is a single POINTER write.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    class Node(object):
+        """
+        A Singly Circular Linked-List (SCLL) node.
+        """
+
+        def __init__(self, key):
+            self._key = key
+            self._next = None
+
+        @property
+        def key(self):
+            """
+            Contains the DATA associated with an SCLL node.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def next(self):
+            """
+            A POINTER to an SCLL successor node (NEVER `None` while linked).
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of TYPE `SCLL.Node` or `None`
+            if (isinstance(new_next, SCLL.Node) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `SCLL.Node` or `None`")
+
+        @next.deleter
+        def next(self):
+            del self._next
+
+    def __init__(self, cmp_fn, pool = None):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Assign class attributes
+        self._cmp_fn = cmp_fn
+        self._pool = pool
+        self.__new_node = node_allocator(SCLL.Node, pool)
+        self._tail = None
+        self._size = 0
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING `SCLL.Node` keys.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`
+            - `0`: if `v1` & `v2` are EQUAL
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @cmp_fn.setter
+    def cmp_fn(self, new_cmp_fn):
+
+        # STEP 1: Ensure `new_cmp_fn` is of type 'function'
+        if (not callable(new_cmp_fn)):
+            raise TypeError("`new_cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign the new comparison function
+        self._cmp_fn = new_cmp_fn
+
+    @cmp_fn.deleter
+    def cmp_fn(self):
+        del self._cmp_fn
+
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @property
+    def head(self):
+        """
+        The FIRST (i.e. CURRENT) node in the SCLL.
+        """
+        return None if (self._tail is None) else self._tail.next
+
+    @property
+    def current(self):
+        """
+        The CURRENT node of the round-robin, an alias of `head`.
+        """
+        return self.head
+
+    @property
+    def tail(self):
+        """
+        The LAST node in the SCLL, i.e. the node BEFORE the current node.
+        """
+        return self._tail
+
+    def is_empty(self):
+        """
+        CHECKS if the SCLL is empty.
+
+        :Return:
+            - `True`: if the SCLL is empty
+            - `False`: if the SCLL is NOT empty
+        """
+        return (self._tail is None)
+
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the SCLL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS the key of every SCLL node for ONE lap, from the HEAD to the
+        TAIL.
+        """
+        curr = self.head
+        for _ in range(self._size):
+            yield curr.key
+            curr = curr.next
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any SCLL node's key MATCHES `target_key` via `cmp_fn`.
+        """
+        return (self.search(target_key) != None)
+
+    def insert_tail(self, new_key):
+        """
+        INSERTS a new TAIL node in O(1), i.e. directly BEFORE the current
+        node, so it is visited LAST in the current lap.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new TAIL
+              SCLL node
+
+        :Return:
+            A POINTER to the newly added SCLL TAIL node
+        """
+
+        # STEP 1: Initialise the new TAIL node
+        new_tail = self.__new_node(new_key)
+
+        # CASE A: 1st insertion, the node links to itself
+        if (self._tail is None):
+            new_tail.next = new_tail
+
+        # CASE B: NOT the 1st insertion, link it between the TAIL & HEAD
+        else:
+            new_tail.next = self._tail.next
+            self._tail.next = new_tail
+
+        # STEP 2: Adjust the SCLL tail pointer
+        self._tail = new_tail
+        self._size += 1
+        return new_tail
+
+    def insert_head(self, new_key):
+        """
+        INSERTS a new HEAD node in O(1), which becomes the CURRENT node.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new HEAD
+              SCLL node
+
+        :Return:
+            A POINTER to the newly added SCLL HEAD node
+        """
+
+        # STEP 1: Link the node in as the TAIL, then step the TAIL back onto
+        #         the old TAIL, making the new node the HEAD
+        old_tail = self._tail
+        new_head = self.insert_tail(new_key)
+        if (old_tail is not None):
+            self._tail = old_tail
+        return new_head
+
+    def remove_current(self):
+        """
+        DELETES the CURRENT (i.e. HEAD) node in O(1), making it's successor
+        the current node.
+
+        :Return:
+            - A POINTER to the new current node, OR
+            - `None`: if the SCLL has NO nodes left
+        """
+
+        # STEP 1: Check if the SCLL is empty
+        if (self._tail is None):
+            return None
+
+        # CASE A: The only SCLL node got deleted
+        old_head = self._tail.next
+        if (old_head is self._tail):
+            self._tail = None
+
+        # CASE B: At LEAST 2 SCLL nodes remaining, bypass the old HEAD
+        else:
+            self._tail.next = old_head.next
+
+        # STEP 2: Recycle the deleted node & return the new current node
+        old_head.next = None
+        self._size -= 1
+        if (self._pool is not None):
+            self._pool.release(old_head)
+        return self.head
+
+    def rotate(self, k = 1):
+        """
+        ADVANCES the current node `k` places along the SCLL, in O(k mod n).
+        A NEGATIVE `k` rotates backwards, which costs a walk of up to n.
+
+        :Parameters:
+            - `k` (optional): the number of places to advance (default 1)
+
+        :Return:
+            - A POINTER to the new current node, OR
+            - `None`: if the SCLL is empty
+        """
+
+        # STEP 1: Ensure `k` is an `int`
+        if (not isinstance(k, int)):
+            raise TypeError("`k` must be of TYPE `int`")
+
+        # STEP 2: Check if the SCLL is empty
+        if (self._tail is None):
+            return None
+
+        # STEP 3: Step the TAIL along, a full lap changes nothing
+        tail = self._tail
+        for _ in range(k % self._size):
+            tail = tail.next
+        self._tail = tail
+        return tail.next
+
+    def cycle(self):
+        """
+        YIELDS the key of the current node & then advances it, FOREVER (or
+        until the SCLL is emptied). Each step is O(1) with NO tail check.
+
+        The current node advances LAZILY, i.e. when the generator is RESUMED
+        rather than when it yields: after `next(g)` returns a key, `head`
+        STILL points at the node holding that key (also once `g` is
+        abandoned). This lets the consumer call `remove_current` on the
+        yielded node, after which it's successor is yielded next rather
+        than skipped. The generator only advances a node that is STILL
+        current, so a `rotate` between steps is respected too.
+        """
+        while (self._tail is not None):
+
+            # STEP 1: Hand out the current node
+            node = self._tail.next
+            yield node.key
+
+            # STEP 2: Advance ONLY if the node is still current
+            if ((self._tail is not None) and (self._tail.next is node)):
+                self._tail = node
+
+    def __iterative_search(self, target_key):
+        """
+        ITERATIVELY searches one lap of the SCLL & returns a node that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the SCLL
+
+        :Return:
+            - A POINTER to the SCLL node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+        curr = self.head
+        for _ in range(self._size):
+            if (self.cmp_fn(curr.key, target_key) == SCLL.CMPValues.EQUAL.value):
+                return curr
+            curr = curr.next
+        return None
+
+    def __recursive_search(self, target_key, curr, remaining):
+        """
+        RECURSIVELY searches one lap of the SCLL & returns a node that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the SCLL
+            - `curr`: is the CURRENT node being compared
+            - `remaining`: is the number of nodes LEFT in the lap
+
+        :Return:
+            - A POINTER to the SCLL node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # BASE CASE 1: The lap is complete
+        if (remaining == 0):
+            return None
+
+        # BASE CASE 2: Found a match
+        if (self.cmp_fn(curr.key, target_key) == SCLL.CMPValues.EQUAL.value):
+            return curr
+
+        # RECURSIVE CASE: Still more SCLL nodes to search
+        return self.__recursive_search(target_key, curr.next, remaining - 1)
+
+    def search(self, target_key, mode = 'i'):
+        """
+        SEARCHES one lap of the SCLL from the HEAD & returns the 1st SCLL
+        node who's key MATCHES the target search key.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the SCLL
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the SCLL search is conducted iteratively 'i' (default), or
+              recursively 'r'
+
+        :Return:
+            - A POINTER to the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE search method
+        elif (mode == 'i'):
+            return self.__iterative_search(target_key)
+
+        # CASE C: Use the RECURSIVE search method
+        elif (mode == 'r'):
+            return self.__recursive_search(target_key, self.head, self._size)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
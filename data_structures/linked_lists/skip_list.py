@@ -0,0 +1,278 @@
+# @file     skip_list.py
+# @brief    A file for implementing a sorted skip list
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+from enum import Enum
+
+# ---------------------------------------------------------------------------- #
+
+class SkipList(object):
+    """
+    An INTERFACE for a sorted skip list: a singly linked-list with extra
+    "express lane" pointers that skip over runs of nodes.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    class Node(object):
+        """
+        A skip list node, with one successor POINTER per level.
+        """
+
+        def __init__(self, key, level):
+            self._key = key
+            self._forward = [None] * level
+
+        @property
+        def key(self):
+            """
+            Contains the DATA associated with a skip list node.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def forward(self):
+            """
+            A `list` of POINTERS to the successor node at every level, where
+            level 0 links EVERY node in sorted order.
+            """
+            return self._forward
+
+        @property
+        def next(self):
+            """
+            A POINTER to the skip list successor node (i.e. at level 0).
+            """
+            return self._forward[0]
+
+    def __init__(self, cmp_fn, p = 0.5, max_level = 32, seed = None):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Ensure the level parameters are valid
+        if (not (0 < p < 1)):
+            raise ValueError("`p` must be between 0 & 1 (exclusive)")
+        elif (not isinstance(max_level, int)):
+            raise TypeError("`max_level` must be of TYPE `int`")
+        elif (max_level < 1):
+            raise ValueError("`max_level` must be at LEAST 1")
+
+        # STEP 3: Assign class attributes, the header holds NO key
+        self._cmp_fn = cmp_fn
+        self._p = p
+        self._max_level = max_level
+        self._random = random.Random(seed)
+        self._header = SkipList.Node(None, max_level)
+        self._level = 1
+        self._size = 0
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING `SkipList.Node` keys.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`
+            - `0`: if `v1` & `v2` are EQUAL
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @property
+    def p(self):
+        """
+        The PROBABILITY that a node at one level is promoted to the next.
+        """
+        return self._p
+
+    @property
+    def level(self):
+        """
+        The number of levels CURRENTLY in use.
+        """
+        return self._level
+
+    @property
+    def head(self):
+        """
+        The FIRST (i.e. SMALLEST) node in the skip list.
+        """
+        return self._header.forward[0]
+
+    def is_empty(self):
+        """
+        CHECKS if the skip list is empty.
+
+        :Return:
+            - `True`: if the skip list is empty
+            - `False`: if the skip list is NOT empty
+        """
+        return (self.head is None)
+
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the skip list in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS every key in the skip list in sorted ORDER.
+        """
+        curr = self.head
+        while (curr != None):
+            yield curr.key
+            curr = curr.next
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any node's key MATCHES `target_key` via `cmp_fn`.
+        """
+        return (self.search(target_key) != None)
+
+    def __random_level(self):
+        """
+        DRAWS the level of a new node from a geometric distribution.
+        """
+        level = 1
+        while ((level < self._max_level) and (self._random.random() < self.p)):
+            level += 1
+        return level
+
+    def __find_predecessors(self, target_key, inclusive = False):
+        """
+        FINDS, at every level, the LAST node whose key is LESS than
+        `target_key` (or LESS than or EQUAL to it, if `inclusive`).
+
+        :Return:
+            A `list` of the predecessor nodes, indexed by level
+        """
+
+        # STEP 1: Descend from the TOP level, running along each express lane
+        update = [self._header] * self._max_level
+        stop = (SkipList.CMPValues.GREATER.value if inclusive
+                else SkipList.CMPValues.EQUAL.value)
+        curr = self._header
+        for i in range(self._level - 1, -1, -1):
+            nxt = curr.forward[i]
+            while ((nxt != None) and (self.cmp_fn(nxt.key, target_key) < stop)):
+                curr = nxt
+                nxt = curr.forward[i]
+            update[i] = curr
+        return update
+
+    def search(self, target_key):
+        """
+        SEARCHES the skip list in expected O(log n) for the 1st node whose key
+        MATCHES `target_key`.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried
+
+        :Return:
+            - A POINTER to the node that MATCHES the target search data, OR
+            - `None`: to indicate that NO matches were found
+        """
+        candidate = self.__find_predecessors(target_key)[0].next
+        if ((candidate != None) and (self.cmp_fn(candidate.key, target_key)
+                                     == SkipList.CMPValues.EQUAL.value)):
+            return candidate
+        return None
+
+    def insert(self, new_key):
+        """
+        INSERTS a new node in sorted ORDER in expected O(log n). EQUAL keys
+        are kept in insertion order.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be associated with the new node
+
+        :Return:
+            A POINTER to the newly added node
+        """
+
+        # STEP 1: Find the predecessors AFTER any equal keys
+        update = self.__find_predecessors(new_key, inclusive = True)
+
+        # STEP 2: Draw the new node's level, raising the list level if needed
+        level = self.__random_level()
+        if (level > self._level):
+            self._level = level
+
+        # STEP 3: Splice the new node into every level it belongs to
+        new_node = SkipList.Node(new_key, level)
+        for i in range(level):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+        self._size += 1
+        return new_node
+
+    def delete(self, target_key):
+        """
+        DELETES the 1st node whose key MATCHES `target_key` in expected
+        O(log n).
+
+        :Parameters:
+            - `target_key`: the key of the node to be deleted
+
+        :Return:
+            - A POINTER to the deleted node, OR
+            - `None`: if NO matches were found
+        """
+
+        # STEP 1: Find the node to be deleted
+        update = self.__find_predecessors(target_key)
+        target = update[0].next
+        if ((target is None) or (self.cmp_fn(target.key, target_key)
+                                 != SkipList.CMPValues.EQUAL.value)):
+            return None
+
+        # STEP 2: Unlink the node from every level it appears in
+        for i in range(len(target.forward)):
+            update[i].forward[i] = target.forward[i]
+
+        # STEP 3: Drop any levels that are now EMPTY
+        while ((self._level > 1) and (self._header.forward[self._level - 1] is None)):
+            self._level -= 1
+        self._size -= 1
+        return target
+
+    def range(self, lo, hi):
+        """
+        YIELDS every key between `lo` & `hi` (inclusive) in sorted ORDER,
+        reaching `lo` in expected O(log n).
+
+        :Parameters:
+            - `lo`: the LOWER bound (inclusive) of the keys
+            - `hi`: the UPPER bound (inclusive) of the keys
+        """
+        curr = self.__find_predecessors(lo)[0].next
+        while ((curr != None) and (self.cmp_fn(curr.key, hi)
+                                   != SkipList.CMPValues.GREATER.value)):
+            yield curr.key
+            curr = curr.next
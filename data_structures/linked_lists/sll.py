@@ -6,6 +6,8 @@
 
 from enum import Enum
 
+from node_pool import check_pool, node_allocator
+
 # ---------------------------------------------------------------------------- #
 
 class SLL(object):
@@ -46,7 +48,7 @@ class SLL(object):
         @key.deleter
         def key(self):
             del self._key
-        
+
         @property
         def next(self):
             """
@@ -69,16 +71,30 @@ class SLL(object):
         def next(self):
             del self._next
 
-    def __init__(self, cmp_fn):
+    def __init__(self, cmp_fn, pool = None, heuristic = None):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Ensure `heuristic` (if any) is a known heuristic
+        SLL.__check_heuristic(heuristic)
+
+        # STEP 4: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self.__new_node = node_allocator(SLL.Node, pool)
+        self._heuristic = heuristic
+        self._searches = 0
+        self._probes = 0
+        self._hits = {}
         self._head = None
         self._tail = None
+        self._size = 0
+        self._finger = None
 
     @property
     def cmp_fn(self):
@@ -110,6 +126,81 @@ class SLL(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @staticmethod
+    def __check_heuristic(heuristic):
+        """
+        RAISES an error if `heuristic` is NOT `None`, 'mtf', 'transpose' or
+        'count'.
+        """
+        if (heuristic is None):
+            return
+        elif (not isinstance(heuristic, str)):
+            raise TypeError("`heuristic` must be of TYPE `str` or `None`")
+        elif (heuristic not in ("mtf", "transpose", "count")):
+            raise ValueError("`heuristic` must be of VALUE 'mtf', 'transpose' "
+                             "or 'count'")
+
+    @property
+    def heuristic(self):
+        """
+        The OPTIONAL self-organizing heuristic applied on every search hit:
+            - `None`: the node order is NEVER changed by a search
+            - 'mtf': the found node is MOVED to the front
+            - 'transpose': the found node is SWAPPED with it's predecessor
+            - 'count': nodes are kept in DESCENDING order of search hits
+        """
+        return self._heuristic
+
+    @heuristic.setter
+    def heuristic(self, new_heuristic):
+
+        # STEP 1: Ensure `new_heuristic` is a known heuristic
+        SLL.__check_heuristic(new_heuristic)
+
+        # STEP 2: Assign the new heuristic, search hits are only kept while
+        #         it is 'count'
+        self._heuristic = new_heuristic
+        if (new_heuristic != "count"):
+            self._hits.clear()
+
+    @property
+    def searches(self):
+        """
+        The number of `search` calls since the last `reset_counters`.
+        """
+        return self._searches
+
+    @property
+    def probes(self):
+        """
+        The number of node keys COMPARED by `search` since the last
+        `reset_counters`, i.e. the total ACCESS cost.
+        """
+        return self._probes
+
+    @property
+    def mean_probes(self):
+        """
+        The MEAN access cost (i.e. `probes` per search), or 0 if there were
+        NO searches.
+        """
+        return (self._probes / self._searches) if self._searches else 0.0
+
+    def reset_counters(self):
+        """
+        RESETS the `searches` & `probes` access-cost counters to 0.
+        """
+        self._searches = 0
+        self._probes = 0
+
     @property
     def head(self):
         """
@@ -164,6 +255,85 @@ class SLL(object):
         """
         return ((self.head == None) and (self.tail == None))
 
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the SLL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS the key of every SLL node from the HEAD to the TAIL.
+        """
+        curr = self.head
+        while (curr != None):
+            yield curr.key
+            curr = curr.next
+
+    def __reversed__(self):
+        """
+        YIELDS the key of every SLL node from the TAIL to the HEAD. As the SLL
+        has NO predecessor pointers, the keys are buffered first in O(n).
+        """
+        yield from reversed(list(self))
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any SLL node's key MATCHES `target_key` via `cmp_fn`. Unlike
+        `search`, a membership test NEITHER reorders the nodes under a
+        `heuristic` NOR counts towards `searches` & `probes`.
+        """
+        curr = self._head
+        while (curr != None):
+            if (self._cmp_fn(curr.key, target_key) == SLL.CMPValues.EQUAL.value):
+                return True
+            curr = curr.next
+        return False
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the key of the SLL node at index `i`. Walks resume from a
+        cached "finger" node, so SEQUENTIAL indexing is O(1) amortized.
+
+        :Parameters:
+            - `i`: an `int` index (negative counts from the TAIL), or a `slice`
+
+        :Return:
+            - The KEY at index `i`, OR
+            - A `list` of keys: if `i` is a `slice`
+        """
+
+        # CASE A: `i` is a `slice`, walk the SLL just ONCE
+        if (isinstance(i, slice)):
+            keys = list(self)
+            return keys[i]
+
+        # CASE B: `i` is an INAPPROPRIATE type
+        elif (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int` or `slice`")
+
+        # STEP 1: Ensure `i` is within the SLL
+        if (i < 0):
+            i += self._size
+        if ((i < 0) or (i >= self._size)):
+            raise IndexError("SLL index out of range")
+
+        # STEP 2: The TAIL node is reachable directly
+        if (i == self._size - 1):
+            return self.tail.key
+
+        # STEP 3: Walk from the finger if it is at or BEFORE `i`
+        index, curr = 0, self.head
+        if ((self._finger != None) and (self._finger[0] <= i)):
+            index, curr = self._finger
+        while (index < i):
+            curr = curr.next
+            index += 1
+
+        # STEP 4: Remember where the walk ended for the next lookup
+        self._finger = (index, curr)
+        return curr.key
+
     def insert_head(self, new_key):
         """
         INSERTS a new HEAD (i.e. FIRST) node in the SLL.
@@ -177,15 +347,20 @@ class SLL(object):
         """
 
         # STEP 1: Initialise the new HEAD node & POINTER variables
-        new_head = SLL.Node(new_key)
+        new_head = self.__new_node(new_key)
         new_head.next = self.head
-        self.head = new_head
 
         # EXCEPTION: 1st insertion into the SLL
         if (self.is_empty()):
             self.tail = new_head
+        self.head = new_head
 
-        # STEP 2: Return the newly added HEAD node
+        # STEP 2: Every index is SHIFTED along by one, including the finger's
+        self._size += 1
+        if (self._finger != None):
+            self._finger = (self._finger[0] + 1, self._finger[1])
+
+        # STEP 3: Return the newly added HEAD node
         return self.head
 
     def insert_tail(self, new_key):
@@ -201,7 +376,7 @@ class SLL(object):
         """
         
         # STEP 1: Initialise the new TAIL node & POINTER variables
-        new_tail = SLL.Node(new_key)
+        new_tail = self.__new_node(new_key)
 
         # CASE A: 1st insertion into the SLL
         if (self.tail == None):
@@ -211,6 +386,7 @@ class SLL(object):
         else:
             self.tail.next = new_tail
             self.tail = new_tail
+        self._size += 1
         
         # STEP 2: Return the newly added TAIL node
         return self.tail
@@ -227,6 +403,7 @@ class SLL(object):
         # STEP 1: Check if the SLL is empty
         if (self.is_empty()):
             return None
+        old_head = self.head
 
         # CASE A: Only ONE node in the SLL remains
         if (self.head == self.tail):
@@ -236,12 +413,26 @@ class SLL(object):
         else:
             self.head = self.head.next
 
-        # STEP 2: Read the new SLL HEAD node
+        # STEP 2: Every index SHIFTS back by one, the finger may be deleted
+        self._size -= 1
+        if (self._finger != None):
+            index, node = self._finger
+            self._finger = (index - 1, node) if (index > 0) else None
+
+        # NOTE: The deleted node's search hits are dropped, so they do NOT
+        #       keep it alive
+        self._hits.pop(old_head, None)
+
+        # STEP 3: Recycle the deleted node & return the new SLL HEAD node
+        if (self._pool is not None):
+            self._pool.release(old_head)
         return self.head
         
     def delete_tail(self):
         """
-        DELETES the TAIL (i.e. END) node of the SLL.
+        DELETES the TAIL (i.e. END) node of the SLL. As the SLL has NO
+        predecessor pointers this walks to the 2nd last node in O(n), so
+        stack-like use should push & pop at the HEAD instead (see `SLLS`).
 
         :Return:
             - A POINTER to the new SLL TAIL node, OR
@@ -250,6 +441,7 @@ class SLL(object):
         
         # STEP 1: Initialise the POINTER variables
         tmp = self.head
+        old_tail = self.tail
 
         # CASE A: ZERO nodes in the SLL
         if (tmp == None):
@@ -270,7 +462,18 @@ class SLL(object):
             tmp.next = None
             self.tail = tmp
 
-        # STEP 2: Return the new SLL TAIL node
+        # STEP 2: Discard the finger if it was at the deleted node
+        self._size -= 1
+        if ((self._finger != None) and (self._finger[0] >= self._size)):
+            self._finger = None
+
+        # NOTE: The deleted node's search hits are dropped, so they do NOT
+        #       keep it alive
+        self._hits.pop(old_tail, None)
+
+        # STEP 3: Recycle the deleted node & return the new SLL TAIL node
+        if (self._pool is not None):
+            self._pool.release(old_tail)
         return self.tail
 
     def __iterative_search(self, target_key):
@@ -295,6 +498,7 @@ class SLL(object):
         while (curr):
 
             # STEP 3: Check if the current node's key MATCHES the target key
+            self._probes += 1
             if (self.cmp_fn(curr.key, target_key) == SLL.CMPValues.EQUAL.value):
                 return curr
 
@@ -323,16 +527,76 @@ class SLL(object):
             return None
         
         # BASE CASE 2: Found a match
+        self._probes += 1
         if (self.cmp_fn(self_head.key, target_key) == SLL.CMPValues.EQUAL.value):
             return self_head
 
         # RECURSIVE CASE: Still more SLL nodes to search
         return self.__recursive_search(target_key, self_head.next)
 
+    def __reorganize(self, node):
+        """
+        APPLIES the self-organizing `heuristic` to a node just found by a
+        search. Without `prev` pointers the node's predecessors are found by
+        walking from the HEAD, which costs NO key comparisons.
+
+        :Parameters:
+            - `node`: the SLL node that was found
+        """
+
+        # STEP 1: Count the hit in the side `dict` ('count' ONLY, so NO other
+        #         mode costs memory per node), the HEAD node NEVER moves
+        #         forward
+        hits = self._hits
+        if (self._heuristic == "count"):
+            hits[node] = hits.get(node, 0) + 1
+        if (node is self.head):
+            return
+
+        # STEP 2: Find the node's predecessor & the node before that
+        before, prev = None, self.head
+        while (prev.next is not node):
+            before, prev = prev, prev.next
+
+        # CASE A: Move-to-front, re-link the node as the new HEAD
+        if (self._heuristic == "mtf"):
+            slot = None
+
+        # CASE B: Transpose, re-link the node before it's predecessor
+        elif (self._heuristic == "transpose"):
+            slot = before
+
+        # CASE C: Count, re-link the node after the LAST node with at least
+        #         as many hits (i.e. ties keep their order)
+        else:
+            slot, curr = None, self.head
+            while ((curr is not node) and (hits.get(curr, 0) >= hits[node])):
+                slot, curr = curr, curr.next
+            if (curr is node):
+                return
+
+        # STEP 3: Unlink the node from it's current position
+        prev.next = node.next
+        if (node is self.tail):
+            self.tail = prev
+
+        # STEP 4: Re-link the node after `slot`
+        if (slot is None):
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = slot.next
+            slot.next = node
+
+        # STEP 5: Node positions have changed, so discard the finger
+        self._finger = None
+
     def search(self, target_key, mode = 'i'):
         """
         SEARCHES the SLL & returns the 1st instance of a SLL node who's key 
         MATCHES the target search key.
+        If a self-organizing `heuristic` is set, the found node is then
+        moved according to it.
 
         :Parameters:
             - `target_key`: is the DESIRED search data to be queried in the SLL
@@ -351,16 +615,22 @@ class SLL(object):
 
         # CASE B: Use the ITERATIVE search method
         elif (mode == 'i'):
-            return self.__iterative_search(target_key)
+            node = self.__iterative_search(target_key)
 
         # CASE C: Use the RECURSIVE search method
         elif (mode == 'r'):
-            return self.__recursive_search(target_key, self.head)
+            node = self.__recursive_search(target_key, self.head)
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
             raise ValueError("`mode` must be of VALUE 'i' or 'r'")
 
+        # STEP 2: Count the search & reorganize the SLL around a hit
+        self._searches += 1
+        if ((node != None) and (self._heuristic is not None)):
+            self.__reorganize(node)
+        return node
+
     def __iterative_reverse(self):
         """
         ITERATIVELY reverses the node ORDER in a SLL.
@@ -434,4 +704,305 @@ class SLL(object):
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
-            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
\ No newline at end of file
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+        # STEP 2: The finger's node now sits at the MIRRORED index
+        if (self._finger != None):
+            index, node = self._finger
+            self._finger = (self._size - 1 - index, node)
+
+    def __split_run(self, start, width):
+        """
+        CUTS the chain of nodes beginning at `start` after `width` nodes.
+
+        :Return:
+            - A POINTER to the 1st node AFTER the cut, OR
+            - `None`: if the chain has `width` nodes or fewer
+        """
+        while ((start != None) and (width > 1)):
+            start = start._next
+            width -= 1
+        if (start is None):
+            return None
+        rest = start._next
+        start._next = None
+        return rest
+
+    def __merge_runs(self, left, right, cmp_fn):
+        """
+        MERGES two sorted, `None` terminated chains of nodes by relinking
+        their `next` pointers. Ties are taken from `left` first, which keeps
+        the merge STABLE.
+
+        :Return:
+            A `tuple` of the HEAD & TAIL nodes of the merged chain
+        """
+
+        # CASE A: At least one of the chains is empty
+        if ((left is None) or (right is None)):
+            head = left if (left != None) else right
+            tail = head
+            while ((tail != None) and (tail.next != None)):
+                tail = tail.next
+            return (head, tail)
+
+        # STEP 1: Pick the merged HEAD without a sentinel node (the links
+        #         are known to be `SLL.Node` or `None`, so the type-checking
+        #         setters are bypassed)
+        less = SLL.CMPValues.LESS.value
+        if (cmp_fn(right._key, left._key) == less):
+            head, right = right, right._next
+        else:
+            head, left = left, left._next
+        tail = head
+
+        # STEP 2: Repeatedly append the SMALLER front node of the 2 chains
+        while ((left is not None) and (right is not None)):
+            if (cmp_fn(right._key, left._key) == less):
+                tail._next = right
+                tail, right = right, right._next
+            else:
+                tail._next = left
+                tail, left = left, left._next
+
+        # STEP 3: Append whichever chain still has nodes & find the new TAIL
+        tail._next = left if (left != None) else right
+        while (tail._next != None):
+            tail = tail._next
+        return (head, tail)
+
+    def sort(self, cmp_fn = None):
+        """
+        SORTS the SLL in place with a STABLE, bottom-up merge sort in
+        O(n log n) time. Nodes are relinked rather than copied, NO nodes are
+        allocated & NO recursion is used.
+
+        :Parameters:
+            - `cmp_fn` (optional): the function for COMPARING node keys,
+              defaulting to the SLL's own `cmp_fn`
+        """
+
+        # STEP 1: Ensure `cmp_fn` (if any) is a function
+        if (cmp_fn is None):
+            cmp_fn = self.cmp_fn
+        elif (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Merge adjacent runs of `width` nodes, doubling each pass
+        head, tail = self.head, self.tail
+        width = 1
+        while (width < self._size):
+            curr, head, tail = head, None, None
+            while (curr != None):
+                left = curr
+                right = self.__split_run(left, width)
+                curr = self.__split_run(right, width)
+                run_head, run_tail = self.__merge_runs(left, right, cmp_fn)
+                if (tail is None):
+                    head = run_head
+                else:
+                    tail._next = run_head
+                tail = run_tail
+            width *= 2
+
+        # STEP 3: Fix the SLL pointers, node positions have changed so the
+        #         finger is discarded
+        self.head, self.tail = head, tail
+        self._finger = None
+
+    def merge_sorted(self, other):
+        """
+        MERGES the nodes of another SLL into this one in O(n + m), assuming
+        BOTH are already sorted by this SLL's `cmp_fn`. The nodes of `other`
+        are relinked (NOT copied), leaving `other` EMPTY. On ties, the nodes
+        of this SLL come first.
+
+        :Parameters:
+            - `other`: the sorted SLL to be merged in
+
+        :Return:
+            A POINTER to the HEAD node of the merged SLL
+        """
+
+        # STEP 1: Ensure `other` is a different SLL
+        if (not isinstance(other, SLL)):
+            raise TypeError("`other` must be of TYPE `SLL`")
+        elif (other is self):
+            raise ValueError("`other` must NOT be the same SLL")
+
+        # STEP 2: Relink both chains into one
+        head, tail = self.__merge_runs(self.head, other.head, self.cmp_fn)
+        self.head, self.tail = head, tail
+        self._size += other._size
+        self._finger = None
+
+        # STEP 3: Empty `other`, which NO longer owns any nodes
+        other.head = other.tail = None
+        other._size = 0
+        other._finger = None
+        other._hits.clear()
+        return self.head
+
+    def extend(self, iterable):
+        """
+        INSERTS a new TAIL node for every key in `iterable`, building the new
+        chain in a single pass & linking it to the SLL just once.
+
+        :Parameters:
+            - `iterable`: the KEYS to be appended, in order
+
+        :Return:
+            A POINTER to the SLL TAIL node (`None` if the SLL is still empty)
+        """
+
+        # STEP 1: Build the new chain, the links are known to be `SLL.Node`
+        #         or `None`, so the type-checking setters are bypassed
+        first = last = None
+        count = 0
+        for new_key in iterable:
+            node = self.__new_node(new_key)
+            if (last is None):
+                first = node
+            else:
+                last._next = node
+            last = node
+            count += 1
+
+        # STEP 2: Check if there was anything to append
+        if (first is None):
+            return self.tail
+
+        # STEP 3: Link the chain after the old TAIL, existing indices are
+        #         unchanged so the finger stays valid
+        if (self.tail == None):
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self._size += count
+        return self.tail
+
+    def concat(self, other):
+        """
+        LINKS every node of another SLL after this SLL's TAIL in O(1). The
+        nodes of `other` are moved (NOT copied), leaving `other` EMPTY.
+
+        :Parameters:
+            - `other`: the SLL to be appended
+
+        :Return:
+            A POINTER to the SLL TAIL node
+        """
+
+        # STEP 1: Ensure `other` is a different SLL
+        if (not isinstance(other, SLL)):
+            raise TypeError("`other` must be of TYPE `SLL`")
+        elif (other is self):
+            raise ValueError("`other` must NOT be the same SLL")
+
+        # CASE A: `other` has NO nodes to move
+        if (other.is_empty()):
+            return self.tail
+
+        # CASE B: This SLL is empty, take over `other`'s chain
+        if (self.is_empty()):
+            self.head = other.head
+
+        # CASE C: Link `other`'s HEAD after this SLL's TAIL
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self._size += other._size
+
+        # STEP 2: Empty `other`, which NO longer owns any nodes
+        other.head = other.tail = None
+        other._size = 0
+        other._finger = None
+        other._hits.clear()
+        return self.tail
+
+    def splice(self, start_node, end_node, dest, after_node = None, count = None):
+        """
+        MOVES the run of nodes from `start_node` to `end_node` (inclusive) out
+        of this SLL & into `dest`, directly after `after_node`. Without
+        `prev` pointers the predecessor of `start_node` is found by walking
+        from the HEAD, so this is O(1) only when `start_node` is the HEAD &
+        `count` is given.
+
+        :Parameters:
+            - `start_node`: the FIRST node of the run, which must be in this
+              SLL
+            - `end_node`: the LAST node of the run, which must be `start_node`
+              or come after it
+            - `dest`: the SLL receiving the run, which may be this SLL
+            - `after_node` (optional): the node in `dest` to place the run
+              after, or `None` (default) to place it at `dest`'s HEAD. It
+              must NOT be part of the run
+            - `count` (optional): the number of nodes in the run, if known.
+              Without it the run is walked to count it
+        """
+
+        # STEP 1: Ensure the arguments are of the appropriate types
+        if (not (isinstance(start_node, SLL.Node) and isinstance(end_node, SLL.Node))):
+            raise TypeError("`start_node` & `end_node` must be of TYPE `SLL.Node`")
+        elif (not isinstance(dest, SLL)):
+            raise TypeError("`dest` must be of TYPE `SLL`")
+        elif (not (isinstance(after_node, SLL.Node) or (after_node is None))):
+            raise TypeError("`after_node` must be of TYPE `SLL.Node` or `None`")
+        elif ((count is not None) and (not isinstance(count, int))):
+            raise TypeError("`count` must be of TYPE `int` or `None`")
+        elif ((count is not None) and (count < 1)):
+            raise ValueError("`count` must be at LEAST 1")
+
+        # STEP 2: Count the run if needed, checking `end_node` is reached
+        if (count is None):
+            count, curr = 1, start_node
+            while (curr is not end_node):
+                if ((curr is after_node) or (curr.next is None)):
+                    raise ValueError("`end_node` must FOLLOW `start_node` & "
+                                     "`after_node` must NOT be in the run")
+                curr = curr.next
+                count += 1
+            if (end_node is after_node):
+                raise ValueError("`after_node` must NOT be in the run")
+
+        # STEP 3: Find the run's predecessor, then unlink the run
+        before = None
+        if (start_node is not self.head):
+            before = self.head
+            while ((before != None) and (before.next is not start_node)):
+                before = before.next
+            if (before is None):
+                raise ValueError("`start_node` must be in this SLL")
+        if (before is None):
+            self.head = end_node.next
+        else:
+            before.next = end_node.next
+        if (end_node is self.tail):
+            self.tail = before
+        end_node.next = None
+        self._size -= count
+
+        # STEP 4: Link the run into `dest` after `after_node`
+        if (after_node is None):
+            successor = dest.head
+            dest.head = start_node
+        else:
+            successor = after_node.next
+            after_node.next = start_node
+        end_node.next = successor
+        if (successor is None):
+            dest.tail = end_node
+        dest._size += count
+
+        # STEP 5: Node positions have changed, so discard both fingers
+        self._finger = None
+        dest._finger = None
+
+        # STEP 6: Search hits are counted per list, so the run drops it's
+        #         hits on leaving this one
+        if (self._hits and (dest is not self)):
+            curr = start_node
+            for _ in range(count):
+                self._hits.pop(curr, None)
+                curr = curr.next
@@ -0,0 +1,95 @@
+# @file     test_adll.py
+# @brief    A file for testing the array-backed doubly linked list (ADLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from adll import ADLL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_rejects_bad_typecode():
+    with pytest.raises(TypeError):
+        ADLL(cmp_fn, typecode = 1)
+    with pytest.raises(ValueError):
+        ADLL(cmp_fn, typecode = 'u')
+
+@pytest.mark.parametrize("typecode", [None, 'q'])
+def test_matches_a_list(typecode):
+    rng = random.Random(5)
+    lst, model = ADLL(cmp_fn, typecode = typecode), []
+    peak = 0
+    for _ in range(3000):
+        op = rng.randrange(5)
+        if (op == 0):
+            key = rng.randrange(100)
+            lst.insert_head(key)
+            model.insert(0, key)
+        elif (op == 1):
+            key = rng.randrange(100)
+            lst.insert_tail(key)
+            model.append(key)
+        elif ((op == 2) and model):
+            lst.delete_head()
+            model.pop(0)
+        elif ((op == 3) and model):
+            lst.delete_tail()
+            model.pop()
+        elif (model):
+            i = rng.randrange(-len(model), len(model))
+            assert lst[i] == model[i]
+        assert len(lst) == len(model)
+
+        # NOTE: freed slots are reused, so the buffers only grow at a peak
+        peak = max(peak, len(model))
+        assert lst.capacity == peak
+    assert list(lst) == model
+    assert list(reversed(lst)) == model[::-1]
+    assert lst[::3] == model[::3]
+
+def test_freed_slots_are_reused():
+    lst = ADLL(cmp_fn)
+    lst.extend(range(10))
+    for _ in range(10):
+        lst.delete_tail()
+    lst.extend(range(10))
+    assert (lst.capacity, list(lst)) == (10, list(range(10)))
+
+def test_cursors_walk_both_ways():
+    lst = ADLL(cmp_fn)
+    lst.extend([1, 2, 3])
+    cursor, keys = lst.head, []
+    while (cursor is not None):
+        keys.append(lst.key(cursor))
+        cursor = lst.next(cursor)
+    assert keys == [1, 2, 3]
+    assert (lst.prev(lst.head), lst.next(lst.tail)) == (None, None)
+    assert lst.key(lst.prev(lst.tail)) == 2
+
+def test_search_and_reverse():
+    for mode in ('i', 'r'):
+        lst = ADLL(cmp_fn)
+        lst.extend(range(6))
+        assert lst.key(lst.search(4, mode)) == 4
+        assert lst.search(9, mode) is None
+        lst.reverse(mode)
+        assert list(lst) == [5, 4, 3, 2, 1, 0]
+        assert list(reversed(lst)) == [0, 1, 2, 3, 4, 5]
+
+def test_sort_is_stable():
+    rng = random.Random(6)
+    keys = [(rng.randrange(10), i) for i in range(200)]
+    lst = ADLL(lambda a, b: cmp_fn(a[0], b[0]))
+    lst.extend(keys)
+    lst.sort()
+    expected = sorted(keys, key = lambda key: key[0])
+    assert list(lst) == expected
+    assert list(reversed(lst)) == expected[::-1]
+    assert [lst[i] for i in range(len(lst))] == expected
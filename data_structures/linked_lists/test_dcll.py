@@ -0,0 +1,62 @@
+# @file     test_dcll.py
+# @brief    A file for testing the doubly circular linked list (DCLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from dcll import DCLL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def make(keys):
+    lst = DCLL(cmp_fn)
+    for key in keys:
+        lst.insert_tail(key)
+    return lst
+
+def test_cycle_wraps_around():
+    g = make([1, 2, 3]).cycle()
+    assert [next(g) for _ in range(7)] == [1, 2, 3, 1, 2, 3, 1]
+
+def test_cycle_advances_lazily():
+    lst = make([1, 2, 3])
+    g = lst.cycle()
+    assert next(g) == 1
+    assert lst.head.key == 1
+    assert next(g) == 2
+    assert lst.head.key == 2
+    g.close()
+    assert lst.head.key == 2
+
+def test_cycle_remove_current_does_not_skip():
+    lst = make([1, 2, 3, 4])
+    g = lst.cycle()
+    seen = []
+    for key in g:
+        seen.append(key)
+        if (key % 2 == 0):
+            lst.remove_current()
+        if (len(seen) == 6):
+            break
+    assert seen == [1, 2, 3, 4, 1, 3]
+    assert list(lst) == [3, 1]
+
+def test_cycle_respects_rotate():
+    lst = make([1, 2, 3, 4])
+    g = lst.cycle()
+    assert next(g) == 1
+    lst.rotate(2)
+    assert next(g) == 3
+    assert next(g) == 4
+
+def test_cycle_stops_once_emptied():
+    lst = make([1, 2])
+    seen = []
+    for key in lst.cycle():
+        seen.append(key)
+        lst.remove_current()
+    assert seen == [1, 2]
+    assert len(lst) == 0
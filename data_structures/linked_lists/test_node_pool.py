@@ -0,0 +1,101 @@
+# @file     test_node_pool.py
+# @brief    A file for testing the node pool & the lists that recycle into it
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import gc
+
+from dcll import DCLL
+from dll import DLL
+from node_pool import NodePool
+from scll import SCLL
+from sll import SLL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_acquire_recycles_released_nodes():
+    pool = NodePool(cap = 2)
+    node = pool.acquire(SLL.Node, 1)
+    assert (pool.misses, pool.hits) == (1, 0)
+    pool.release(node)
+    assert len(pool) == 1
+    assert pool.acquire(SLL.Node, 2) is node
+    assert node.key == 2
+    assert (pool.misses, pool.hits) == (1, 1)
+
+def test_release_respects_cap():
+    pool = NodePool(cap = 1)
+    pool.release(SLL.Node(1))
+    pool.release(SLL.Node(2))
+    assert len(pool) == 1
+
+def test_release_resets_the_node():
+    pool = NodePool()
+    dll = DLL(cmp_fn)
+    node = dll.insert_tail(1)
+    dll.insert_tail(2)
+    pool.release(node)
+    assert (node.key, node.next, node.prev) == (None, None, None)
+
+def test_sll_delete_returns_new_end_with_pool():
+    sll = SLL(cmp_fn, pool = NodePool())
+    for key in range(4):
+        sll.insert_tail(key)
+    node = sll.head
+    assert sll.delete_head() is sll.head
+    assert sll.delete_tail() is sll.tail
+    assert node.key is None
+    assert list(sll) == [1, 2]
+
+def test_sll_delete_returns_node_without_pool():
+    sll = SLL(cmp_fn)
+    for key in range(3):
+        sll.insert_tail(key)
+    node = sll.head
+    assert sll.delete_head() is sll.head
+    assert node.key == 0
+    assert sll.delete_tail() is sll.tail
+
+def test_dll_delete_returns_new_end_with_pool():
+    for weak_prev in (False, True):
+        pool = NodePool()
+        dll = DLL(cmp_fn, pool = pool, weak_prev = weak_prev)
+        for key in range(4):
+            dll.insert_tail(key)
+        assert dll.delete_head() is dll.head
+        assert dll.delete_tail() is dll.tail
+        assert len(pool) == 2
+        dll.insert_head(9)
+        assert pool.hits == 1
+        assert list(dll) == [9, 1, 2]
+
+def test_circular_lists_return_current_with_pool():
+    scll = SCLL(cmp_fn, pool = NodePool())
+    dcll = DCLL(cmp_fn, pool = NodePool())
+    for key in range(3):
+        scll.insert_tail(key)
+        dcll.insert_tail(key)
+    assert scll.remove_current() is scll.head
+    assert dcll.remove(dcll.head.next) is dcll.head
+    assert dcll.remove_current().key == 2
+    assert (len(scll), len(dcll)) == (2, 1)
+
+def test_clear_leaves_no_cycles_once_pool_is_full():
+    for weak_prev in (False, True):
+        pool = NodePool(cap = 10)
+        gc.collect()
+        gc.disable()
+        try:
+            dll = DLL(cmp_fn, pool = pool, weak_prev = weak_prev)
+            for key in range(1000):
+                dll.insert_tail(key)
+            dll.clear()
+            del dll
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+        assert len(pool) == 10
@@ -0,0 +1,72 @@
+# @file     test_skip_list.py
+# @brief    A file for testing the sorted skip list
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import bisect
+import random
+
+import pytest
+
+from skip_list import SkipList
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_rejects_bad_parameters():
+    with pytest.raises(TypeError):
+        SkipList(None)
+    with pytest.raises(ValueError):
+        SkipList(cmp_fn, p = 1)
+    with pytest.raises(TypeError):
+        SkipList(cmp_fn, max_level = 2.0)
+    with pytest.raises(ValueError):
+        SkipList(cmp_fn, max_level = 0)
+
+def test_matches_a_sorted_list():
+    rng = random.Random(0)
+    sl = SkipList(cmp_fn, seed = 0)
+    ref = []
+    for _ in range(3000):
+        key = rng.randrange(200)
+        if (rng.random() < 0.6):
+            sl.insert(key)
+            bisect.insort(ref, key)
+        else:
+            deleted = sl.delete(key)
+            if (key in ref):
+                assert deleted.key == key
+                ref.remove(key)
+            else:
+                assert deleted is None
+    assert len(sl) == len(ref)
+    assert list(sl) == ref
+    for key in range(200):
+        assert (key in sl) == (key in ref)
+        assert (sl.search(key) is not None) == (key in ref)
+
+def test_range_is_inclusive():
+    sl = SkipList(cmp_fn, seed = 1)
+    for key in range(0, 100, 5):
+        sl.insert(key)
+    assert list(sl.range(10, 30)) == [10, 15, 20, 25, 30]
+    assert list(sl.range(11, 14)) == []
+    assert list(sl.range(90, 1000)) == [90, 95]
+
+def test_equal_keys_keep_insertion_order():
+    sl = SkipList(lambda a, b: cmp_fn(a[0], b[0]), seed = 2)
+    for i in range(5):
+        sl.insert((1, i))
+    assert [key[1] for key in sl] == [0, 1, 2, 3, 4]
+    assert sl.delete((1, None)).key == (1, 0)
+
+def test_deleting_everything_empties_the_list():
+    sl = SkipList(cmp_fn, seed = 3)
+    for key in range(50):
+        sl.insert(key)
+    for key in range(50):
+        sl.delete(key)
+    assert sl.is_empty() and (len(sl) == 0) and (sl.level == 1)
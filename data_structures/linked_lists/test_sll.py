@@ -0,0 +1,183 @@
+# @file     test_sll.py
+# @brief    A file for testing the singly linked list (SLL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from sll import SLL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+@pytest.mark.parametrize("heuristic", [None, "mtf", "transpose", "count"])
+def test_contains_does_not_reorder(heuristic):
+    lst = SLL(cmp_fn, heuristic = heuristic)
+    for key in range(5):
+        lst.insert_tail(key)
+    assert 4 in lst
+    assert 7 not in lst
+    assert list(lst) == [0, 1, 2, 3, 4]
+    assert (lst.searches, lst.probes) == (0, 0)
+
+def test_search_still_reorders():
+    lst = SLL(cmp_fn, heuristic = "mtf")
+    for key in range(5):
+        lst.insert_tail(key)
+    lst.search(3)
+    assert list(lst) == [3, 0, 1, 2, 4]
+    assert lst.searches == 1
+
+
+def test_container_protocol_matches_a_list():
+    rng = random.Random(9)
+    lst, model = SLL(cmp_fn), []
+    for _ in range(2000):
+        op = rng.randrange(6)
+        if (op == 0):
+            key = rng.randrange(100)
+            lst.insert_head(key)
+            model.insert(0, key)
+        elif (op == 1):
+            key = rng.randrange(100)
+            lst.insert_tail(key)
+            model.append(key)
+        elif ((op == 2) and model):
+            lst.delete_head()
+            model.pop(0)
+        elif ((op == 3) and model):
+            lst.delete_tail()
+            model.pop()
+        elif ((op == 4) and model):
+            i = rng.randrange(-len(model), len(model))
+            assert lst[i] == model[i]
+        else:
+            assert [lst[i] for i in range(len(lst))] == model
+        assert len(lst) == len(model)
+    assert list(lst) == model
+    assert list(reversed(lst)) == model[::-1]
+    assert lst[1:-1:2] == model[1:-1:2]
+
+def test_getitem_errors():
+    lst = SLL(cmp_fn)
+    lst.insert_tail(1)
+    with pytest.raises(IndexError):
+        lst[1]
+    with pytest.raises(IndexError):
+        lst[-2]
+    with pytest.raises(TypeError):
+        lst["0"]
+
+def make(keys, cmp = cmp_fn):
+    lst = SLL(cmp)
+    for key in keys:
+        lst.insert_tail(key)
+    return lst
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 64, 257])
+def test_sort_is_stable(n):
+    rng = random.Random(n)
+    keys = [(rng.randrange(10), i) for i in range(n)]
+    lst = make(keys, lambda a, b: cmp_fn(a[0], b[0]))
+    lst.sort()
+    expected = sorted(keys, key = lambda key: key[0])
+    assert list(lst) == expected
+    assert list(reversed(lst)) == expected[::-1]
+    assert len(lst) == n
+    if (expected):
+        assert (lst.head.key, lst.tail.key) == (expected[0], expected[-1])
+
+def test_sort_with_another_cmp_fn():
+    lst = make([3, 1, 2])
+    lst.sort(lambda a, b: cmp_fn(b, a))
+    assert list(lst) == [3, 2, 1]
+    with pytest.raises(TypeError):
+        lst.sort(1)
+
+def test_merge_sorted_empties_other():
+    rng = random.Random(1)
+    left = sorted(rng.randrange(50) for _ in range(40))
+    right = sorted(rng.randrange(50) for _ in range(25))
+    lst, other = make(left), make(right)
+    lst.merge_sorted(other)
+    assert list(lst) == sorted(left + right)
+    assert list(reversed(lst)) == sorted(left + right, reverse = True)
+    assert len(lst) == 65
+    assert other.is_empty() and (len(other) == 0)
+    with pytest.raises(ValueError):
+        lst.merge_sorted(lst)
+    with pytest.raises(TypeError):
+        lst.merge_sorted([1])
+
+def node_at(lst, i):
+    node = lst.head
+    for _ in range(i):
+        node = node.next
+    return node
+
+def test_extend_appends_in_order():
+    lst = make([1, 2])
+    assert lst.extend(iter([3, 4, 5])).key == 5
+    assert lst.extend([]).key == 5
+    assert (list(lst), len(lst)) == ([1, 2, 3, 4, 5], 5)
+    assert list(reversed(lst)) == [5, 4, 3, 2, 1]
+    assert make([]).extend([]) is None
+
+def test_concat_moves_every_node():
+    lst, other = make([1, 2]), make([3, 4])
+    assert lst.concat(other).key == 4
+    assert (list(lst), len(lst)) == ([1, 2, 3, 4], 4)
+    assert list(reversed(lst)) == [4, 3, 2, 1]
+    assert other.is_empty() and (len(other) == 0)
+    empty = make([])
+    empty.concat(lst)
+    assert (list(empty), lst.is_empty()) == ([1, 2, 3, 4], True)
+    with pytest.raises(ValueError):
+        empty.concat(empty)
+
+def test_splice_matches_list_slicing():
+    rng = random.Random(4)
+    for _ in range(300):
+        src_keys = list(range(rng.randint(1, 8)))
+        dst_keys = list(range(100, 100 + rng.randint(0, 5)))
+        i = rng.randrange(len(src_keys))
+        j = rng.randrange(i, len(src_keys))
+        k = rng.randint(-1, len(dst_keys) - 1)
+        src, dst = make(src_keys), make(dst_keys)
+        count = rng.choice([None, j - i + 1])
+        after = None if (k < 0) else node_at(dst, k)
+        src.splice(node_at(src, i), node_at(src, j), dst, after, count)
+
+        run = src_keys[i:j + 1]
+        del src_keys[i:j + 1]
+        dst_keys[k + 1:k + 1] = run
+        for lst, keys in ((src, src_keys), (dst, dst_keys)):
+            assert (list(lst), len(lst)) == (keys, len(keys))
+            assert list(reversed(lst)) == keys[::-1]
+            assert (lst.tail is None) if (not keys) else (lst.tail.key == keys[-1])
+
+def test_splice_within_one_list():
+    lst = make([0, 1, 2, 3, 4, 5])
+    lst.splice(node_at(lst, 1), node_at(lst, 2), lst, node_at(lst, 4))
+    assert (list(lst), len(lst)) == ([0, 3, 4, 1, 2, 5], 6)
+    with pytest.raises(ValueError):
+        lst.splice(node_at(lst, 1), node_at(lst, 3), lst, node_at(lst, 2))
+    with pytest.raises(ValueError):
+        lst.splice(node_at(lst, 3), node_at(lst, 1), lst)
+
+def test_count_heuristic_keeps_hits_off_the_nodes():
+    lst = make([0, 1, 2, 3])
+    lst.heuristic = "count"
+    for key in (3, 3, 2, 3, 2, 1):
+        lst.search(key)
+    assert list(lst) == [3, 2, 1, 0]
+    assert not hasattr(lst.head, "count")
+    lst.delete_head()
+    assert sorted(lst._hits.values()) == [1, 2]
+    lst.heuristic = "mtf"
+    assert lst._hits == {}
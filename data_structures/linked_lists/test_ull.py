@@ -0,0 +1,89 @@
+# @file     test_ull.py
+# @brief    A file for testing the unrolled linked list (ULL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from ull import ULL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def chunks(lst):
+    sizes = []
+    curr = lst.head
+    while (curr != None):
+        sizes.append(len(curr.keys))
+        curr = curr.next
+    return sizes
+
+def test_rejects_bad_capacity():
+    with pytest.raises(TypeError):
+        ULL(cmp_fn, capacity = 2.0)
+    with pytest.raises(ValueError):
+        ULL(cmp_fn, capacity = 1)
+
+def test_matches_a_list_under_random_edits():
+    rng = random.Random(0)
+    lst = ULL(cmp_fn, capacity = 4)
+    ref = []
+    for step in range(2000):
+        op = rng.random()
+        if ((op < 0.4) or (not ref)):
+            i = rng.randint(0, len(ref))
+            lst.insert(i, step)
+            ref.insert(i, step)
+        elif (op < 0.55):
+            lst.insert_head(step)
+            ref.insert(0, step)
+        elif (op < 0.7):
+            lst.insert_tail(step)
+            ref.append(step)
+        elif (op < 0.9):
+            i = rng.randrange(len(ref))
+            assert lst.delete(i) == ref.pop(i)
+        elif (op < 0.95):
+            lst.delete_head()
+            ref.pop(0)
+        else:
+            lst.delete_tail()
+            ref.pop()
+
+        # NOTE: every node must stay non-empty & within `capacity`
+        assert all(0 < size <= 4 for size in chunks(lst))
+        assert len(lst) == len(ref)
+    assert list(lst) == ref
+    assert list(reversed(lst)) == ref[::-1]
+    assert [lst[i] for i in range(-len(ref), len(ref))] == ref + ref
+
+def test_getitem_out_of_range():
+    lst = ULL(cmp_fn)
+    lst.insert_tail(1)
+    with pytest.raises(IndexError):
+        lst[1]
+    with pytest.raises(IndexError):
+        lst[-2]
+
+def test_search_and_contains():
+    lst = ULL(cmp_fn, capacity = 2)
+    for key in range(10):
+        lst.insert_tail(key)
+    for mode in ('i', 'r'):
+        assert 7 in lst.search(7, mode).keys
+        assert lst.search(10, mode) is None
+    assert (3 in lst) and (10 not in lst)
+
+def test_reverse():
+    for mode in ('i', 'r'):
+        lst = ULL(cmp_fn, capacity = 3)
+        for key in range(10):
+            lst.insert_tail(key)
+        lst.reverse(mode)
+        assert list(lst) == list(range(9, -1, -1))
+        assert list(reversed(lst)) == list(range(10))
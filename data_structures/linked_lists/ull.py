@@ -0,0 +1,637 @@
+# @file     ull.py
+# @brief    A file for implementing an unrolled linked-list (ULL)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from enum import Enum
+
+# ---------------------------------------------------------------------------- #
+
+class ULL(object):
+    """
+    An INTERFACE for an unrolled linked-list (ULL), a doubly linked-list where
+    every node holds a CHUNK of up to `capacity` keys.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    class Node(object):
+        """
+        An Unrolled Linked-List (ULL) node, holding a CHUNK of keys.
+        """
+
+        def __init__(self, keys = None):
+            self._keys = [] if (keys is None) else keys
+            self._next = None
+            self._prev = None
+
+        @property
+        def keys(self):
+            """
+            A `list` of the DATA held by the ULL node, in list ORDER.
+            """
+            return self._keys
+
+        @keys.setter
+        def keys(self, new_keys):
+            self._keys = new_keys
+
+        @keys.deleter
+        def keys(self):
+            del self._keys
+
+        @property
+        def next(self):
+            """
+            A POINTER to a ULL successor node.
+            """
+            return self._next
+
+        @next.setter
+        def next(self, new_next):
+
+            # STEP 1: Ensure the `new_next` is of type `ULL.Node` or `None`
+            if (isinstance(new_next, ULL.Node) or (new_next is None)):
+                self._next = new_next
+                return
+
+            # STEP 2: `new_next` is an INAPPROPRIATE type
+            raise TypeError("`new_next` must be of TYPE `ULL.Node` or `None`")
+
+        @next.deleter
+        def next(self):
+            del self._next
+
+        @property
+        def prev(self):
+            """
+            A POINTER to a ULL predecessor node.
+            """
+            return self._prev
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # STEP 1: Ensure the `new_prev` is type `ULL.Node` or `None`
+            if (isinstance(new_prev, ULL.Node) or (new_prev is None)):
+                self._prev = new_prev
+                return
+
+            # STEP 2: `new_prev` is an INAPPROPRIATE type
+            raise TypeError("`new_prev` must be of TYPE `ULL.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, cmp_fn, capacity = 64):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Ensure `capacity` can be split into two non-empty halves
+        if (not isinstance(capacity, int)):
+            raise TypeError("`capacity` must be of TYPE `int`")
+        elif (capacity < 2):
+            raise ValueError("`capacity` must be at LEAST 2")
+
+        # STEP 3: Assign class attributes
+        self._cmp_fn = cmp_fn
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING ULL keys.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`
+            - `0`: if `v1` & `v2` are EQUAL
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @cmp_fn.setter
+    def cmp_fn(self, new_cmp_fn):
+
+        # STEP 1: Ensure `new_cmp_fn` is of type 'function'
+        if (not callable(new_cmp_fn)):
+            raise TypeError("`new_cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign the new comparison function
+        self._cmp_fn = new_cmp_fn
+
+    @cmp_fn.deleter
+    def cmp_fn(self):
+        del self._cmp_fn
+
+    @property
+    def capacity(self):
+        """
+        The MAXIMUM number of keys held by a single ULL node.
+        """
+        return self._capacity
+
+    @property
+    def head(self):
+        """
+        The FIRST node in the ULL.
+        """
+        return self._head
+
+    @head.setter
+    def head(self, new_head):
+
+        # STEP 1: Ensure the `new_head` is of TYPE `ULL.Node` or `None`
+        if (isinstance(new_head, ULL.Node) or (new_head is None)):
+            self._head = new_head
+            return
+
+        # STEP 2: `new_head` is an INAPPROPRIATE type
+        raise TypeError("`new_head` must be of TYPE `ULL.Node` or `None`")
+
+    @head.deleter
+    def head(self):
+        del self._head
+
+    @property
+    def tail(self):
+        """
+        The LAST node in the ULL.
+        """
+        return self._tail
+
+    @tail.setter
+    def tail(self, new_tail):
+
+        # STEP 1: Ensure the `new_tail` is of TYPE `ULL.Node` or `None`
+        if (isinstance(new_tail, ULL.Node) or (new_tail is None)):
+            self._tail = new_tail
+            return
+
+        # STEP 2: `new_tail` is an inappropriate type
+        raise TypeError("`new_tail` must be of TYPE `ULL.Node` or `None`")
+
+    @tail.deleter
+    def tail(self):
+        del self._tail
+
+    def is_empty(self):
+        """
+        CHECKS if the ULL is empty.
+
+        :Return:
+            - `True`: if the ULL is empty
+            - `False`: if the ULL is NOT empty
+        """
+        return ((self.head == None) and (self.tail == None))
+
+    def __len__(self):
+        """
+        RETRIEVES the number of keys in the ULL in O(1).
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        YIELDS every key in the ULL from the HEAD to the TAIL.
+        """
+        curr = self.head
+        while (curr != None):
+            yield from curr.keys
+            curr = curr.next
+
+    def __reversed__(self):
+        """
+        YIELDS every key in the ULL from the TAIL to the HEAD.
+        """
+        curr = self.tail
+        while (curr != None):
+            yield from reversed(curr.keys)
+            curr = curr.prev
+
+    def __contains__(self, target_key):
+        """
+        CHECKS if any ULL key MATCHES `target_key` via `cmp_fn`.
+        """
+        return (self.search(target_key) != None)
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the key at index `i`, skipping over whole nodes at a time.
+
+        :Parameters:
+            - `i`: an `int` index (negative counts from the TAIL)
+
+        :Return:
+            The KEY at index `i`
+        """
+        node, offset = self.__locate(i)
+        return node.keys[offset]
+
+    def __locate(self, i):
+        """
+        FINDS the ULL node & the offset within it that hold index `i`.
+
+        :Parameters:
+            - `i`: an `int` index (negative counts from the TAIL)
+
+        :Return:
+            A `(node, offset)` PAIR
+        """
+
+        # STEP 1: Ensure `i` is within the ULL
+        if (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int`")
+        if (i < 0):
+            i += self._size
+        if ((i < 0) or (i >= self._size)):
+            raise IndexError("ULL index out of range")
+
+        # CASE A: `i` is in the 1st half, skip nodes FORWARDS from the HEAD
+        if (i < self._size // 2):
+            curr = self.head
+            while (i >= len(curr.keys)):
+                i -= len(curr.keys)
+                curr = curr.next
+            return curr, i
+
+        # CASE B: `i` is in the 2nd half, skip nodes BACKWARDS from the TAIL
+        i = self._size - 1 - i
+        curr = self.tail
+        while (i >= len(curr.keys)):
+            i -= len(curr.keys)
+            curr = curr.prev
+        return curr, len(curr.keys) - 1 - i
+
+    def __link_after(self, node, new_node):
+        """
+        LINKS `new_node` directly after `node`, or as the HEAD if `node` is
+        `None`.
+        """
+
+        # CASE A: `new_node` becomes the new HEAD node
+        if (node is None):
+            new_node.next = self.head
+            if (self.head != None):
+                self.head.prev = new_node
+            self.head = new_node
+
+        # CASE B: `new_node` goes after an existing node
+        else:
+            new_node.prev = node
+            new_node.next = node.next
+            if (node.next != None):
+                node.next.prev = new_node
+            node.next = new_node
+
+        # STEP 2: Adjust the TAIL if `new_node` went after it
+        if (new_node.next is None):
+            self.tail = new_node
+
+    def __unlink(self, node):
+        """
+        UNLINKS an (empty or merged) `node` from the ULL.
+        """
+        if (node.prev != None):
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if (node.next != None):
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.next = node.prev = None
+
+    def __rebalance(self, node):
+        """
+        MERGES or REFILLS `node` after a deletion left it less than HALF full,
+        so the ULL never degrades into a list of near-empty nodes.
+
+        :Parameters:
+            - `node`: the ULL node that a key was deleted from
+        """
+
+        # CASE A: `node` is EMPTY, unlink it entirely
+        if (not node.keys):
+            self.__unlink(node)
+            return
+
+        # CASE B: `node` is still at LEAST half full, or has NO successor
+        successor = node.next
+        if ((len(node.keys) >= self.capacity // 2) or (successor is None)):
+            return
+
+        # CASE C: Both nodes fit in ONE node, merge the successor in
+        if (len(node.keys) + len(successor.keys) <= self.capacity):
+            node.keys.extend(successor.keys)
+            self.__unlink(successor)
+
+        # CASE D: Borrow keys from the successor until `node` is half full
+        else:
+            borrow = self.capacity // 2 - len(node.keys)
+            node.keys.extend(successor.keys[:borrow])
+            del successor.keys[:borrow]
+
+    def insert_head(self, new_key):
+        """
+        INSERTS a new FIRST key in the ULL.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be inserted at the HEAD of the ULL
+
+        :Return:
+            A POINTER to the ULL HEAD node holding `new_key`
+        """
+
+        # STEP 1: Start a new HEAD node if the current one is FULL
+        if ((self.head is None) or (len(self.head.keys) >= self.capacity)):
+            self.__link_after(None, ULL.Node())
+
+        # STEP 2: Insert the key at the FRONT of the HEAD node
+        self.head.keys.insert(0, new_key)
+        self._size += 1
+        return self.head
+
+    def insert_tail(self, new_key):
+        """
+        INSERTS a new LAST key in the ULL.
+
+        :Parameters:
+            - `new_key`: the INFORMATION to be inserted at the TAIL of the ULL
+
+        :Return:
+            A POINTER to the ULL TAIL node holding `new_key`
+        """
+
+        # STEP 1: Start a new TAIL node if the current one is FULL
+        if ((self.tail is None) or (len(self.tail.keys) >= self.capacity)):
+            self.__link_after(self.tail, ULL.Node())
+
+        # STEP 2: Insert the key at the END of the TAIL node
+        self.tail.keys.append(new_key)
+        self._size += 1
+        return self.tail
+
+    def insert(self, i, new_key):
+        """
+        INSERTS `new_key` so that it ends up at index `i`, SPLITTING the
+        target node in half if it is already full.
+
+        :Parameters:
+            - `i`: the INDEX the new key will have (`len(ULL)` appends)
+            - `new_key`: the INFORMATION to be inserted
+
+        :Return:
+            A POINTER to the ULL node holding `new_key`
+        """
+
+        # CASE A: Inserting at the very END of the ULL
+        if (i == self._size):
+            return self.insert_tail(new_key)
+
+        # STEP 1: Find the node & offset currently at index `i`
+        node, offset = self.__locate(i)
+
+        # STEP 2: Split a FULL node, moving it's 2nd half into a new node
+        if (len(node.keys) >= self.capacity):
+            half = len(node.keys) // 2
+            self.__link_after(node, ULL.Node(node.keys[half:]))
+            del node.keys[half:]
+            if (offset > half):
+                node, offset = node.next, offset - half
+
+        # STEP 3: Insert the key within the node
+        node.keys.insert(offset, new_key)
+        self._size += 1
+        return node
+
+    def delete_head(self):
+        """
+        DELETES the FIRST key of the ULL.
+
+        :Return:
+            - A POINTER to the new ULL HEAD node, OR
+            - `None`: if the ULL has NO keys to delete
+        """
+
+        # STEP 1: Check if the ULL is empty
+        if (self.is_empty()):
+            return None
+
+        # STEP 2: Remove the key & unlink the HEAD node once it is empty
+        del self.head.keys[0]
+        self._size -= 1
+        if (not self.head.keys):
+            self.__unlink(self.head)
+        return self.head
+
+    def delete_tail(self):
+        """
+        DELETES the LAST key of the ULL.
+
+        :Return:
+            - A POINTER to the new ULL TAIL node, OR
+            - `None`: if the ULL has NO keys to delete
+        """
+
+        # STEP 1: Check if the ULL is empty
+        if (self.is_empty()):
+            return None
+
+        # STEP 2: Remove the key & unlink the TAIL node once it is empty
+        self.tail.keys.pop()
+        self._size -= 1
+        if (not self.tail.keys):
+            self.__unlink(self.tail)
+        return self.tail
+
+    def delete(self, i):
+        """
+        DELETES the key at index `i`, MERGING the node with it's successor
+        if it falls below half full.
+
+        :Parameters:
+            - `i`: the INDEX of the key to be deleted
+
+        :Return:
+            The deleted KEY
+        """
+
+        # STEP 1: Find the node & offset at index `i` & remove the key
+        node, offset = self.__locate(i)
+        key = node.keys.pop(offset)
+        self._size -= 1
+
+        # STEP 2: Merge or refill the node if it is now under-full
+        self.__rebalance(node)
+        return key
+
+    def __iterative_search(self, target_key):
+        """
+        ITERATIVELY searches the ULL & returns the node holding a key that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ULL
+
+        :Return:
+            - A POINTER to the ULL node holding the matching key, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # STEP 1: Linear search every chunk up to the TAIL node
+        cmp_fn = self.cmp_fn
+        equal = ULL.CMPValues.EQUAL.value
+        curr = self.head
+        while (curr):
+
+            # STEP 2: Scan the node's keys as one contiguous chunk
+            for key in curr.keys:
+                if (cmp_fn(key, target_key) == equal):
+                    return curr
+
+            # STEP 3: NO match detected, move to the next node
+            curr = curr.next
+
+        # STEP 4: Indicate that NO matches were detected
+        return None
+
+    def __recursive_search(self, target_key, self_head):
+        """
+        RECURSIVELY searches the ULL & returns the node holding a key that
+        MATCHES the target search data.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ULL
+            - `self_head`: is the CURRENT instance's head node (i.e. self.head)
+
+        :Return:
+            - A POINTER to the ULL node holding the matching key, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # BASE CASE 1: Went beyond the TAIL node OR ZERO nodes remain
+        if (not self_head):
+            return None
+
+        # BASE CASE 2: Found a match within the node
+        for key in self_head.keys:
+            if (self.cmp_fn(key, target_key) == ULL.CMPValues.EQUAL.value):
+                return self_head
+
+        # RECURSIVE CASE: Still more ULL nodes to search
+        return self.__recursive_search(target_key, self_head.next)
+
+    def search(self, target_key, mode = 'i'):
+        """
+        SEARCHES the ULL & returns the node holding the 1st key that MATCHES
+        the target search key.
+
+        :Parameters:
+            - `target_key`: is the DESIRED search data to be queried in the ULL
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the ULL search is conducted iteratively 'i' (default), or
+              recursively 'r'
+
+        :Return:
+            - A POINTER to the ULL node holding the matching key, OR
+            - `None`: to indicate that NO matches were found
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE search method
+        elif (mode == 'i'):
+            return self.__iterative_search(target_key)
+
+        # CASE C: Use the RECURSIVE search method
+        elif (mode == 'r'):
+            return self.__recursive_search(target_key, self.head)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+    def __iterative_reverse(self):
+        """
+        ITERATIVELY reverses the key ORDER in a ULL.
+        """
+
+        # STEP 1: Initialise the POINTER variables
+        curr = self.head
+        self.head = self.tail
+        self.tail = curr
+
+        # STEP 2: Swap the links & reverse the chunk of every node
+        while (curr != None):
+            next = curr.next
+            curr.next = curr.prev
+            curr.prev = next
+            curr.keys.reverse()
+            curr = next
+
+    def __recursive_reverse(self, self_head):
+        """
+        RECURSIVELY reverses the key ORDER in a ULL.
+
+        :Parameters:
+            - `self_head`: is the CURRENT instance's head node (i.e. self.head)
+        """
+
+        # BASE CASE: ULL is EMPTY or has FINISHED reversing
+        if (self_head == None):
+            self.head, self.tail = self.tail, self.head
+            return
+
+        # RECURSIVE CASE: Swap the links & reverse the chunk of the node
+        next_node = self_head.next
+        self_head.next = self_head.prev
+        self_head.prev = next_node
+        self_head.keys.reverse()
+        self.__recursive_reverse(next_node)
+
+    def reverse(self, mode = 'i'):
+        """
+        REVERSES the key order of the ULL.
+
+        :Parameters:
+            - `mode` (optional): a SINGLE character `str` that indicates if
+              the ULL reversal is conducted iteratively 'i' (default),
+              or recursively 'r'
+        """
+
+        # CASE A: Mode is an INAPPROPRIATE type
+        if (not isinstance(mode, str)):
+            raise TypeError("`mode` must of TYPE `str`")
+
+        # CASE B: Use the ITERATIVE reverse method
+        elif (mode == 'i'):
+            self.__iterative_reverse()
+
+        # CASE C: Use the RECURSIVE reverse method
+        elif (mode == 'r'):
+            self.__recursive_reverse(self.head)
+
+        # CASE D: Mode is an INAPPROPRIATE value
+        else:
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
@@ -4,82 +4,374 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
-class ArrQueue(object):
+import queue
+import threading
+from array import array
+
+from overflow_policy import OverflowPolicy
+
+# ---------------------------------------------------------------------------- #
+
+class ArrQueue(OverflowPolicy):
     """
-    An INTERFACE for an array-based queue.
+    An INTERFACE for an array-based queue, implemented as a growable CIRCULAR
+    buffer: the FRONT & BACK of the queue are indices that wrap around the
+    array, so neither end ever shifts the items in between. With a
+    `typecode`, the items are stored UNBOXED in a typed `array`. With
+    `max_items`, the queue is BOUNDED & sheds load as per it's `overflow`
+    policy once full (see `OverflowPolicy`).
     """
 
-    def __init__(self):
-        self._arr = []
+    def __init__(self, capacity = 8, shrink = False, typecode = None,
+                 max_items = None, overflow = "reject"):
+
+        # STEP 1: Ensure `capacity` is a positive `int`
+        if (not isinstance(capacity, int)):
+            raise TypeError("`capacity` must be of TYPE `int`")
+        elif (capacity < 1):
+            raise ValueError("`capacity` must be at LEAST 1")
+
+        # STEP 2: Ensure `shrink` is a `bool`
+        if (not isinstance(shrink, bool)):
+            raise TypeError("`shrink` must be of TYPE `bool`")
+
+        # STEP 3: Ensure `typecode` (if any) is a numeric `array` typecode
+        if ((typecode is not None) and (not isinstance(typecode, str))):
+            raise TypeError("`typecode` must be of TYPE `str` or `None`")
+        elif ((typecode is not None) and (typecode not in "bBhHiIlLqQfd")):
+            raise ValueError("`typecode` must be a numeric `array` typecode")
+
+        # STEP 4: Validate & assign the overflow policy
+        OverflowPolicy.__init__(self, max_items, overflow)
+
+        # STEP 5: Assign class attributes, `_head` indexes the FRONT item
+        #         & `_tail` the slot the next item is written to
+        self._min_capacity = capacity
+        self._shrink = shrink
+        self._typecode = typecode
+        self._arr = self.__blank(capacity)
+        self._head = 0
+        self._tail = 0
+        self._size = 0
 
     def len(self):
+        return self._size
+
+    def __len__(self):
+        """
+        RETRIEVES the number of items in the queue in O(1).
+        """
+        return self._size
+
+    @property
+    def capacity(self):
+        """
+        The number of SLOTS in the circular buffer.
+        """
         return len(self._arr)
 
+    @property
+    def shrink(self):
+        """
+        CHECKS if the buffer HALVES once it is a quarter full.
+        """
+        return self._shrink
+
+    @property
+    def typecode(self):
+        """
+        The `array` typecode of the buffer, or `None` if it is a `list` of
+        boxed objects.
+        """
+        return self._typecode
+
+    def __blank(self, n):
+        """
+        CREATES `n` empty slots of the same TYPE as the buffer.
+        """
+        if (self._typecode is None):
+            return [None] * n
+        return array(self._typecode, [0]) * n
+
+    def _items(self, values):
+        """
+        CONVERTS an iterable of `values` into the same TYPE as the buffer.
+        Protected (rather than private) as `SyncArrQueue` builds it's empty
+        batches with it.
+        """
+        if (self._typecode is None):
+            return list(values)
+        return array(self._typecode, values)
+
     @property
     def arr(self):
         """
-        The ARRAY implemented as a QUEUE.
+        A COPY of the items in the queue, from the FRONT to the BACK, as a
+        `list` (or a typed `array` if there is a `typecode`).
         """
-        return self._arr
-    
+        return self.__unwrapped()
+
     @arr.setter
-    def arr(self, i, new_value):
+    def arr(self, new_arr):
         """
-        REPLACES the value at index `i` with `new_value`.
+        REPLACES the contents of the queue with the items of `new_arr`, the
+        1st item being the FRONT of the queue.
 
         :Parameters:
-            - `i`: the INDEX to access the queue
-            - `new_value`: the item to replace value at index `i`
+            - `new_arr`: an ITERABLE of the new items
+
+        :Raises:
+            - `ValueError`: if `new_arr` holds MORE than `max_items` items
         """
-        self._arr[i % self.len()] = new_value
+
+        # STEP 1: Ensure a BOUNDED queue can hold every item
+        items = self._items(new_arr)
+        if ((self._max_items is not None) and (len(items) > self._max_items)):
+            raise ValueError("`new_arr` must NOT hold more than `max_items` items")
+
+        # STEP 2: Copy the items to the START of a new buffer
+        self.__reset(items, max(self._min_capacity - len(items), 1))
+        if (self._size > self._high_water):
+            self._high_water = self._size
 
     @arr.deleter
     def arr(self):
         """
         RESETS the array to ZERO elements.
         """
-        self._arr = []
+        self.__reset(self._items(()), self._min_capacity)
+
+    def __unwrapped(self):
+        """
+        COPIES the items out of the buffer, from the FRONT to the BACK. Kept
+        apart from the `arr` getter, which `SyncArrQueue` wraps in it's lock.
+        """
+        end = self._head + self._size
+        if (end <= len(self._arr)):
+            return self._arr[self._head:end]
+        return self._arr[self._head:] + self._arr[:self._tail]
+
+    def __reset(self, items, spare):
+        """
+        REPLACES the buffer with `items` followed by `spare` empty slots.
+        """
+        self._arr = items + self.__blank(spare)
+        self._head, self._tail, self._size = 0, len(items), len(items)
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the item `i` places from the FRONT (negative `i` counts
+        from the BACK) in O(1).
+        """
+        return self._arr[self.__slot(i)]
+
+    def __setitem__(self, i, new_value):
+        """
+        REPLACES the item `i` places from the FRONT (negative `i` counts from
+        the BACK) with `new_value` in O(1).
+        """
+        self._arr[self.__slot(i)] = new_value
+
+    def __slot(self, i):
+        """
+        CONVERTS a queue index into a buffer slot, raising an `IndexError`
+        if it is out of range.
+        """
+        if (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int`")
+        if (i < 0):
+            i += self._size
+        if ((i < 0) or (i >= self._size)):
+            raise IndexError("ArrQueue index out of range")
+        return (self._head + i) % len(self._arr)
+
+    def __resize(self, new_capacity):
+        """
+        MOVES the items into a new buffer of `new_capacity` slots in O(n),
+        UNWRAPPING them so the FRONT item sits at slot 0.
+        """
+        items = self.__unwrapped()
+        self._arr = items + self.__blank(new_capacity - self._size)
+        self._head = 0
+        self._tail = self._size % new_capacity
 
     def enqueue(self, new_value):
         """
-        ADDS a `new_value` at the END of the queue.
+        ADDS a `new_value` at the END of the queue in amortized O(1), doubling
+        the buffer when it is full (but never beyond `max_items`). If the
+        queue already holds `max_items` items, the `overflow` policy applies.
 
         :Parameters:
             - `new_value`: the item to be added at the END of the queue
 
         :Return:
-            The NEWLY added LAST item in the queue
-        """
+            - The NEWLY added LAST item in the queue, OR
+            - `None`: if the queue is FULL & `new_value` got dropped
 
-        # STEP 1: Add the value at the END of the queue
-        self.arr.append(new_value)
+        :Raises:
+            - `OverflowError`: if the queue is FULL & `overflow` is 'reject'
+        """
 
-        # STEP 2: Return the newly LAST item of the queue
-        return self.arr[self.len() - 1]
+        # STEP 1: If the queue is FULL, shed load as per the overflow policy
+        #         (via `ArrQueue.dequeue`, as a subclass may wrap it in a lock)
+        if (not self._has_room()):
+            if (self._shed()):
+                return None
+            ArrQueue.dequeue(self)
+
+        # STEP 2: Grow the buffer if every slot is in use
+        if (self._size == len(self._arr)):
+            if (self._max_items is None):
+                self.__resize(2 * len(self._arr))
+            else:
+                self.__resize(min(2 * len(self._arr), self._max_items))
+
+        # STEP 3: Write the value at the BACK & wrap the tail index
+        self._arr[self._tail] = new_value
+        self._tail = (self._tail + 1) % len(self._arr)
+        self._size += 1
+        if (self._size > self._high_water):
+            self._high_water = self._size
+
+        # STEP 4: Return the newly LAST item of the queue
+        return new_value
 
     def dequeue(self):
         """
-        REMOVES the item at the FRONT of the queue.
+        REMOVES the item at the FRONT of the queue in amortized O(1). If
+        `shrink` is set, the buffer is HALVED once it is a quarter full (but
+        never below it's initial capacity).
 
         :Return:
             - The NEW & LAST item in the queue, OR
             - `None`: if the queue is EMPTY
         """
-        
+
         # STEP 1: Check of the queue is EMPTY
-        if (self.len() == 0):
+        if (self._size == 0):
             return None
 
-        # STEP 2: Delete the FIRST item
-        self.arr.pop(0)
+        # STEP 2: Clear the FIRST slot (so a boxed item can be freed) & wrap
+        #         the head index
+        if (self._typecode is None):
+            self._arr[self._head] = None
+        self._head = (self._head + 1) % len(self._arr)
+        self._size -= 1
 
-        # STEP 3A: Only return the LASY item if non-empty
-        if (self.len() > 0):
-            return self.arr[self.len() - 1]
-        
-        # STEP 3B: Indicate the queue is now empty after the pop
+        # STEP 3: Shrink the buffer if it is mostly EMPTY
+        if ((self._shrink) and (self._size <= len(self._arr) // 4)
+            and (len(self._arr) // 2 >= self._min_capacity)):
+            self.__resize(len(self._arr) // 2)
+
+        # STEP 4A: Only return the LAST item if non-empty
+        if (self._size > 0):
+            return self._arr[(self._tail - 1) % len(self._arr)]
+
+        # STEP 4B: Indicate the queue is now empty after the dequeue
         return None
 
+    def enqueue_many(self, values):
+        """
+        ADDS every item of `values` at the END of the queue, copying them in
+        at most 2 SLICES rather than one item at a time. A BOUNDED queue
+        adds them one at a time instead, applying `overflow` to each.
+
+        :Parameters:
+            - `values`: an ITERABLE (e.g. a typed `array`) of the items to be
+              added, in order
+
+        :Return:
+            The number of items added
+        """
+
+        # CASE A: A BOUNDED queue, apply the overflow policy to every item
+        if (self._max_items is not None):
+            count = 0
+            for value in values:
+                dropped = self._dropped
+                self.enqueue(value)
+                if ((self._overflow != "drop_newest") or (self._dropped == dropped)):
+                    count += 1
+            return count
+
+        # STEP 1: Convert the values & grow the buffer until they all fit
+        items = self._items(values)
+        count = len(items)
+        capacity = len(self._arr)
+        while (self._size + count > capacity):
+            capacity *= 2
+        if (capacity != len(self._arr)):
+            self.__resize(capacity)
+
+        # STEP 2: Copy up to the END of the buffer, then wrap to the START
+        first = min(count, capacity - self._tail)
+        self._arr[self._tail:self._tail + first] = items[:first]
+        self._arr[:count - first] = items[first:]
+        self._tail = (self._tail + count) % capacity
+        self._size += count
+        if (self._size > self._high_water):
+            self._high_water = self._size
+        return count
+
+    def dequeue_many(self, n):
+        """
+        REMOVES up to `n` items from the FRONT of the queue, copying them out
+        in at most 2 SLICES rather than one item at a time.
+
+        :Parameters:
+            - `n`: the MAXIMUM number of items to be removed
+
+        :Return:
+            The removed items, from the FRONT to the BACK, as a `list` (or a
+            typed `array` if there is a `typecode`)
+        """
+
+        # STEP 1: Ensure `n` is a non-negative `int`
+        if (not isinstance(n, int)):
+            raise TypeError("`n` must be of TYPE `int`")
+        elif (n < 0):
+            raise ValueError("`n` must be at LEAST 0")
+
+        # STEP 2: Copy the items out, up to the END of the buffer & then
+        #         wrapping to the START
+        n = min(n, self._size)
+        capacity = len(self._arr)
+        first = min(n, capacity - self._head)
+        items = self._arr[self._head:self._head + first] + self._arr[:n - first]
+
+        # STEP 3: Clear the slots (so boxed items can be freed)
+        if (self._typecode is None):
+            self._arr[self._head:self._head + first] = self.__blank(first)
+            self._arr[:n - first] = self.__blank(n - first)
+        self._head = (self._head + n) % capacity
+        self._size -= n
+
+        # STEP 4: Shrink the buffer if it is mostly EMPTY
+        while ((self._shrink) and (self._size <= len(self._arr) // 4)
+               and (len(self._arr) // 2 >= self._min_capacity)):
+            self.__resize(len(self._arr) // 2)
+        return items
+
+    def view(self):
+        """
+        EXPOSES the items of a TYPED queue, from the FRONT to the BACK, as a
+        zero-copy `memoryview` of the buffer. If the items wrap around the
+        end of the buffer they are first unwrapped in place (a one-off O(n)
+        copy). The view is only valid until the queue is next modified.
+
+        :Return:
+            A `memoryview` of the live items
+        """
+
+        # STEP 1: Ensure the buffer is a typed `array`
+        if (self._typecode is None):
+            raise TypeError("`view` requires the queue to have a `typecode`")
+
+        # STEP 2: Make the items contiguous, then slice the buffer
+        if (self._head + self._size > len(self._arr)):
+            self.__resize(len(self._arr))
+        return memoryview(self._arr)[self._head:self._head + self._size]
+
     def __iterative_search(self, target_value):
         """
         ITERATIVELY searches the queue for the 1st instance that matches 
@@ -97,8 +389,8 @@ class ArrQueue(object):
         for i in range(0, self.len()):
 
             # STEP 2: Return the instance if MATCHED
-            if (self.arr[i] == target_value):
-                return self.arr[i]
+            if (self[i] == target_value):
+                return self[i]
 
         # STEP 3: Indicate that no matches were found
         return None
@@ -122,8 +414,8 @@ class ArrQueue(object):
             return None
 
         # BASE CASE 2: A match was found
-        if (self.arr[i] == target_value):
-            return self.arr[i]
+        if (self[i] == target_value):
+            return self[i]
 
         # RECURSIVE CASE: more items to traverse
         return self.__recursive_search(target_value, i + 1)
@@ -157,4 +449,248 @@ class ArrQueue(object):
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
-            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
\ No newline at end of file
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+# ---------------------------------------------------------------------------- #
+
+class SyncArrQueue(ArrQueue):
+    """
+    A THREAD-SAFE, blocking variant of the `ArrQueue`, for many producer &
+    consumer threads. Every method that reads or changes the items holds
+    ONE internal lock (bar indexing & `view`, which expose a single slot &
+    the live buffer), `get` & `put` can wait for an item or a free slot, &
+    `drain` empties a whole batch for the cost of a SINGLE lock acquisition.
+    """
+
+    def __init__(self, capacity = 8, shrink = False, typecode = None, maxsize = 0):
+
+        # STEP 1: Ensure `maxsize` is a non-negative `int` (0 is unbounded)
+        if (not isinstance(maxsize, int)):
+            raise TypeError("`maxsize` must be of TYPE `int`")
+        elif (maxsize < 0):
+            raise ValueError("`maxsize` must be at LEAST 0")
+
+        # STEP 2: Initialise the queue, then the lock & it's 2 conditions
+        super().__init__(capacity, shrink, typecode)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def maxsize(self):
+        """
+        The MAXIMUM number of items in the queue, or 0 if unbounded.
+        """
+        return self._maxsize
+
+    def qsize(self):
+        """
+        RETRIEVES the number of items in the queue.
+        """
+        with self._lock:
+            return self._size
+
+    def __len__(self):
+        return self.qsize()
+
+    def full(self):
+        """
+        CHECKS if the queue holds `maxsize` items (NEVER if unbounded).
+        """
+        with self._lock:
+            return (0 < self._maxsize <= self._size)
+
+    def __wait(self, condition, ready, block, timeout):
+        """
+        WAITS on `condition` (with the lock HELD) until `ready()` is true.
+
+        :Return:
+            - `True`: if `ready()` is true, OR
+            - `False`: if `block` is `False` or `timeout` seconds expired
+        """
+        if (ready()):
+            return True
+        elif (not block):
+            return False
+        elif ((timeout is not None) and (timeout < 0)):
+            raise ValueError("`timeout` must be a NON-negative number")
+        return condition.wait_for(ready, timeout)
+
+    def enqueue(self, new_value):
+        """
+        ADDS a `new_value` at the END of the queue WITHOUT checking `maxsize`
+        (see `put`).
+        """
+        with self._lock:
+            result = super().enqueue(new_value)
+            self._not_empty.notify()
+            return result
+
+    def dequeue(self):
+        """
+        REMOVES the item at the FRONT of the queue WITHOUT blocking (see
+        `get`), with the same return value as `ArrQueue.dequeue`.
+        """
+        with self._lock:
+            if (self._size == 0):
+                return None
+            result = super().dequeue()
+            self._not_full.notify()
+            return result
+
+    def enqueue_many(self, values):
+        """
+        ADDS every item of `values` at the END of the queue under ONE lock
+        acquisition, WITHOUT checking `maxsize`.
+        """
+        with self._lock:
+            count = super().enqueue_many(values)
+            self._not_empty.notify(count)
+            return count
+
+    def dequeue_many(self, n):
+        """
+        REMOVES up to `n` items from the FRONT of the queue under ONE lock
+        acquisition, WITHOUT blocking (see `drain`).
+        """
+        with self._lock:
+            items = super().dequeue_many(n)
+            self._not_full.notify(len(items))
+            return items
+
+    @property
+    def arr(self):
+        """
+        A COPY of the items in the queue, taken under the lock.
+        """
+        with self._lock:
+            return ArrQueue.arr.fget(self)
+
+    @arr.setter
+    def arr(self, new_arr):
+        """
+        REPLACES the contents of the queue under the lock, WITHOUT checking
+        `maxsize`, & wakes EVERY waiting thread.
+        """
+        with self._lock:
+            ArrQueue.arr.fset(self, new_arr)
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    @arr.deleter
+    def arr(self):
+        """
+        EMPTIES the queue under the lock & wakes EVERY waiting producer.
+        """
+        with self._lock:
+            ArrQueue.arr.fdel(self)
+            self._not_full.notify_all()
+
+    def search(self, target_value, mode = 'i'):
+        """
+        SEARCHES for the 1st instance that matches `target_value` under the
+        lock, see `ArrQueue.search`.
+        """
+        with self._lock:
+            return super().search(target_value, mode)
+
+    def put(self, new_value, block = True, timeout = None):
+        """
+        ADDS a `new_value` at the END of the queue, waiting for a free slot
+        while the queue is FULL (i.e. applying BACKPRESSURE to producers).
+
+        :Parameters:
+            - `new_value`: the item to be added at the END of the queue
+            - `block` (optional): if `False`, NEVER wait (default `True`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Raises:
+            - `queue.Full`: if NO slot was freed in time
+        """
+        with self._not_full:
+
+            # STEP 1: Wait until there is room for the item
+            if (not self.__wait(self._not_full, self.__has_room, block, timeout)):
+                raise queue.Full
+
+            # STEP 2: Add the item & wake a waiting consumer
+            super().enqueue(new_value)
+            self._not_empty.notify()
+
+    def get(self, block = True, timeout = None):
+        """
+        REMOVES & returns the item at the FRONT of the queue, waiting for an
+        item while the queue is EMPTY.
+
+        :Parameters:
+            - `block` (optional): if `False`, NEVER wait (default `True`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Return:
+            The item at the FRONT of the queue
+
+        :Raises:
+            - `queue.Empty`: if NO item arrived in time
+        """
+        with self._not_empty:
+
+            # STEP 1: Wait until there is an item
+            if (not self.__wait(self._not_empty, self.__has_items, block, timeout)):
+                raise queue.Empty
+
+            # STEP 2: Take the FRONT item & wake a waiting producer
+            item = self[0]
+            super().dequeue()
+            self._not_full.notify()
+            return item
+
+    def drain(self, max_items = None, block = False, timeout = None):
+        """
+        REMOVES up to `max_items` items from the FRONT of the queue under a
+        SINGLE lock acquisition, rather than one acquisition per item.
+
+        :Parameters:
+            - `max_items` (optional): the MAXIMUM number of items to remove,
+              or `None` (default) for every item
+            - `block` (optional): if `True`, wait for at LEAST one item
+              (default `False`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Return:
+            The removed items from the FRONT to the BACK (EMPTY if none
+            arrived in time)
+        """
+
+        # STEP 1: Ensure `max_items` (if any) is a non-negative `int`
+        if ((max_items is not None) and (not isinstance(max_items, int))):
+            raise TypeError("`max_items` must be of TYPE `int` or `None`")
+        elif ((max_items is not None) and (max_items < 0)):
+            raise ValueError("`max_items` must be at LEAST 0")
+
+        with self._not_empty:
+
+            # STEP 2: Wait (if asked) until there is an item
+            if (not self.__wait(self._not_empty, self.__has_items, block, timeout)):
+                return self._items(())
+
+            # STEP 3: Remove the whole batch & wake EVERY waiting producer
+            n = self._size if (max_items is None) else min(max_items, self._size)
+            items = super().dequeue_many(n)
+            self._not_full.notify_all()
+            return items
+
+    def __has_items(self):
+        """
+        CHECKS (with the lock HELD) if the queue has at LEAST one item.
+        """
+        return (self._size > 0)
+
+    def __has_room(self):
+        """
+        CHECKS (with the lock HELD) if the queue has room for one more item.
+        """
+        return ((self._maxsize == 0) or (self._size < self._maxsize))
@@ -4,41 +4,90 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
+from array import array
+
+# ---------------------------------------------------------------------------- #
+
 class ArrStack(object):
     """
-    An INTERFACE for an array-based stack.
+    An INTERFACE for an array-based stack. With a `typecode`, the items are
+    stored UNBOXED in a typed `array`.
     """
 
-    def __init__(self):
-        self._arr = []
+    def __init__(self, typecode = None):
+
+        # STEP 1: Ensure `typecode` (if any) is a numeric `array` typecode
+        if ((typecode is not None) and (not isinstance(typecode, str))):
+            raise TypeError("`typecode` must be of TYPE `str` or `None`")
+        elif ((typecode is not None) and (typecode not in "bBhHiIlLqQfd")):
+            raise ValueError("`typecode` must be a numeric `array` typecode")
+
+        # STEP 2: Assign class attributes
+        self._typecode = typecode
+        self._arr = self.__items(())
 
     def len(self):
         return len(self._arr)
+
+    def __len__(self):
+        """
+        RETRIEVES the number of items in the stack in O(1).
+        """
+        return len(self._arr)
+
+    @property
+    def typecode(self):
+        """
+        The `array` typecode of the stack, or `None` if it is a `list` of
+        boxed objects.
+        """
+        return self._typecode
+
+    def __items(self, values):
+        """
+        CONVERTS an iterable of `values` into the same TYPE as the stack.
+        """
+        if (self._typecode is None):
+            return list(values)
+        return array(self._typecode, values)
     
     @property
     def arr(self):
         """
-        The ARRAY implemented as a STACK.
+        The ARRAY implemented as a STACK, a `list` (or a typed `array` if
+        there is a `typecode`).
         """
         return self._arr
     
     @arr.setter
-    def arr(self, i, new_value):
+    def arr(self, new_arr):
         """
-        REPLACES the value at index `i` with `new_value`.
+        REPLACES the contents of the stack with the items of `new_arr`, the
+        LAST item being the TOP of the stack.
 
         :Parameters:
-            - `i`: the INDEX to access the stack
-            - `new_value`: the item to replace value at index `i`
+            - `new_arr`: an ITERABLE of the new items
         """
-        self._arr[i % self.len()] = new_value
-    
+        self._arr = self.__items(new_arr)
+
     @arr.deleter
     def arr(self):
         """
         RESETS the array to ZERO elements.
         """
-        self._arr = []
+        self._arr = self.__items(())
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the item at index `i`, from the BOTTOM of the stack.
+        """
+        return self._arr[i]
+
+    def __setitem__(self, i, new_value):
+        """
+        REPLACES the value at index `i` (from the BOTTOM) with `new_value`.
+        """
+        self._arr[i] = new_value
 
     def push(self, new_value):
         """
@@ -80,6 +129,60 @@ class ArrStack(object):
         # STEP 3B: Indicate the stack is now empty after the pop
         return None
 
+    def push_many(self, values):
+        """
+        ADDS every item of `values` at the END of the array in ONE bulk copy,
+        so the last of them becomes the TOP of the stack.
+
+        :Parameters:
+            - `values`: an ITERABLE (e.g. a typed `array`) of the items to be
+              added, in order
+
+        :Return:
+            The number of items added
+        """
+        before = len(self._arr)
+        self._arr.extend(values)
+        return len(self._arr) - before
+
+    def pop_many(self, n):
+        """
+        REMOVES up to `n` items from the END of the array in ONE bulk copy.
+
+        :Parameters:
+            - `n`: the MAXIMUM number of items to be removed
+
+        :Return:
+            The removed items in array ORDER (i.e. the old TOP is LAST), as a
+            `list` (or a typed `array` if there is a `typecode`)
+        """
+
+        # STEP 1: Ensure `n` is a non-negative `int`
+        if (not isinstance(n, int)):
+            raise TypeError("`n` must be of TYPE `int`")
+        elif (n < 0):
+            raise ValueError("`n` must be at LEAST 0")
+
+        # STEP 2: Slice the items off the END of the array
+        start = max(len(self._arr) - n, 0)
+        items = self._arr[start:]
+        del self._arr[start:]
+        return items
+
+    def view(self):
+        """
+        EXPOSES the items of a TYPED stack, from the BOTTOM to the TOP, as a
+        zero-copy `memoryview` of the array. The array can NOT grow or shrink
+        while the view is held (a `BufferError` is raised), so release it
+        (e.g. with a `with` block) before the next push or pop.
+
+        :Return:
+            A `memoryview` of the live items
+        """
+        if (self._typecode is None):
+            raise TypeError("`view` requires the stack to have a `typecode`")
+        return memoryview(self._arr)
+
     def __iterative_search(self, new_value):
         """
         ITERATIVELY searches the stack for the 1st instance that matches 
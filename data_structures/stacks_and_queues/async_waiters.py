@@ -0,0 +1,182 @@
+# @file     async_waiters.py
+# @brief    A file for implementing the waiter machinery of the asyncio queues
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import asyncio
+import collections
+
+# ---------------------------------------------------------------------------- #
+
+class AsyncWaiters(object):
+    """
+    An INTERFACE (i.e. a MIXIN) that makes a linked container ASYNCIO-native,
+    for coroutines sharing ONE event loop. `get` & `put` suspend (rather
+    than block the loop) while the container is EMPTY or FULL, & `get_batch`
+    takes a whole batch per wake-up. A cancelled waiter NEVER loses an item,
+    it passes it's wake-up on.
+
+    The container keeps it's item count in `_size` & provides 2 hooks that
+    do NOT wake anyone: `_give` (adds an item) & `_take` (removes & returns
+    the next item), built on it's own insert & delete methods.
+    """
+
+    def __init__(self, maxsize = 0):
+
+        # STEP 1: Ensure `maxsize` is a non-negative `int` (0 is unbounded)
+        if (not isinstance(maxsize, int)):
+            raise TypeError("`maxsize` must be of TYPE `int`")
+        elif (maxsize < 0):
+            raise ValueError("`maxsize` must be at LEAST 0")
+
+        # STEP 2: Initialise the FIFO queues of waiting futures
+        self._maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    @property
+    def maxsize(self):
+        """
+        The MAXIMUM number of items in the container, or 0 if unbounded.
+        """
+        return self._maxsize
+
+    def qsize(self):
+        """
+        RETRIEVES the number of items in the container.
+        """
+        return self._size
+
+    def full(self):
+        """
+        CHECKS if the container holds `maxsize` items (NEVER if unbounded).
+        """
+        return (0 < self._maxsize <= self._size)
+
+    @staticmethod
+    def _wakeup_next(waiters, n = 1):
+        """
+        WAKES up to `n` of the OLDEST waiting futures that are NOT yet done.
+        """
+        while ((n > 0) and waiters):
+            waiter = waiters.popleft()
+            if (not waiter.done()):
+                waiter.set_result(None)
+                n -= 1
+
+    async def __wait(self, waiters, ready):
+        """
+        SUSPENDS the calling coroutine on a future queued in `waiters` until
+        `ready()` is true. If it is CANCELLED after being woken, the wake-up
+        is handed to the NEXT waiter so it is never lost.
+        """
+        while (not ready()):
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if (ready() and not waiter.cancelled()):
+                    AsyncWaiters._wakeup_next(waiters)
+                raise
+
+    def put_nowait(self, new_value):
+        """
+        ADDS a `new_value` to the container WITHOUT suspending.
+
+        :Raises:
+            - `asyncio.QueueFull`: if the container is FULL
+        """
+        if (self.full()):
+            raise asyncio.QueueFull
+        self._give(new_value)
+        AsyncWaiters._wakeup_next(self._getters)
+
+    def get_nowait(self):
+        """
+        REMOVES & returns the next item of the container WITHOUT suspending.
+
+        :Raises:
+            - `asyncio.QueueEmpty`: if the container is EMPTY
+        """
+        if (self._size == 0):
+            raise asyncio.QueueEmpty
+        item = self._take()
+        AsyncWaiters._wakeup_next(self._putters)
+        return item
+
+    async def put(self, new_value):
+        """
+        ADDS a `new_value` to the container, suspending while it is FULL
+        (i.e. applying BACKPRESSURE to producers).
+
+        :Parameters:
+            - `new_value`: the item to be added to the container
+        """
+        if (0 < self._maxsize <= self._size):
+            await self.__wait(self._putters, lambda: not self.full())
+        self._give(new_value)
+        AsyncWaiters._wakeup_next(self._getters)
+
+    async def get(self):
+        """
+        REMOVES & returns the next item of the container, suspending while
+        it is EMPTY.
+
+        :Return:
+            The next item of the container
+        """
+        if (self._size == 0):
+            await self.__wait(self._getters, lambda: self._size > 0)
+        item = self._take()
+        AsyncWaiters._wakeup_next(self._putters)
+        return item
+
+    async def get_batch(self, n, timeout = None):
+        """
+        REMOVES up to `n` items from the container in ONE go, suspending
+        until at LEAST one item is available.
+
+        :Parameters:
+            - `n`: the MAXIMUM number of items to remove
+            - `timeout` (optional): the MAXIMUM seconds to wait for the 1st
+              item, or `None` (default) to wait forever
+
+        :Return:
+            The removed items in the order they were taken (EMPTY if none
+            arrived in time)
+        """
+
+        # STEP 1: Ensure `n` is a positive `int`
+        if (not isinstance(n, int)):
+            raise TypeError("`n` must be of TYPE `int`")
+        elif (n < 1):
+            raise ValueError("`n` must be at LEAST 1")
+
+        # STEP 2: Wait (up to `timeout`) for the 1st item, if there is none
+        ready = lambda: self._size > 0
+        if (self._size > 0):
+            pass
+        elif (timeout is None):
+            await self.__wait(self._getters, ready)
+        else:
+            try:
+                await asyncio.wait_for(self.__wait(self._getters, ready), timeout)
+            except asyncio.TimeoutError:
+                return []
+
+        # STEP 3: Remove the whole batch, wake a producer per freed slot &
+        #         pass the wake-up on if items are LEFT for other consumers
+        count = min(n, self._size)
+        take = self._take
+        items = [take() for _ in range(count)]
+        AsyncWaiters._wakeup_next(self._putters, count)
+        if ((self._size > 0) and self._getters):
+            AsyncWaiters._wakeup_next(self._getters)
+        return items
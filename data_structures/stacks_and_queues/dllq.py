@@ -4,13 +4,22 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
+import queue
+import threading
+import weakref
 from enum import Enum
 
+from async_waiters import AsyncWaiters
+from linked_nodes import check_pool, node_allocator, release_chain
+from overflow_policy import OverflowPolicy
+
 # ---------------------------------------------------------------------------- #
 
-class DLLQ(object):
+class DLLQ(OverflowPolicy):
     """
-    An INTERFACE for a doubly linked-list queue (DLLQ).
+    An INTERFACE for a doubly linked-list queue (DLLQ). With `max_items`,
+    the DLLQ is BOUNDED & sheds load as per it's `overflow` policy once
+    full (see `OverflowPolicy`).
     """
 
     class CMPValues(Enum):
@@ -92,16 +101,64 @@ class DLLQ(object):
         def prev(self):
             del self._prev
 
-    def __init__(self, cmp_fn):
+    class WeakNode(Node):
+        """
+        A DLLQ node whose `prev` POINTER is held as a WEAK reference, so a
+        chain of nodes has NO reference cycles & is freed by reference
+        counting alone, without waiting for the cyclic garbage collector.
+        """
+
+        @property
+        def prev(self):
+            """
+            A POINTER to a DLLQ predecessor node, held weakly.
+            """
+            return None if (self._prev is None) else self._prev()
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # CASE A: Clear the back-pointer
+            if (new_prev is None):
+                self._prev = None
+
+            # CASE B: Ensure the `new_prev` is type `DLLQ.Node`
+            elif (isinstance(new_prev, DLLQ.Node)):
+                self._prev = weakref.ref(new_prev)
+
+            # CASE C: `new_prev` is an INAPPROPRIATE type
+            else:
+                raise TypeError("`new_prev` must be of TYPE `DLLQ.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, cmp_fn, pool = None, weak_prev = False, max_items = None,
+                 overflow = "reject"):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Ensure `weak_prev` is a `bool`
+        if (not isinstance(weak_prev, bool)):
+            raise TypeError("`weak_prev` must be of TYPE `bool`")
+
+        # STEP 4: Validate & assign the overflow policy
+        OverflowPolicy.__init__(self, max_items, overflow)
+
+        # STEP 5: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self._node_cls = DLLQ.WeakNode if weak_prev else DLLQ.Node
+        self.__new_node = node_allocator(self._node_cls, pool)
         self._head = None
         self._tail = None
+        self._size = 0
 
     @property
     def cmp_fn(self):
@@ -133,6 +190,22 @@ class DLLQ(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @property
+    def weak_prev(self):
+        """
+        CHECKS if the DLLQ nodes hold their `prev` POINTERS weakly (i.e. are
+        of TYPE `DLLQ.WeakNode`).
+        """
+        return (self._node_cls is DLLQ.WeakNode)
+
     @property
     def head(self):
         """
@@ -187,62 +260,120 @@ class DLLQ(object):
         """
         return ((self.head == None) and (self.tail == None))
     
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the DLLQ in O(1).
+        """
+        return self._size
+
     def enqueue(self, new_key):
         """
-        INSERTS a new TAIL (i.e. END) node in the DLLQ.
+        INSERTS a new TAIL (i.e. END) node in the DLLQ. If the DLLQ already
+        holds `max_items` nodes, the `overflow` policy applies.
 
         :Parameters:
             - `new_key`: is the INFORMATION to be associated with the new 
               TAIL DLLQ node
 
         :Return:
-            A POINTER to the NEWLY added DLLQ TAIL node
+            - A POINTER to the NEWLY added DLLQ TAIL node, OR
+            - `None`: if the DLLQ is FULL & `new_key` got dropped
+
+        :Raises:
+            - `OverflowError`: if the DLLQ is FULL & `overflow` is 'reject'
         """
+
+        # STEP 1: If the DLLQ is FULL, shed load as per the overflow policy
+        if (not self._has_room()):
+            if (self._shed()):
+                return None
+            return self.__overwrite_front(new_key)
         
-        # STEP 1: Adjust the DLLQ head pointer
-        new_tail = DLLQ.Node(new_key)
-        new_tail.next = None
-        new_tail.prev = self.tail
+        # STEP 2: Link the new node after the TAIL (every node involved is
+        #         ALWAYS a `DLLQ.Node`, so the type-checking setters are
+        #         bypassed, bar `prev` which may hold a WEAK reference)
+        new_tail = self.__new_node(new_key)
+        tail = self._tail
+        new_tail._next = None
+        new_tail.prev = tail
 
         # CASE A: This is the 1st DLLQ node insertion
-        if (self.tail == None):
-            self.head = self.tail = new_tail
+        if (tail is None):
+            self._head = new_tail
 
         # CASE B: NOT the 1st DLLQ node insertion
         else:
-            self.tail.next = new_tail
-            self.tail = new_tail
+            tail._next = new_tail
+        self._tail = new_tail
         
-        # STEP 2: Return the NEWLY added DLLQ TAIL node
-        return self.tail
+        # STEP 3: Count the node & return the NEWLY added DLLQ TAIL node
+        self._size += 1
+        if (self._size > self._high_water):
+            self._high_water = self._size
+        return new_tail
+
+    def __overwrite_front(self, new_key):
+        """
+        OVERWRITES the oldest key in O(1) by MOVING the HEAD node to the
+        TAIL with `new_key`, instead of freeing one node & allocating another.
+        """
+
+        # STEP 1: Relink the old HEAD after the TAIL (if NOT the only node)
+        old_head = self.head
+        if (old_head is not self.tail):
+            self.head = old_head.next
+            self.head.prev = None
+            old_head.next = None
+            old_head.prev = self.tail
+            self.tail.next = old_head
+            self.tail = old_head
+
+        # STEP 2: Return the new TAIL node, now holding `new_key`
+        old_head.key = new_key
+        return old_head
 
     def dequeue(self):
         """
         DELETES the HEAD (i.e. FIRST) node of the DLLQ.
 
         :Return:
-            - A POINTER to the new DLLQ HEAD node, OR 
+            - A POINTER to the new DLLQ HEAD node, OR
             - `None`: if the DLLQ has NO nodes to delete
         """
 
         # STEP 1: Check if the DLLQ is empty
-        if (self.is_empty()):
+        old_head = self._head
+        if (old_head is None):
             return None
         
-        # STEP 2: Initalise the POINTER variables
-        old_head = self.head
-        self.head = old_head.next
+        # STEP 2: Unlink the HEAD (the type-checking setters are bypassed, as
+        #         in `enqueue`, & `None` is a valid WEAK `prev` too)
+        new_head = old_head._next
+        self._head = new_head
 
         # CASE A: The only DLLQ node got deleted
-        if (self.head == None):
-            self.tail = None
+        if (new_head is None):
+            self._tail = None
 
         # CASE B: At LEAST 2 DLLQ node remaining
         else:
-            self.head.prev = None
+            new_head._prev = None
 
-        # STEP 3: Return the new DLLQ HEAD node
-        return self.head
+        # STEP 3: Recycle the deleted node & return the new DLLQ HEAD node
+        self._size -= 1
+        if (self._pool is not None):
+            self._pool.release(old_head)
+        return new_head
+
+    def clear(self):
+        """
+        DELETES every node of the DLLQ in O(n), breaking the `next` & `prev`
+        links ITERATIVELY so the nodes are freed by reference counting rather
+        than left as reference cycles for the garbage collector.
+        """
+        release_chain(self._head, self._pool)
+        self._head = self._tail = None
+        self._size = 0
 
     def __iterative_search(self, target_key):
         """
@@ -326,4 +457,272 @@ class DLLQ(object):
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
-            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
\ No newline at end of file
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+# ---------------------------------------------------------------------------- #
+
+class SyncDLLQ(DLLQ):
+    """
+    A THREAD-SAFE, blocking variant of the `DLLQ`, for many producer &
+    consumer threads. Every method that reads or changes the nodes holds
+    ONE internal lock (bar the `head` & `tail` getters, which read a single
+    field), `get` & `put` can wait for an item or a free slot, & `drain`
+    empties a whole batch for the cost of a SINGLE lock acquisition.
+    """
+
+    def __init__(self, cmp_fn, pool = None, weak_prev = False, maxsize = 0):
+
+        # STEP 1: Ensure `maxsize` is a non-negative `int` (0 is unbounded)
+        if (not isinstance(maxsize, int)):
+            raise TypeError("`maxsize` must be of TYPE `int`")
+        elif (maxsize < 0):
+            raise ValueError("`maxsize` must be at LEAST 0")
+
+        # STEP 2: Initialise the queue, then the lock & it's 2 conditions
+        super().__init__(cmp_fn, pool, weak_prev)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def maxsize(self):
+        """
+        The MAXIMUM number of items in the queue, or 0 if unbounded.
+        """
+        return self._maxsize
+
+    def qsize(self):
+        """
+        RETRIEVES the number of items in the queue.
+        """
+        with self._lock:
+            return self._size
+
+    def __len__(self):
+        return self.qsize()
+
+    def full(self):
+        """
+        CHECKS if the queue holds `maxsize` items (NEVER if unbounded).
+        """
+        with self._lock:
+            return (0 < self._maxsize <= self._size)
+
+    def __wait(self, condition, ready, block, timeout):
+        """
+        WAITS on `condition` (with the lock HELD) until `ready()` is true.
+
+        :Return:
+            - `True`: if `ready()` is true, OR
+            - `False`: if `block` is `False` or `timeout` seconds expired
+        """
+        if (ready()):
+            return True
+        elif (not block):
+            return False
+        elif ((timeout is not None) and (timeout < 0)):
+            raise ValueError("`timeout` must be a NON-negative number")
+        return condition.wait_for(ready, timeout)
+
+    def enqueue(self, new_value):
+        """
+        ADDS a `new_value` at the END of the queue WITHOUT checking `maxsize`
+        (see `put`).
+        """
+        with self._lock:
+            result = super().enqueue(new_value)
+            self._not_empty.notify()
+            return result
+
+    def dequeue(self):
+        """
+        REMOVES the item at the FRONT of the queue WITHOUT blocking (see
+        `get`), with the same return value as `DLLQ.dequeue`.
+        """
+        with self._lock:
+            if (self._size == 0):
+                return None
+            result = super().dequeue()
+            self._not_full.notify()
+            return result
+
+    def clear(self):
+        """
+        DELETES every node of the queue & wakes EVERY waiting producer.
+        """
+        with self._lock:
+            super().clear()
+            self._not_full.notify_all()
+
+    def is_empty(self):
+        """
+        CHECKS if the queue is empty under the lock.
+        """
+        with self._lock:
+            return super().is_empty()
+
+    def search(self, target_key, mode = 'i'):
+        """
+        SEARCHES the queue for a node that MATCHES `target_key` under the
+        lock, see `DLLQ.search`.
+        """
+        with self._lock:
+            return super().search(target_key, mode)
+
+    def put(self, new_value, block = True, timeout = None):
+        """
+        ADDS a `new_value` at the END of the queue, waiting for a free slot
+        while the queue is FULL (i.e. applying BACKPRESSURE to producers).
+
+        :Parameters:
+            - `new_value`: the item to be added at the END of the queue
+            - `block` (optional): if `False`, NEVER wait (default `True`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Raises:
+            - `queue.Full`: if NO slot was freed in time
+        """
+        with self._not_full:
+
+            # STEP 1: Wait until there is room for the item
+            if (not self.__wait(self._not_full, self.__has_room, block, timeout)):
+                raise queue.Full
+
+            # STEP 2: Add the item & wake a waiting consumer
+            super().enqueue(new_value)
+            self._not_empty.notify()
+
+    def get(self, block = True, timeout = None):
+        """
+        REMOVES & returns the item at the FRONT of the queue, waiting for an
+        item while the queue is EMPTY.
+
+        :Parameters:
+            - `block` (optional): if `False`, NEVER wait (default `True`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Return:
+            The item at the FRONT of the queue
+
+        :Raises:
+            - `queue.Empty`: if NO item arrived in time
+        """
+        with self._not_empty:
+
+            # STEP 1: Wait until there is an item
+            if (not self.__wait(self._not_empty, self.__has_items, block, timeout)):
+                raise queue.Empty
+
+            # STEP 2: Take the FRONT item & wake a waiting producer
+            item = self.head.key
+            super().dequeue()
+            self._not_full.notify()
+            return item
+
+    def drain(self, max_items = None, block = False, timeout = None):
+        """
+        REMOVES up to `max_items` items from the FRONT of the queue under a
+        SINGLE lock acquisition, rather than one acquisition per item.
+
+        :Parameters:
+            - `max_items` (optional): the MAXIMUM number of items to remove,
+              or `None` (default) for every item
+            - `block` (optional): if `True`, wait for at LEAST one item
+              (default `False`)
+            - `timeout` (optional): the MAXIMUM seconds to wait, or `None`
+              (default) to wait forever
+
+        :Return:
+            The removed items from the FRONT to the BACK (EMPTY if none
+            arrived in time)
+        """
+
+        # STEP 1: Ensure `max_items` (if any) is a non-negative `int`
+        if ((max_items is not None) and (not isinstance(max_items, int))):
+            raise TypeError("`max_items` must be of TYPE `int` or `None`")
+        elif ((max_items is not None) and (max_items < 0)):
+            raise ValueError("`max_items` must be at LEAST 0")
+
+        with self._not_empty:
+
+            # STEP 2: Wait (if asked) until there is an item
+            if (not self.__wait(self._not_empty, self.__has_items, block, timeout)):
+                return []
+
+            # STEP 3: Remove the whole batch & wake EVERY waiting producer
+            n = self._size if (max_items is None) else min(max_items, self._size)
+            items = []
+            for _ in range(n):
+                items.append(self.head.key)
+                super().dequeue()
+            self._not_full.notify_all()
+            return items
+
+    def __has_items(self):
+        """
+        CHECKS (with the lock HELD) if the queue has at LEAST one item.
+        """
+        return (self._size > 0)
+
+    def __has_room(self):
+        """
+        CHECKS (with the lock HELD) if the queue has room for one more item.
+        """
+        return ((self._maxsize == 0) or (self._size < self._maxsize))
+
+# ---------------------------------------------------------------------------- #
+
+class AsyncDLLQ(AsyncWaiters, DLLQ):
+    """
+    An ASYNCIO-native variant of the `DLLQ` (see `AsyncWaiters`), whose
+    `get` & `get_batch` take items from the FRONT.
+    """
+
+    def __init__(self, cmp_fn, pool = None, weak_prev = False, maxsize = 0):
+
+        # STEP 1: Initialise the queue, then the waiter machinery
+        DLLQ.__init__(self, cmp_fn, pool, weak_prev)
+        AsyncWaiters.__init__(self, maxsize)
+
+    def _give(self, new_value):
+        """
+        ADDS a `new_value` at the END of the queue via `DLLQ.enqueue`.
+        """
+        return DLLQ.enqueue(self, new_value)
+
+    def _take(self):
+        """
+        REMOVES the FRONT node via `DLLQ.dequeue` & returns it's key.
+        """
+        key = self._head.key
+        DLLQ.dequeue(self)
+        return key
+
+    def enqueue(self, new_value):
+        """
+        ADDS a `new_value` to the queue WITHOUT checking `maxsize` (see `put`).
+        """
+        node = self._give(new_value)
+        AsyncWaiters._wakeup_next(self._getters)
+        return node
+
+    def dequeue(self):
+        """
+        REMOVES the FRONT item of the queue WITHOUT suspending (see `get`),
+        with the same return value as `DLLQ.dequeue`.
+        """
+        if (self._size == 0):
+            return None
+        result = DLLQ.dequeue(self)
+        AsyncWaiters._wakeup_next(self._putters)
+        return result
+
+    def clear(self):
+        """
+        DELETES every node of the queue & wakes EVERY waiting producer.
+        """
+        DLLQ.clear(self)
+        AsyncWaiters._wakeup_next(self._putters, len(self._putters))
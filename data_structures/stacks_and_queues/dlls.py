@@ -4,8 +4,12 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
+import weakref
 from enum import Enum
 
+from async_waiters import AsyncWaiters
+from linked_nodes import check_pool, node_allocator, release_chain
+
 # ---------------------------------------------------------------------------- #
 
 class DLLS(object):
@@ -92,16 +96,60 @@ class DLLS(object):
         def prev(self):
             del self._prev
 
-    def __init__(self, cmp_fn):
+    class WeakNode(Node):
+        """
+        A DLLS node whose `prev` POINTER is held as a WEAK reference, so a
+        chain of nodes has NO reference cycles & is freed by reference
+        counting alone, without waiting for the cyclic garbage collector.
+        """
+
+        @property
+        def prev(self):
+            """
+            A POINTER to a DLLS predecessor node, held weakly.
+            """
+            return None if (self._prev is None) else self._prev()
+
+        @prev.setter
+        def prev(self, new_prev):
+
+            # CASE A: Clear the back-pointer
+            if (new_prev is None):
+                self._prev = None
+
+            # CASE B: Ensure the `new_prev` is type `DLLS.Node`
+            elif (isinstance(new_prev, DLLS.Node)):
+                self._prev = weakref.ref(new_prev)
+
+            # CASE C: `new_prev` is an INAPPROPRIATE type
+            else:
+                raise TypeError("`new_prev` must be of TYPE `DLLS.Node` or `None`")
+
+        @prev.deleter
+        def prev(self):
+            del self._prev
+
+    def __init__(self, cmp_fn, pool = None, weak_prev = False):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Ensure `weak_prev` is a `bool`
+        if (not isinstance(weak_prev, bool)):
+            raise TypeError("`weak_prev` must be of TYPE `bool`")
+
+        # STEP 4: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self._node_cls = DLLS.WeakNode if weak_prev else DLLS.Node
+        self.__new_node = node_allocator(self._node_cls, pool)
         self._head = None
         self._tail = None
+        self._size = 0
 
     @property
     def cmp_fn(self):
@@ -133,6 +181,22 @@ class DLLS(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
+    @property
+    def weak_prev(self):
+        """
+        CHECKS if the DLLS nodes hold their `prev` POINTERS weakly (i.e. are
+        of TYPE `DLLS.WeakNode`).
+        """
+        return (self._node_cls is DLLS.WeakNode)
+
     @property
     def head(self):
         """
@@ -187,6 +251,12 @@ class DLLS(object):
         """
         return ((self.head == None) and (self.tail == None))
 
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the DLLS in O(1).
+        """
+        return self._size
+
     def push(self, new_key):
         """
         INSERTS a new TAIL (i.e. END) node in the DLLS.
@@ -199,22 +269,26 @@ class DLLS(object):
             A POINTER to the NEWLY added DLLS TAIL node
         """
         
-        # STEP 1: Adjust the DLLS head pointer
-        new_tail = DLLS.Node(new_key)
-        new_tail.next = None
-        new_tail.prev = self.tail
+        # STEP 1: Link the new node after the TAIL (every node involved is
+        #         ALWAYS a `DLLS.Node`, so the type-checking setters are
+        #         bypassed, bar `prev` which may hold a WEAK reference)
+        new_tail = self.__new_node(new_key)
+        tail = self._tail
+        new_tail._next = None
+        new_tail.prev = tail
 
         # CASE A: This is the 1st DLLS node insertion
-        if (self.tail == None):
-            self.head = self.tail = new_tail
+        if (tail is None):
+            self._head = new_tail
 
         # CASE B: NOT the 1st DLLS node insertion
         else:
-            self.tail.next = new_tail
-            self.tail = new_tail
+            tail._next = new_tail
+        self._tail = new_tail
         
         # STEP 2: Return the NEWLY added DLLS TAIL node
-        return self.tail
+        self._size += 1
+        return new_tail
 
     def pop(self):
         """
@@ -226,23 +300,43 @@ class DLLS(object):
         """
 
         # STEP 1: Check if the DLLS is empty
-        if (self.is_empty()):
+        old_tail = self._tail
+        if (old_tail is None):
             return
         
-        # STEP 2: Initialise POINTER variables
-        old_tail = self.tail
-        self.tail = old_tail.prev
+        # STEP 2: Unlink the TAIL (the type-checking setters are bypassed, as
+        #         in `push`, but `prev` is READ via it's getter as it may be
+        #         a WEAK reference)
+        new_tail = old_tail.prev
+        self._tail = new_tail
 
         # CASE A: The only DLLS node deleted
-        if (self.tail == None):
-            self.head = None
+        if (new_tail is None):
+            self._head = None
 
         # CASE B: At LEAST 2 DLLS node remaining
         else:
-            self.tail.next = None
+            new_tail._next = None
+
+        # STEP 3: Recycle the deleted node & return the new DLLS TAIL node
+        self._size -= 1
+        if (self._pool is not None):
+            self._pool.release(old_tail)
+        return new_tail
+
+    def clear(self):
+        """
+        DELETES every node of the DLLS in O(n), breaking the `next` & `prev`
+        links ITERATIVELY so the nodes are freed by reference counting rather
+        than left as reference cycles for the garbage collector.
+        """
+
+        # STEP 1: Unlink (& recycle) every node from the HEAD to the TAIL
+        release_chain(self.head, self._pool)
 
-        # STEP 3: Return the new DLLS TAIL node
-        return self.tail
+        # STEP 2: Reset the DLLS to empty
+        self.head = self.tail = None
+        self._size = 0
 
     def __iterative_search(self, target_key):
         """
@@ -326,4 +420,58 @@ class DLLS(object):
 
         # CASE D: Mode is an INAPPROPRIATE value
         else:
-            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
\ No newline at end of file
+            raise ValueError("`mode` must be of VALUE 'i' or 'r'")
+
+# ---------------------------------------------------------------------------- #
+
+class AsyncDLLS(AsyncWaiters, DLLS):
+    """
+    An ASYNCIO-native variant of the `DLLS` (see `AsyncWaiters`), whose
+    `get` & `get_batch` take items from the TOP.
+    """
+
+    def __init__(self, cmp_fn, pool = None, weak_prev = False, maxsize = 0):
+
+        # STEP 1: Initialise the stack, then the waiter machinery
+        DLLS.__init__(self, cmp_fn, pool, weak_prev)
+        AsyncWaiters.__init__(self, maxsize)
+
+    def _give(self, new_value):
+        """
+        ADDS a `new_value` at the TOP of the stack via `DLLS.push`.
+        """
+        return DLLS.push(self, new_value)
+
+    def _take(self):
+        """
+        REMOVES the TOP node via `DLLS.pop` & returns it's key.
+        """
+        key = self._tail.key
+        DLLS.pop(self)
+        return key
+
+    def push(self, new_value):
+        """
+        ADDS a `new_value` to the stack WITHOUT checking `maxsize` (see `put`).
+        """
+        node = self._give(new_value)
+        AsyncWaiters._wakeup_next(self._getters)
+        return node
+
+    def pop(self):
+        """
+        REMOVES the TOP item of the stack WITHOUT suspending (see `get`),
+        with the same return value as `DLLS.pop`.
+        """
+        if (self._size == 0):
+            return None
+        result = DLLS.pop(self)
+        AsyncWaiters._wakeup_next(self._putters)
+        return result
+
+    def clear(self):
+        """
+        DELETES every node of the stack & wakes EVERY waiting producer.
+        """
+        DLLS.clear(self)
+        AsyncWaiters._wakeup_next(self._putters, len(self._putters))
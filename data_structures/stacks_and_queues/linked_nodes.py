@@ -0,0 +1,58 @@
+# @file     linked_nodes.py
+# @brief    A file for implementing the node helpers of the linked queues & stacks
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import functools
+
+# ---------------------------------------------------------------------------- #
+
+def check_pool(pool):
+    """
+    RAISES an error if `pool` is NEITHER `None` NOR able to `acquire` &
+    `release` nodes (e.g. a `NodePool` of the `linked_lists` directory).
+
+    :Parameters:
+        - `pool`: the pool passed to a linked queue or stack
+    """
+    if ((pool is not None) and not (callable(getattr(pool, "acquire", None))
+                                    and callable(getattr(pool, "release", None)))):
+        raise TypeError("`pool` must provide `acquire` & `release` methods")
+
+def node_allocator(node_cls, pool = None):
+    """
+    RETRIEVES the function that allocates a `node_cls` node from a key. A
+    queue or stack binds it ONCE, so it's inserts never check for a `pool`.
+
+    :Parameters:
+        - `node_cls`: the node CLASS to be allocated (e.g. `DLLQ.Node`)
+        - `pool` (optional): the pool to RECYCLE nodes from
+
+    :Return:
+        - `node_cls` itself: if there is NO `pool`, OR
+        - `pool.acquire` bound to `node_cls`
+    """
+    if (pool is None):
+        return node_cls
+    return functools.partial(pool.acquire, node_cls)
+
+def release_chain(head, pool = None):
+    """
+    UNLINKS every node of the doubly linked chain starting at `head` in
+    O(n), breaking the `next` & `prev` links ITERATIVELY so the nodes are
+    freed by reference counting rather than left as reference cycles for
+    the garbage collector. This holds even once `pool` is at it's `cap` &
+    starts dropping the nodes.
+
+    :Parameters:
+        - `head`: the FIRST node of the chain, or `None`
+        - `pool` (optional): the pool to RECYCLE every unlinked node into
+    """
+    curr = head
+    while (curr is not None):
+        following = curr.next
+        curr.next = curr.prev = None
+        if (pool is not None):
+            pool.release(curr)
+        curr = following
@@ -0,0 +1,100 @@
+# @file     overflow_policy.py
+# @brief    A file for implementing the load-shedding policy of bounded queues
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+class OverflowPolicy(object):
+    """
+    An INTERFACE (i.e. a MIXIN) that BOUNDS a queue to `max_items` & sheds
+    load as per it's `overflow` policy once full, WITHOUT ever blocking. A
+    producer that must wait for room uses `put` of a `Sync*` queue instead.
+
+    The queue keeps it's item count in `_size`, checks `_has_room` before
+    every insert & calls `_shed` when there is none.
+    """
+
+    def __init__(self, max_items = None, overflow = "reject"):
+
+        # STEP 1: Ensure `max_items` (if any) is a positive `int`
+        if ((max_items is not None) and (not isinstance(max_items, int))):
+            raise TypeError("`max_items` must be of TYPE `int` or `None`")
+        elif ((max_items is not None) and (max_items < 1)):
+            raise ValueError("`max_items` must be at LEAST 1")
+
+        # STEP 2: Ensure `overflow` is a known (non-blocking) policy
+        if (not isinstance(overflow, str)):
+            raise TypeError("`overflow` must be of TYPE `str`")
+        elif (overflow not in ("reject", "drop_oldest", "drop_newest")):
+            raise ValueError("`overflow` must be of VALUE 'reject', 'drop_oldest' "
+                             "or 'drop_newest' (use `put` of a `Sync*` queue to "
+                             "block)")
+
+        # STEP 3: Assign the policy & it's counters
+        self._max_items = max_items
+        self._overflow = overflow
+        self._dropped = 0
+        self._high_water = 0
+
+    @property
+    def max_items(self):
+        """
+        The MAXIMUM number of items in the queue, or `None` if unbounded.
+        """
+        return self._max_items
+
+    @property
+    def overflow(self):
+        """
+        The policy applied when an item is added while the queue holds
+        `max_items` items:
+            - 'reject': an `OverflowError` is raised
+            - 'drop_oldest': the FRONT item is dropped to make room
+            - 'drop_newest': the NEW item is dropped
+        """
+        return self._overflow
+
+    @property
+    def dropped(self):
+        """
+        The number of items DROPPED by the overflow policy since the last
+        `reset_counters`.
+        """
+        return self._dropped
+
+    @property
+    def high_water(self):
+        """
+        The MOST items the queue has held since the last `reset_counters`.
+        """
+        return self._high_water
+
+    def reset_counters(self):
+        """
+        RESETS the `dropped` counter to 0 & the `high_water` mark to the
+        current number of items.
+        """
+        self._dropped = 0
+        self._high_water = self._size
+
+    def _has_room(self):
+        """
+        CHECKS if the queue has room for one more item.
+        """
+        return ((self._max_items is None) or (self._size < self._max_items))
+
+    def _shed(self):
+        """
+        APPLIES the overflow policy to an item added while the queue is FULL.
+
+        :Return:
+            - `True`: if the NEW item must be dropped ('drop_newest'), OR
+            - `False`: if the FRONT item must make way for it ('drop_oldest')
+
+        :Raises:
+            - `OverflowError`: if `overflow` is 'reject'
+        """
+        if (self._overflow == "reject"):
+            raise OverflowError(type(self).__name__ + " is FULL")
+        self._dropped += 1
+        return (self._overflow == "drop_newest")
@@ -0,0 +1,365 @@
+# @file     shm_queue.py
+# @brief    A file for implementing a cross-process shared-memory ring queue
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import platform
+from multiprocessing import shared_memory
+
+# ---------------------------------------------------------------------------- #
+
+class ShmQueue(object):
+    """
+    An INTERFACE for a single-producer/single-consumer (SPSC) queue of
+    FIXED-width records, implemented as a CIRCULAR buffer inside a block of
+    `multiprocessing.shared_memory`. One process creates the queue & the
+    other attaches to it by name, after which records are passed by COPYING
+    their bytes into a slot, with NO pickling & NO locks.
+
+    The block starts with a header of 2 counters, `head` (written ONLY by
+    the consumer) & `tail` (written ONLY by the producer), each on it's own
+    cache line. They count records ever dequeued & enqueued, so a slot is
+    `counter % capacity` & the size is `tail - head`. The producer writes a
+    record BEFORE publishing the new `tail`, & the consumer reads a record
+    BEFORE publishing the new `head`. There is NO memory barrier, so this
+    relies on the CPU keeping stores in order (as x86 does) & the queue
+    REFUSES to run on any other CPU (e.g. ARM).
+    """
+
+    # The byte OFFSETS of the header fields & the 1st record slot
+    HEAD_OFFSET = 0
+    TAIL_OFFSET = 64
+    META_OFFSET = 128
+    DATA_OFFSET = 192
+
+    # The `platform.machine()` names of CPUs that keep stores in order
+    ORDERED_MACHINES = ("x86_64", "amd64", "x86", "i386", "i686")
+
+    def __init__(self, record_size, capacity = 1024, name = None):
+
+        # STEP 1: Ensure the CPU keeps stores in order
+        ShmQueue.__check_platform()
+
+        # STEP 2: Ensure `record_size` & `capacity` are positive `int`s
+        if (not isinstance(record_size, int)):
+            raise TypeError("`record_size` must be of TYPE `int`")
+        elif (record_size < 1):
+            raise ValueError("`record_size` must be at LEAST 1")
+        if (not isinstance(capacity, int)):
+            raise TypeError("`capacity` must be of TYPE `int`")
+        elif (capacity < 1):
+            raise ValueError("`capacity` must be at LEAST 1")
+
+        # STEP 3: Ensure `name` (if any) is a `str`
+        if ((name is not None) and (not isinstance(name, str))):
+            raise TypeError("`name` must be of TYPE `str` or `None`")
+
+        # STEP 4: Create the block & record it's layout in the header
+        shm = shared_memory.SharedMemory(
+            name = name, create = True,
+            size = ShmQueue.DATA_OFFSET + capacity * record_size)
+        self.__open(shm, True)
+        self._ctrl[ShmQueue.META_OFFSET // 8] = capacity
+        self._ctrl[ShmQueue.META_OFFSET // 8 + 1] = record_size
+        self._ctrl[ShmQueue.HEAD_OFFSET // 8] = 0
+        self._ctrl[ShmQueue.TAIL_OFFSET // 8] = 0
+        self.__load_layout()
+
+    @classmethod
+    def attach(cls, name):
+        """
+        ATTACHES to a queue that another process created, reading it's
+        `capacity` & `record_size` from the header.
+
+        :Parameters:
+            - `name`: the `name` of the existing queue
+
+        :Return:
+            A `ShmQueue` sharing the block of the existing queue
+        """
+
+        # STEP 1: Ensure the CPU keeps stores in order & `name` is a `str`
+        ShmQueue.__check_platform()
+        if (not isinstance(name, str)):
+            raise TypeError("`name` must be of TYPE `str`")
+
+        # STEP 2: Open the block WITHOUT running `__init__`
+        queue = cls.__new__(cls)
+        queue.__open(shared_memory.SharedMemory(name = name), False)
+        queue.__load_layout()
+        return queue
+
+    @staticmethod
+    def __check_platform():
+        """
+        RAISES an error on a CPU that may REORDER stores, as the consumer
+        could then see a new `tail` BEFORE the record it publishes.
+        """
+        machine = platform.machine()
+        if (machine.lower() not in ShmQueue.ORDERED_MACHINES):
+            raise RuntimeError("ShmQueue relies on x86 store ordering & can NOT "
+                               "run on '{}'".format(machine))
+
+    def __open(self, shm, owner):
+        """
+        WRAPS an opened block `shm` in the views used to access it.
+        """
+        self._shm = shm
+        self._owner = owner
+        self._ctrl = shm.buf[:ShmQueue.DATA_OFFSET].cast('Q')
+        self._data = None
+
+    def __load_layout(self):
+        """
+        READS the layout of the block from it's header & primes the cached
+        copies of the counters.
+        """
+        self._capacity = self._ctrl[ShmQueue.META_OFFSET // 8]
+        self._record_size = self._ctrl[ShmQueue.META_OFFSET // 8 + 1]
+        self._data = self._shm.buf[ShmQueue.DATA_OFFSET:ShmQueue.DATA_OFFSET
+                                   + self._capacity * self._record_size]
+        self._head = self._ctrl[ShmQueue.HEAD_OFFSET // 8]
+        self._tail = self._ctrl[ShmQueue.TAIL_OFFSET // 8]
+
+    @property
+    def name(self):
+        """
+        The NAME of the shared-memory block, to be passed to `attach`.
+        """
+        return self._shm.name
+
+    @property
+    def capacity(self):
+        """
+        The number of record SLOTS in the circular buffer.
+        """
+        return self._capacity
+
+    @property
+    def record_size(self):
+        """
+        The number of BYTES in every record.
+        """
+        return self._record_size
+
+    def __len__(self):
+        """
+        RETRIEVES the number of records in the queue in O(1), as last seen
+        by this process.
+        """
+        return (self._ctrl[ShmQueue.TAIL_OFFSET // 8]
+                - self._ctrl[ShmQueue.HEAD_OFFSET // 8])
+
+    def is_empty(self):
+        """
+        CHECKS if the queue has NO records (as seen by the consumer).
+        """
+        if (self._head == self._tail):
+            self._tail = self._ctrl[ShmQueue.TAIL_OFFSET // 8]
+        return (self._head == self._tail)
+
+    def full(self):
+        """
+        CHECKS if every slot holds a record (as seen by the producer).
+        """
+        if (self._tail - self._head == self._capacity):
+            self._head = self._ctrl[ShmQueue.HEAD_OFFSET // 8]
+        return (self._tail - self._head == self._capacity)
+
+    def __getitem__(self, i):
+        """
+        RETRIEVES the record `i` places from the FRONT (negative `i` counts
+        from the BACK) as a ZERO-copy `memoryview` of it's slot, which is
+        only valid until the record is dequeued.
+        """
+
+        # STEP 1: Ensure `i` is an `int` within the queue
+        if (not isinstance(i, int)):
+            raise TypeError("`i` must be of TYPE `int`")
+        self._tail = self._ctrl[ShmQueue.TAIL_OFFSET // 8]
+        size = self._tail - self._head
+        if (i < 0):
+            i += size
+        if ((i < 0) or (i >= size)):
+            raise IndexError("ShmQueue index out of range")
+
+        # STEP 2: Slice the slot out of the buffer
+        start = ((self._head + i) % self._capacity) * self._record_size
+        return self._data[start:start + self._record_size]
+
+    def peek(self):
+        """
+        RETRIEVES the FRONT record as a ZERO-copy `memoryview` of it's slot.
+
+        :Return:
+            - A `memoryview` of the FRONT record, OR
+            - `None`: if the queue is EMPTY
+        """
+        if (self.is_empty()):
+            return None
+        start = (self._head % self._capacity) * self._record_size
+        return self._data[start:start + self._record_size]
+
+    def enqueue(self, new_value):
+        """
+        ADDS a `new_value` record at the END of the queue in O(1). Unlike an
+        `ArrQueue` the buffer can NOT grow, so the producer must check
+        `full` (or handle the `OverflowError`) when the consumer falls
+        behind.
+
+        :Parameters:
+            - `new_value`: a BYTES-like record of exactly `record_size` bytes
+
+        :Return:
+            The NEWLY added LAST record in the queue
+        """
+
+        # STEP 1: Ensure there is a free slot
+        if (self.full()):
+            raise OverflowError("ShmQueue is FULL")
+
+        # STEP 2: Copy the record into the slot at the BACK, then publish it
+        start = (self._tail % self._capacity) * self._record_size
+        self._data[start:start + self._record_size] = new_value
+        self._tail += 1
+        self._ctrl[ShmQueue.TAIL_OFFSET // 8] = self._tail
+        return new_value
+
+    def dequeue(self):
+        """
+        REMOVES the record at the FRONT of the queue in O(1), freeing it's
+        slot for the producer. As with an `ArrQueue`, the NEW & LAST record
+        is returned, WITHOUT copying. Read the FRONT record (e.g. via `peek`)
+        BEFORE dequeueing it, or use `dequeue_record` to get it as a copy.
+
+        :Return:
+            - The NEW & LAST record in the queue (as a `memoryview`), OR
+            - `None`: if the queue is EMPTY
+        """
+
+        # STEP 1: Check if the queue is EMPTY
+        if (self.is_empty()):
+            return None
+
+        # STEP 2: Publish the freed slot to the producer
+        self._head += 1
+        self._ctrl[ShmQueue.HEAD_OFFSET // 8] = self._head
+
+        # STEP 3: Return the LAST record, if there is one
+        if (self.is_empty()):
+            return None
+        start = ((self._tail - 1) % self._capacity) * self._record_size
+        return self._data[start:start + self._record_size]
+
+    def dequeue_record(self):
+        """
+        REMOVES the record at the FRONT of the queue in O(1) & returns it.
+        As the producer may overwrite the freed slot, the record is COPIED
+        out first, so `peek` & `dequeue` remain the ZERO-copy path.
+
+        :Return:
+            - The REMOVED record (as `bytes`), OR
+            - `None`: if the queue is EMPTY
+        """
+
+        # STEP 1: Check if the queue is EMPTY
+        if (self.is_empty()):
+            return None
+
+        # STEP 2: Copy the record out BEFORE it's slot is freed
+        start = (self._head % self._capacity) * self._record_size
+        record = bytes(self._data[start:start + self._record_size])
+
+        # STEP 3: Publish the freed slot to the producer
+        self._head += 1
+        self._ctrl[ShmQueue.HEAD_OFFSET // 8] = self._head
+        return record
+
+    def enqueue_many(self, records):
+        """
+        ADDS as many of the back-to-back `records` as there are free slots,
+        copying them in at most 2 SLICES & publishing the new `tail` ONCE.
+
+        :Parameters:
+            - `records`: a BYTES-like buffer of records laid back to back,
+              i.e. a multiple of `record_size` bytes
+
+        :Return:
+            The number of records added (the rest should be retried)
+        """
+
+        # STEP 1: Ensure `records` holds whole records
+        records = memoryview(records).cast('B')
+        if (len(records) % self._record_size != 0):
+            raise ValueError("`records` must be a multiple of `record_size` bytes")
+
+        # STEP 2: Count the records that fit in the free slots
+        self._head = self._ctrl[ShmQueue.HEAD_OFFSET // 8]
+        count = min(len(records) // self._record_size,
+                    self._capacity - (self._tail - self._head))
+
+        # STEP 3: Copy up to the END of the buffer, then wrap to the START
+        slot = self._tail % self._capacity
+        first = min(count, self._capacity - slot) * self._record_size
+        total = count * self._record_size
+        start = slot * self._record_size
+        self._data[start:start + first] = records[:first]
+        self._data[:total - first] = records[first:total]
+
+        # STEP 4: Publish every record at once
+        self._tail += count
+        self._ctrl[ShmQueue.TAIL_OFFSET // 8] = self._tail
+        return count
+
+    def dequeue_many(self, n):
+        """
+        REMOVES up to `n` records from the FRONT of the queue, copying them
+        out in at most 2 SLICES & publishing the new `head` ONCE.
+
+        :Parameters:
+            - `n`: the MAXIMUM number of records to be removed
+
+        :Return:
+            The removed records laid back to back in ONE `bytes` object
+        """
+
+        # STEP 1: Ensure `n` is a non-negative `int`
+        if (not isinstance(n, int)):
+            raise TypeError("`n` must be of TYPE `int`")
+        elif (n < 0):
+            raise ValueError("`n` must be at LEAST 0")
+
+        # STEP 2: Count the records available
+        self._tail = self._ctrl[ShmQueue.TAIL_OFFSET // 8]
+        count = min(n, self._tail - self._head)
+
+        # STEP 3: Copy up to the END of the buffer, then wrap to the START
+        slot = self._head % self._capacity
+        first = min(count, self._capacity - slot) * self._record_size
+        total = count * self._record_size
+        start = slot * self._record_size
+        records = bytes(self._data[start:start + first]) + bytes(self._data[:total - first])
+
+        # STEP 4: Free every slot at once
+        self._head += count
+        self._ctrl[ShmQueue.HEAD_OFFSET // 8] = self._head
+        return records
+
+    def close(self):
+        """
+        DETACHES this process from the block. Any `memoryview` handed out
+        (e.g. by `peek`) must be released first.
+        """
+        self._data.release()
+        self._ctrl.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        DESTROYS the block once EVERY process has closed it, which only the
+        creator of the queue may do.
+        """
+        if (not self._owner):
+            raise PermissionError("only the creator of a `ShmQueue` may unlink it")
+        self._shm.unlink()
\ No newline at end of file
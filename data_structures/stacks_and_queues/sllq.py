@@ -6,11 +6,16 @@
 
 from enum import Enum
 
+from linked_nodes import check_pool, node_allocator
+from overflow_policy import OverflowPolicy
+
 # ---------------------------------------------------------------------------- #
 
-class SLLQ(object):
+class SLLQ(OverflowPolicy):
     """
-    An INTERFACE for a singly linked-list queue (SLLQ).
+    An INTERFACE for a singly linked-list queue (SLLQ). With `max_items`,
+    the SLLQ is BOUNDED & sheds load as per it's `overflow` policy once
+    full (see `OverflowPolicy`).
     """
 
     class CMPValues(Enum):
@@ -69,16 +74,25 @@ class SLLQ(object):
         def next(self):
             del self._next
 
-    def __init__(self, cmp_fn):
+    def __init__(self, cmp_fn, pool = None, max_items = None, overflow = "reject"):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Validate & assign the overflow policy
+        OverflowPolicy.__init__(self, max_items, overflow)
+
+        # STEP 4: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self.__new_node = node_allocator(SLLQ.Node, pool)
         self._head = None
         self._tail = None
+        self._size = 0
 
     @property
     def cmp_fn(self):
@@ -110,6 +124,14 @@ class SLLQ(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
     @property
     def head(self):
         """
@@ -164,20 +186,37 @@ class SLLQ(object):
         """
         return ((self.head == None) and (self.tail == None))
 
+    def __len__(self):
+        """
+        RETRIEVES the number of nodes in the SLLQ in O(1).
+        """
+        return self._size
+
     def enqueue(self, new_key):
         """
-        INSERTS a new TAIL (i.e. END) node in the SLLQ.
+        INSERTS a new TAIL (i.e. END) node in the SLLQ. If the SLLQ already
+        holds `max_items` nodes, the `overflow` policy applies.
 
         :Parameters:
             - `new_key`: the INFORMATION to be associated with the new 
               TAIL SLLQ node
 
         :Return: 
-            A POINTER to the newly added SLLQ TAIL node
+            - A POINTER to the newly added SLLQ TAIL node, OR
+            - `None`: if the SLLQ is FULL & `new_key` got dropped
+
+        :Raises:
+            - `OverflowError`: if the SLLQ is FULL & `overflow` is 'reject'
         """
+
+        # STEP 1: If the SLLQ is FULL, shed load as per the overflow policy
+        if (not self._has_room()):
+            if (self._shed()):
+                return None
+            return self.__overwrite_front(new_key)
         
-        # STEP 1: Initialise the new TAIL node & POINTER variables
-        new_tail = SLLQ.Node(new_key)
+        # STEP 2: Initialise the new TAIL node & POINTER variables
+        new_tail = self.__new_node(new_key)
 
         # CASE A: 1st insertion into the SLLQ
         if (self.tail == None):
@@ -188,9 +227,30 @@ class SLLQ(object):
             self.tail.next = new_tail
             self.tail = new_tail
         
-        # STEP 2: Return the newly added TAIL node
+        # STEP 3: Count the node & return the newly added TAIL node
+        self._size += 1
+        if (self._size > self._high_water):
+            self._high_water = self._size
         return self.tail
 
+    def __overwrite_front(self, new_key):
+        """
+        OVERWRITES the oldest key in O(1) by MOVING the HEAD node to the
+        TAIL with `new_key`, instead of freeing one node & allocating another.
+        """
+
+        # STEP 1: Relink the old HEAD after the TAIL (if NOT the only node)
+        old_head = self.head
+        if (old_head is not self.tail):
+            self.head = old_head.next
+            old_head.next = None
+            self.tail.next = old_head
+            self.tail = old_head
+
+        # STEP 2: Return the new TAIL node, now holding `new_key`
+        old_head.key = new_key
+        return old_head
+
     def dequeue(self):
         """
         DELETES the HEAD (i.e. FIRST) node of the SLLQ.
@@ -203,6 +263,7 @@ class SLLQ(object):
         # STEP 1: Check if the SLLQ is empty
         if (self.is_empty()):
             return None
+        old_head = self.head
 
         # CASE A: Only ONE node in the SLLQ remains
         if (self.head == self.tail):
@@ -212,7 +273,10 @@ class SLLQ(object):
         else:
             self.head = self.head.next
 
-        # STEP 2: Read the new SLLQ HEAD node
+        # STEP 2: Recycle the deleted node & return the new SLLQ HEAD node
+        self._size -= 1
+        if (self._pool is not None):
+            self._pool.release(old_head)
         return self.head
 
     def __iterative_search(self, target_key):
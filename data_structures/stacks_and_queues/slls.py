@@ -6,6 +6,8 @@
 
 from enum import Enum
 
+from linked_nodes import check_pool, node_allocator
+
 # ---------------------------------------------------------------------------- #
 
 class SLLS(object):
@@ -69,14 +71,19 @@ class SLLS(object):
         def next(self):
             del self._next
 
-    def __init__(self, cmp_fn):
+    def __init__(self, cmp_fn, pool = None):
 
         # STEP 1: Ensure `cmp_fn` is a function
         if (not callable(cmp_fn)):
             raise TypeError("`cmp_fn` must be of TYPE 'function'")
 
-        # STEP 2: Assign class attributes
+        # STEP 2: Ensure `pool` (if any) can acquire & release nodes
+        check_pool(pool)
+
+        # STEP 3: Assign class attributes
         self._cmp_fn = cmp_fn
+        self._pool = pool
+        self.__new_node = node_allocator(SLLS.Node, pool)
         self._head = None
         self._tail = None
 
@@ -110,10 +117,18 @@ class SLLS(object):
     def cmp_fn(self):
         del self._cmp_fn
 
+    @property
+    def pool(self):
+        """
+        An OPTIONAL `NodePool` that recycles deleted nodes into new ones, or
+        `None` if every node is freshly allocated.
+        """
+        return self._pool
+
     @property
     def head(self):
         """
-        The FIRST node in the SLLQ.
+        The FIRST (i.e. TOP) node in the SLLS.
         """
         return self._head
     
@@ -135,7 +150,7 @@ class SLLS(object):
     @property
     def tail(self):
         """
-        The LAST node in the SLLQ.
+        The LAST (i.e. BOTTOM) node in the SLLS.
         """
         return self._tail
     
@@ -156,74 +171,64 @@ class SLLS(object):
 
     def is_empty(self):
         """
-        CHECKS if the SLLQ is empty.
+        CHECKS if the SLLS is empty.
 
         :Return: 
-            - `True`: if the SLLQ is empty
-            - `False`: if the SLLQ is NOT empty
+            - `True`: if the SLLS is empty
+            - `False`: if the SLLS is NOT empty
         """
         return ((self.head == None) and (self.tail == None))
 
     def push(self, new_key):
         """
-        INSERTS a new TAIL (i.e. END) node in the SLLS.
+        INSERTS a new HEAD (i.e. TOP) node in the SLLS in O(1).
 
         :Parameters:
             - `new_key`: the INFORMATION to be associated with the new 
-              TAIL SLLS node
+              TOP SLLS node
 
         :Return: 
-            A POINTER to the newly added SLLS TAIL node
+            A POINTER to the newly added SLLS TOP node
         """
         
-        # STEP 1: Initialise the new TAIL node & POINTER variables
-        new_tail = SLLS.Node(new_key)
+        # STEP 1: Initialise the new TOP node & POINTER variables
+        new_head = self.__new_node(new_key)
+        new_head.next = self.head
 
-        # CASE A: 1st insertion into the SLLS
-        if (self.tail == None):
-            self.head = self.tail = new_tail
+        # EXCEPTION: 1st insertion into the SLLS
+        if (self.is_empty()):
+            self.tail = new_head
+        self.head = new_head
 
-        # CASE B: NOT the 1st insertion into the SLLS
-        else:
-            self.tail.next = new_tail
-            self.tail = new_tail
-        
-        # STEP 2: Return the newly added TAIL node
-        return self.tail
+        # STEP 2: Return the newly added TOP node
+        return self.head
     
     def pop(self):
         """
-        DELETES the TAIL (i.e. END) node of the SLLS.
+        DELETES the HEAD (i.e. TOP) node of the SLLS in O(1).
 
         :Return:
-            - A POINTER to the new SLLS TAIL node, OR
+            - A POINTER to the new SLLS TOP node, OR
             - `None`: if the SLLS has NO nodes to delete
         """
         
-        # STEP 1: Initialise the POINTER variables
-        tmp = self.head
-
-        # CASE A: ZERO nodes in the SLLS
-        if (tmp == None):
-            return
+        # STEP 1: Check if the SLLS is empty
+        if (self.is_empty()):
+            return None
+        old_head = self.head
 
-        # CASE B: Only ONE node is the SLLS remaining
-        elif (tmp.next == None):
+        # CASE A: Only ONE node in the SLLS remains
+        if (self.head == self.tail):
             self.head = self.tail = None
 
-        # CASE C: At least TWO nodes in the SLLS
+        # CASE B: At LEAST TWO nodes in the SLLS
         else:
+            self.head = self.head.next
 
-            # STEP BI: Iterate the 2nd last node
-            while (tmp.next.next):
-                tmp = tmp.next
-
-            # STEP BII: Adjust the pointers of the NEW tail
-            tmp.next = None
-            self.tail = tmp
-
-        # STEP 2: Return the new SLLS TAIL node
-        return self.tail
+        # STEP 2: Recycle the deleted node & return the new SLLS TOP node
+        if (self._pool is not None):
+            self._pool.release(old_head)
+        return self.head
 
     def __iterative_search(self, target_key):
         """
@@ -0,0 +1,220 @@
+# @file     test_array_queue.py
+# @brief    A file for testing the array (i.e. ring buffer) queue
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import collections
+import queue
+import random
+import threading
+from array import array
+
+import pytest
+
+from array_queue import ArrQueue, SyncArrQueue
+
+# ---------------------------------------------------------------------------- #
+
+def test_sync_put_get_in_order():
+    q = SyncArrQueue(maxsize = 4)
+    for value in range(4):
+        q.put(value)
+    assert q.full()
+    assert [q.get() for _ in range(4)] == [0, 1, 2, 3]
+    assert q.qsize() == 0
+
+def test_sync_timeouts():
+    q = SyncArrQueue(maxsize = 1)
+    with pytest.raises(queue.Empty):
+        q.get(timeout = 0.01)
+    with pytest.raises(queue.Empty):
+        q.get(block = False)
+    q.put(1)
+    with pytest.raises(queue.Full):
+        q.put(2, timeout = 0.01)
+    with pytest.raises(queue.Full):
+        q.put(2, block = False)
+
+def test_sync_drain_empty_keeps_buffer_type():
+    assert SyncArrQueue().drain() == []
+    typed = SyncArrQueue(typecode = "d").drain()
+    assert isinstance(typed, array) and (typed.typecode == "d")
+    assert len(typed) == 0
+
+def test_sync_drain_batch():
+    q = SyncArrQueue(typecode = "q")
+    for value in range(10):
+        q.put(value)
+    assert list(q.drain(max_items = 4)) == [0, 1, 2, 3]
+    assert list(q.drain()) == [4, 5, 6, 7, 8, 9]
+
+def waits_for_the_lock(q, read):
+    results = []
+    with q._lock:
+        reader = threading.Thread(target = lambda: results.append(read()))
+        reader.start()
+        reader.join(0.05)
+        assert reader.is_alive()
+    reader.join(5)
+    return results[0]
+
+def test_sync_reads_hold_the_lock():
+    q = SyncArrQueue(maxsize = 4)
+    q.put(1)
+    q.put(2)
+    assert waits_for_the_lock(q, lambda: q.search(2)) == 2
+    assert waits_for_the_lock(q, lambda: q.arr) == [1, 2]
+    q.arr = [3]
+    assert q.get() == 3
+    del q.arr
+    assert q.qsize() == 0
+
+def test_sync_threads_hand_off_every_item():
+    q = SyncArrQueue(maxsize = 8)
+    received = []
+
+    def consume():
+        while (len(received) < 1000):
+            received.extend(q.drain(block = True, timeout = 5))
+
+    consumer = threading.Thread(target = consume)
+    consumer.start()
+    for value in range(1000):
+        q.put(value, timeout = 5)
+    consumer.join(5)
+    assert received == list(range(1000))
+
+
+def bounded(**kwargs):
+    return ArrQueue(**kwargs)
+
+def test_overflow_reject():
+    q = bounded(max_items = 2)
+    q.enqueue(1)
+    q.enqueue(2)
+    with pytest.raises(OverflowError):
+        q.enqueue(3)
+    assert (len(q), q.dropped, q.high_water) == (2, 0, 2)
+
+def test_overflow_drop_oldest_and_newest():
+    q = bounded(max_items = 2, overflow = "drop_oldest")
+    for value in range(5):
+        q.enqueue(value)
+    assert list(q.arr) == [3, 4]
+    assert q.dropped == 3
+    q = bounded(max_items = 2, overflow = "drop_newest")
+    for value in range(5):
+        assert (q.enqueue(value) is None) == (value >= 2)
+    assert list(q.arr) == [0, 1]
+    assert (q.dropped, q.high_water) == (3, 2)
+    q.dequeue()
+    q.reset_counters()
+    assert (q.dropped, q.high_water) == (0, 1)
+
+def test_overflow_rejects_block():
+    with pytest.raises(ValueError):
+        bounded(overflow = "block")
+    with pytest.raises(TypeError):
+        bounded(overflow = 1)
+
+def test_arr_setter_respects_max_items():
+    q = ArrQueue(max_items = 2)
+    with pytest.raises(ValueError):
+        q.arr = [1, 2, 3]
+    q.arr = [1, 2]
+    assert (list(q.arr), q.high_water) == ([1, 2], 2)
+    with pytest.raises(OverflowError):
+        q.enqueue(3)
+
+@pytest.mark.parametrize("shrink", [False, True])
+def test_ring_buffer_matches_a_deque(shrink):
+    rng = random.Random(10)
+    q, model = ArrQueue(capacity = 2, shrink = shrink), collections.deque()
+    for step in range(5000):
+        if (rng.random() < (0.7 if (step < 2500) else 0.3)):
+            q.enqueue(step)
+            model.append(step)
+        else:
+            q.dequeue()
+            if (model):
+                model.popleft()
+        assert len(q) == len(model)
+        if (model):
+            assert (q[0], q[-1]) == (model[0], model[-1])
+        if (shrink and (q.capacity > 2)):
+            assert len(q) > q.capacity // 4
+    assert list(q.arr) == list(model)
+
+def test_enqueue_wraps_around_the_buffer():
+    q = ArrQueue(capacity = 4)
+    for value in range(3):
+        q.enqueue(value)
+    q.dequeue()
+    q.dequeue()
+    for value in range(3, 6):
+        q.enqueue(value)
+    assert (q.capacity, list(q.arr)) == (4, [2, 3, 4, 5])
+    q.enqueue(6)
+    assert (q.capacity, list(q.arr)) == (8, [2, 3, 4, 5, 6])
+
+def test_shrink_stops_at_initial_capacity():
+    q = ArrQueue(capacity = 4, shrink = True)
+    for value in range(64):
+        q.enqueue(value)
+    assert q.capacity == 64
+    while (len(q) > 0):
+        q.dequeue()
+    assert q.capacity == 4
+    assert ArrQueue(capacity = 4).shrink is False
+
+def test_dequeue_returns_the_last_item():
+    q = ArrQueue()
+    q.enqueue(1)
+    q.enqueue(2)
+    assert q.dequeue() == 2
+    assert q.dequeue() is None
+    assert q.dequeue() is None
+
+def test_index_and_search():
+    q = ArrQueue(capacity = 2)
+    for value in range(5):
+        q.enqueue(value)
+    q.dequeue()
+    q[0] = 10
+    assert [q[i] for i in range(-4, 4)] == [10, 2, 3, 4, 10, 2, 3, 4]
+    with pytest.raises(IndexError):
+        q[4]
+    for mode in ("i", "r"):
+        assert q.search(3, mode) == 3
+        assert q.search(0, mode) is None
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_enqueue_many_dequeue_many(typecode):
+    q = ArrQueue(capacity = 4, typecode = typecode)
+    q.enqueue_many(range(3))
+    q.dequeue_many(2)
+    assert q.enqueue_many(array("q", range(3, 10))) == 7
+    items = q.dequeue_many(5)
+    assert list(items) == [2, 3, 4, 5, 6]
+    assert type(items) is type(q.arr)
+    assert list(q.dequeue_many(100)) == [7, 8, 9]
+    with pytest.raises(ValueError):
+        q.dequeue_many(-1)
+
+def test_bounded_enqueue_many_counts_kept_items():
+    q = ArrQueue(max_items = 3, overflow = "drop_newest")
+    assert q.enqueue_many(range(5)) == 3
+    q = ArrQueue(max_items = 3, overflow = "drop_oldest")
+    assert q.enqueue_many(range(5)) == 5
+    assert list(q.arr) == [2, 3, 4]
+
+def test_view_unwraps_a_typed_queue():
+    q = ArrQueue(capacity = 4, typecode = "d")
+    q.enqueue_many([0, 1, 2])
+    q.dequeue_many(2)
+    q.enqueue_many([3, 4, 5])
+    with q.view() as items:
+        assert items.tolist() == [2.0, 3.0, 4.0, 5.0]
+    with pytest.raises(TypeError):
+        ArrQueue().view()
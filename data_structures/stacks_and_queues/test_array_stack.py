@@ -0,0 +1,66 @@
+# @file     test_array_stack.py
+# @brief    A file for testing the array-based stack
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from array import array
+
+import pytest
+
+from array_stack import ArrStack
+
+# ---------------------------------------------------------------------------- #
+
+def test_rejects_bad_typecode():
+    with pytest.raises(TypeError):
+        ArrStack(typecode = 1)
+    with pytest.raises(ValueError):
+        ArrStack(typecode = 'u')
+
+@pytest.mark.parametrize("typecode", [None, 'q'])
+def test_push_pop_is_lifo(typecode):
+    s = ArrStack(typecode = typecode)
+    for value in range(5):
+        assert s.push(value) == value
+    assert [s.pop() for _ in range(5)] == [3, 2, 1, 0, None]
+    assert (len(s), s.pop()) == (0, None)
+
+def test_typed_stack_is_unboxed():
+    s = ArrStack(typecode = 'd')
+    s.push(1)
+    s.arr = [1.5, 2.5]
+    assert isinstance(s.arr, array) and (s.arr.typecode == 'd')
+    assert list(s.arr) == [1.5, 2.5]
+    with pytest.raises(TypeError):
+        s.push("x")
+    del s.arr
+    assert (len(s), s.arr.typecode) == (0, 'd')
+
+@pytest.mark.parametrize("typecode", [None, 'i'])
+def test_push_many_pop_many(typecode):
+    s = ArrStack(typecode = typecode)
+    assert s.push_many(range(10)) == 10
+    assert s.push_many(array('i', [10, 11])) == 2
+    top = s.pop_many(3)
+    assert list(top) == [9, 10, 11]
+    assert type(top) is type(s.arr)
+    assert list(s.pop_many(100)) == list(range(9))
+    assert list(s.pop_many(0)) == []
+    with pytest.raises(ValueError):
+        s.pop_many(-1)
+    with pytest.raises(TypeError):
+        s.pop_many(1.0)
+
+def test_view_is_zero_copy():
+    s = ArrStack(typecode = 'q')
+    s.push_many(range(4))
+    with s.view() as items:
+        assert items.tolist() == [0, 1, 2, 3]
+        items[0] = 7
+        with pytest.raises(BufferError):
+            s.push(4)
+    assert s[0] == 7
+    s.push(4)
+    with pytest.raises(TypeError):
+        ArrStack().view()
@@ -0,0 +1,226 @@
+# @file     test_dllq.py
+# @brief    A file for testing the doubly linked list queue (DLLQ)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import asyncio
+import gc
+import os
+import queue
+import sys
+import threading
+
+import pytest
+
+from dllq import AsyncDLLQ, DLLQ, SyncDLLQ
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "linked_lists"))
+from node_pool import NodePool
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_dequeue_returns_new_head_with_pool():
+    for weak_prev in (False, True):
+        pool = NodePool()
+        q = DLLQ(cmp_fn, pool = pool, weak_prev = weak_prev)
+        for key in range(3):
+            q.enqueue(key)
+        assert q.dequeue() is q.head
+        q.enqueue(3)
+        assert pool.hits == 1
+        assert [q.dequeue().key, q.dequeue().key, q.dequeue()] == [2, 3, None]
+        assert q.dequeue() is None
+
+def test_dequeue_returns_node_without_pool():
+    q = DLLQ(cmp_fn)
+    for key in range(2):
+        q.enqueue(key)
+    node = q.head
+    assert q.dequeue() is q.head
+    assert node.key == 0
+
+def test_clear_leaves_no_cycles_once_pool_is_full():
+    for weak_prev in (False, True):
+        pool = NodePool(cap = 10)
+        gc.collect()
+        gc.disable()
+        try:
+            q = DLLQ(cmp_fn, pool = pool, weak_prev = weak_prev)
+            for key in range(1000):
+                q.enqueue(key)
+            q.clear()
+            del q
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+        assert len(pool) == 10
+
+def test_sync_put_get_and_timeouts():
+    q = SyncDLLQ(cmp_fn, maxsize = 2)
+    q.put(1)
+    q.put(2)
+    with pytest.raises(queue.Full):
+        q.put(3, timeout = 0.01)
+    assert q.get() == 1
+    assert q.drain() == [2]
+    with pytest.raises(queue.Empty):
+        q.get(timeout = 0.01)
+
+def waits_for_the_lock(q, read):
+    results = []
+    with q._lock:
+        reader = threading.Thread(target = lambda: results.append(read()))
+        reader.start()
+        reader.join(0.05)
+        assert reader.is_alive()
+    reader.join(5)
+    return results[0]
+
+def test_sync_reads_hold_the_lock():
+    q = SyncDLLQ(cmp_fn)
+    assert waits_for_the_lock(q, q.is_empty)
+    q.put(1)
+    assert waits_for_the_lock(q, lambda: q.search(1)).key == 1
+    assert waits_for_the_lock(q, lambda: q.search(1, 'r')).key == 1
+
+def test_sync_threads_hand_off_every_item():
+    q = SyncDLLQ(cmp_fn, maxsize = 8)
+    received = []
+
+    def consume():
+        while (len(received) < 1000):
+            received.append(q.get(timeout = 5))
+
+    consumer = threading.Thread(target = consume)
+    consumer.start()
+    for value in range(1000):
+        q.put(value, timeout = 5)
+    consumer.join(5)
+    assert received == list(range(1000))
+
+
+def test_async_put_get_order():
+
+    async def main():
+        q = AsyncDLLQ(cmp_fn, maxsize = 2)
+        await q.put(1)
+        q.put_nowait(2)
+        with pytest.raises(asyncio.QueueFull):
+            q.put_nowait(3)
+        assert (q.qsize(), len(q), q.full()) == (2, 2, True)
+        items = [await q.get(), q.get_nowait()]
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
+        return items
+
+    assert asyncio.run(main()) == [1, 2]
+
+def test_async_backpressure_and_batches():
+
+    async def main():
+        q = AsyncDLLQ(cmp_fn, pool = NodePool(), weak_prev = True, maxsize = 4)
+        received = []
+
+        async def produce():
+            for value in range(100):
+                await q.put(value)
+
+        async def consume():
+            while (len(received) < 100):
+                batch = await q.get_batch(8)
+                assert 1 <= len(batch) <= 4
+                received.extend(batch)
+
+        await asyncio.gather(consume(), produce())
+        return received
+
+    assert sorted(asyncio.run(main())) == list(range(100))
+
+def test_async_get_batch_timeout():
+
+    async def main():
+        q = AsyncDLLQ(cmp_fn)
+        assert await q.get_batch(4, timeout = 0.01) == []
+        assert len(q._getters) == 0
+
+    asyncio.run(main())
+
+def test_async_cancelled_getter_passes_wakeup_on():
+
+    async def main():
+        q = AsyncDLLQ(cmp_fn)
+        first = asyncio.ensure_future(q.get())
+        second = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 1
+
+def test_async_clear_wakes_producers():
+
+    async def main():
+        q = AsyncDLLQ(cmp_fn, maxsize = 1)
+        await q.put(1)
+        blocked = asyncio.ensure_future(q.put(2))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        q.clear()
+        await blocked
+        return (len(q), q.get_nowait())
+
+    assert asyncio.run(main()) == (1, 2)
+
+
+def bounded(**kwargs):
+    return DLLQ(cmp_fn, **kwargs)
+
+def test_overflow_reject():
+    q = bounded(max_items = 2)
+    q.enqueue(1)
+    q.enqueue(2)
+    with pytest.raises(OverflowError):
+        q.enqueue(3)
+    assert (len(q), q.dropped, q.high_water) == (2, 0, 2)
+
+def test_overflow_drop_oldest_and_newest():
+    q = bounded(max_items = 2, overflow = "drop_oldest")
+    for value in range(5):
+        q.enqueue(value)
+    assert keys_of(q) == [3, 4]
+    assert q.dropped == 3
+    q = bounded(max_items = 2, overflow = "drop_newest")
+    for value in range(5):
+        assert (q.enqueue(value) is None) == (value >= 2)
+    assert keys_of(q) == [0, 1]
+    assert (q.dropped, q.high_water) == (3, 2)
+    q.dequeue()
+    q.reset_counters()
+    assert (q.dropped, q.high_water) == (0, 1)
+
+def test_overflow_rejects_block():
+    with pytest.raises(ValueError):
+        bounded(overflow = "block")
+    with pytest.raises(TypeError):
+        bounded(overflow = 1)
+
+def keys_of(q):
+    keys = []
+    curr = q.head
+    while (curr is not None):
+        keys.append(curr.key)
+        curr = curr.next
+    return keys
+
+def test_clear_frees_room_in_a_bounded_queue():
+    q = bounded(max_items = 1)
+    q.enqueue(1)
+    q.clear()
+    q.enqueue(2)
+    assert (keys_of(q), q.high_water) == ([2], 1)
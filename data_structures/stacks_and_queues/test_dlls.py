@@ -0,0 +1,145 @@
+# @file     test_dlls.py
+# @brief    A file for testing the doubly linked list stack (DLLS)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import asyncio
+import gc
+import os
+import sys
+
+import pytest
+
+from dlls import AsyncDLLS, DLLS
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "linked_lists"))
+from node_pool import NodePool
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_pop_returns_new_top_with_pool():
+    for weak_prev in (False, True):
+        pool = NodePool()
+        s = DLLS(cmp_fn, pool = pool, weak_prev = weak_prev)
+        for key in range(3):
+            s.push(key)
+        assert s.pop() is s.tail
+        s.push(3)
+        assert pool.hits == 1
+        assert [s.pop().key, s.pop().key, s.pop()] == [1, 0, None]
+        assert s.pop() is None
+
+def test_pop_returns_node_without_pool():
+    s = DLLS(cmp_fn)
+    for key in range(2):
+        s.push(key)
+    node = s.tail
+    assert s.pop() is s.tail
+    assert node.key == 1
+
+def test_clear_leaves_no_cycles_once_pool_is_full():
+    for weak_prev in (False, True):
+        pool = NodePool(cap = 10)
+        gc.collect()
+        gc.disable()
+        try:
+            s = DLLS(cmp_fn, pool = pool, weak_prev = weak_prev)
+            for key in range(1000):
+                s.push(key)
+            s.clear()
+            del s
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+        assert len(pool) == 10
+
+
+def test_async_put_get_order():
+
+    async def main():
+        q = AsyncDLLS(cmp_fn, maxsize = 2)
+        await q.put(1)
+        q.put_nowait(2)
+        with pytest.raises(asyncio.QueueFull):
+            q.put_nowait(3)
+        assert (q.qsize(), len(q), q.full()) == (2, 2, True)
+        items = [await q.get(), q.get_nowait()]
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
+        return items
+
+    assert asyncio.run(main()) == [2, 1]
+
+def test_async_backpressure_and_batches():
+
+    async def main():
+        q = AsyncDLLS(cmp_fn, pool = NodePool(), weak_prev = True, maxsize = 4)
+        received = []
+
+        async def produce():
+            for value in range(100):
+                await q.put(value)
+
+        async def consume():
+            while (len(received) < 100):
+                batch = await q.get_batch(8)
+                assert 1 <= len(batch) <= 4
+                received.extend(batch)
+
+        await asyncio.gather(consume(), produce())
+        return received
+
+    assert sorted(asyncio.run(main())) == list(range(100))
+
+def test_async_get_batch_timeout():
+
+    async def main():
+        q = AsyncDLLS(cmp_fn)
+        assert await q.get_batch(4, timeout = 0.01) == []
+        assert len(q._getters) == 0
+
+    asyncio.run(main())
+
+def test_async_cancelled_getter_passes_wakeup_on():
+
+    async def main():
+        q = AsyncDLLS(cmp_fn)
+        first = asyncio.ensure_future(q.get())
+        second = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 1
+
+def test_async_clear_wakes_producers():
+
+    async def main():
+        q = AsyncDLLS(cmp_fn, maxsize = 1)
+        await q.put(1)
+        blocked = asyncio.ensure_future(q.put(2))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        q.clear()
+        await blocked
+        return (len(q), q.get_nowait())
+
+    assert asyncio.run(main()) == (1, 2)
+
+def test_len_tracks_push_pop_clear():
+    s = DLLS(cmp_fn)
+    for key in range(3):
+        s.push(key)
+    assert len(s) == 3
+    s.pop()
+    assert len(s) == 2
+    s.clear()
+    assert len(s) == 0
+    assert s.pop() is None
+    assert len(s) == 0
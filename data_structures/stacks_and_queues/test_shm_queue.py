@@ -0,0 +1,78 @@
+# @file     test_shm_queue.py
+# @brief    A file for testing the shared-memory ring queue (ShmQueue)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import platform
+
+import pytest
+
+from shm_queue import ShmQueue
+
+# ---------------------------------------------------------------------------- #
+
+@pytest.fixture
+def q():
+    q = ShmQueue(4, capacity = 3)
+    yield q
+    q.close()
+    q.unlink()
+
+def record(i):
+    return i.to_bytes(4, "little")
+
+def test_dequeue_record_returns_removed_record(q):
+    for i in range(3):
+        q.enqueue(record(i))
+    assert q.full()
+    with pytest.raises(OverflowError):
+        q.enqueue(record(3))
+    assert q.dequeue_record() == record(0)
+    q.enqueue(record(3))
+    assert [q.dequeue_record() for _ in range(3)] == [record(1), record(2), record(3)]
+    assert q.dequeue_record() is None
+    assert q.is_empty()
+
+def test_dequeue_returns_last_record_like_arr_queue(q):
+    for i in range(3):
+        q.enqueue(record(i))
+    last = q.dequeue()
+    assert isinstance(last, memoryview) and (bytes(last) == record(2))
+    last.release()
+    q.dequeue()
+    assert q.dequeue() is None
+    assert q.dequeue() is None
+
+def test_peek_then_dequeue(q):
+    q.enqueue(record(7))
+    view = q.peek()
+    assert bytes(view) == record(7)
+    view.release()
+    assert q.dequeue() is None
+    assert q.is_empty()
+
+def test_batches_wrap_around(q):
+    q.enqueue(record(0))
+    q.dequeue()
+    records = b"".join(record(i) for i in range(5))
+    assert q.enqueue_many(records) == 3
+    assert q.dequeue_many(10) == records[:12]
+    assert len(q) == 0
+
+def test_attach_shares_the_block(q):
+    other = ShmQueue.attach(q.name)
+    try:
+        q.enqueue(record(5))
+        assert (other.capacity, other.record_size) == (3, 4)
+        assert other.dequeue_record() == record(5)
+        assert q.enqueue_many(b"".join(record(i) for i in range(3))) == 3
+        with pytest.raises(PermissionError):
+            other.unlink()
+    finally:
+        other.close()
+
+def test_refuses_cpus_that_reorder_stores(monkeypatch):
+    monkeypatch.setattr(platform, "machine", lambda: "aarch64")
+    with pytest.raises(RuntimeError):
+        ShmQueue(4)
@@ -0,0 +1,83 @@
+# @file     test_sllq.py
+# @brief    A file for testing the singly linked list queue (SLLQ)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import os
+import sys
+
+import pytest
+
+from sllq import SLLQ
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "linked_lists"))
+from node_pool import NodePool
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_dequeue_returns_new_head_with_pool():
+    pool = NodePool()
+    q = SLLQ(cmp_fn, pool = pool)
+    for key in range(3):
+        q.enqueue(key)
+    assert q.dequeue() is q.head
+    assert len(pool) == 1
+    q.enqueue(3)
+    assert pool.hits == 1
+    assert keys_of(q) == [1, 2, 3]
+    assert [q.dequeue().key, q.dequeue().key, q.dequeue()] == [2, 3, None]
+    assert q.dequeue() is None
+
+def test_dequeue_returns_node_without_pool():
+    q = SLLQ(cmp_fn)
+    for key in range(2):
+        q.enqueue(key)
+    node = q.head
+    assert q.dequeue() is q.head
+    assert node.key == 0
+
+
+def bounded(**kwargs):
+    return SLLQ(cmp_fn, **kwargs)
+
+def test_overflow_reject():
+    q = bounded(max_items = 2)
+    q.enqueue(1)
+    q.enqueue(2)
+    with pytest.raises(OverflowError):
+        q.enqueue(3)
+    assert (len(q), q.dropped, q.high_water) == (2, 0, 2)
+
+def test_overflow_drop_oldest_and_newest():
+    q = bounded(max_items = 2, overflow = "drop_oldest")
+    for value in range(5):
+        q.enqueue(value)
+    assert keys_of(q) == [3, 4]
+    assert q.dropped == 3
+    q = bounded(max_items = 2, overflow = "drop_newest")
+    for value in range(5):
+        assert (q.enqueue(value) is None) == (value >= 2)
+    assert keys_of(q) == [0, 1]
+    assert (q.dropped, q.high_water) == (3, 2)
+    q.dequeue()
+    q.reset_counters()
+    assert (q.dropped, q.high_water) == (0, 1)
+
+def test_overflow_rejects_block():
+    with pytest.raises(ValueError):
+        bounded(overflow = "block")
+    with pytest.raises(TypeError):
+        bounded(overflow = 1)
+
+def keys_of(q):
+    keys = []
+    curr = q.head
+    while (curr is not None):
+        keys.append(curr.key)
+        curr = curr.next
+    return keys
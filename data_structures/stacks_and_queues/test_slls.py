@@ -0,0 +1,59 @@
+# @file     test_slls.py
+# @brief    A file for testing the singly linked list stack (SLLS)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import os
+import sys
+
+from slls import SLLS
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "linked_lists"))
+from node_pool import NodePool
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_pop_returns_new_head_with_pool():
+    pool = NodePool()
+    s = SLLS(cmp_fn, pool = pool)
+    for key in range(3):
+        s.push(key)
+    assert s.pop() is s.head
+    assert s.head.key == 1
+    s.push(3)
+    assert pool.hits == 1
+    assert [s.pop().key, s.pop().key, s.pop()] == [1, 0, None]
+    assert s.pop() is None
+
+def test_pop_returns_node_without_pool():
+    s = SLLS(cmp_fn)
+    for key in range(2):
+        s.push(key)
+    node = s.head
+    assert s.pop() is s.head
+    assert node.key == 1
+
+def test_push_pop_is_lifo():
+    s = SLLS(cmp_fn)
+    for key in range(100):
+        s.push(key)
+    assert s.head.key == 99
+    popped = []
+    while (not s.is_empty()):
+        popped.append(s.head.key)
+        s.pop()
+    assert popped == list(range(99, -1, -1))
+    assert (s.head, s.tail, s.pop()) == (None, None, None)
+
+def test_search_finds_every_key():
+    s = SLLS(cmp_fn)
+    for key in range(10):
+        s.push(key)
+    for mode in ("i", "r"):
+        assert s.search(4, mode).key == 4
+        assert s.search(11, mode) is None
@@ -614,6 +614,27 @@ class AVL(object):
             self.postorder_walk(root.right_child)
             operation(root.key)
 
+    def __iter__(self):
+        """
+        YIELDS the key of every AVL node in key ORDER, ITERATIVELY & using
+        O(log n) memory, so the AVL can be consumed as a sorted stream.
+        """
+
+        # STEP 1: Initialise the stack of nodes still to be visited
+        stack = []
+        curr = self.root
+        while (stack or (curr != None)):
+
+            # STEP 2: Descend to the LEFT-most unvisited node
+            while (curr != None):
+                stack.append(curr)
+                curr = curr.left_child
+
+            # STEP 3: Visit the node & continue with it's RIGHT subtree
+            curr = stack.pop()
+            yield curr.key
+            curr = curr.right_child
+
     def __iterative_search(self, target_key):
         """
         ITERATIVELY searches the AVL for a node with `target_key`.
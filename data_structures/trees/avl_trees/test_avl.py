@@ -0,0 +1,37 @@
+# @file     test_avl.py
+# @brief    A file for testing the AVL tree
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+from avl import AVL
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def test_iter_yields_keys_in_order():
+    rng = random.Random(7)
+    keys = rng.sample(range(10000), 2000)
+    avl = AVL(cmp_fn)
+    for key in keys:
+        avl.insert_node(key)
+    assert list(avl) == sorted(keys)
+
+    # NOTE: the iteration must stay correct as rotations reshape the tree
+    for key in keys[:1000]:
+        avl.root = avl.delete_node(avl.root, key)
+    assert list(avl) == sorted(keys[1000:])
+
+def test_iter_empty_tree():
+    assert list(AVL(cmp_fn)) == []
+
+def test_iter_is_lazy():
+    avl = AVL(cmp_fn)
+    for key in range(100):
+        avl.insert_node(key)
+    stream = iter(avl)
+    assert [next(stream) for _ in range(3)] == [0, 1, 2]
@@ -4,7 +4,9 @@
 # @note     GitHub: https://github.com/jtd-117
 # ---------------------------------------------------------------------------- #
 
+from bisect import bisect_left
 from enum import Enum
+from functools import cmp_to_key
 
 # ---------------------------------------------------------------------------- #
 
@@ -442,6 +444,267 @@ class BST(object):
             min_node.left_child = node.left_child
             min_node.left_child.parent = min_node
 
+    def __detach_node(self, node, replacement):
+        """
+        DETACHES the subtree rooted at `node` from the BST & puts the subtree
+        rooted at `replacement` in it's place.
+
+        :Parameters:
+            - `node`: the ROOT of the subtree to be removed from the BST
+            - `replacement`: a child subtree of `node` that is KEPT in the BST
+        """
+
+        # STEP 1: Replace `node` with the subtree that is to be KEPT
+        self.__transplant_node(node, replacement)
+
+        # STEP 2: Unlink the detached subtree from the rest of the BST
+        node.parent = None
+        if (node.left_child is replacement):
+            node.left_child = None
+        else:
+            node.right_child = None
+
+    def __trim_greater(self, root, lo):
+        """
+        DETACHES every node in the subtree rooted at `root` whose key is
+        GREATER than or EQUAL to `lo`, where all of these keys are already
+        known to be within the deleted range.
+
+        :Parameters:
+            - `root`: the ROOT node of the subtree to be trimmed
+            - `lo`: the LOWER bound (inclusive) of the deleted range
+        """
+
+        # STEP 1: Only the boundary path from `root` is ever traversed
+        curr = root
+        while (curr != None):
+
+            # CASE 1A: `curr` is KEPT, only it's RIGHT subtree may be in range
+            if (self.cmp_fn(curr.key, lo) == BST.CMPValues.LESS.value):
+                curr = curr.right_child
+
+            # CASE 1B: `curr` & it's RIGHT subtree are in range, detach both
+            else:
+                replacement = curr.left_child
+                self.__detach_node(curr, replacement)
+                curr = replacement
+
+    def __trim_lesser(self, root, hi):
+        """
+        DETACHES every node in the subtree rooted at `root` whose key is LESS
+        than or EQUAL to `hi`, where all of these keys are already known to
+        be within the deleted range.
+
+        :Parameters:
+            - `root`: the ROOT node of the subtree to be trimmed
+            - `hi`: the UPPER bound (inclusive) of the deleted range
+        """
+
+        # STEP 1: Only the boundary path from `root` is ever traversed
+        curr = root
+        while (curr != None):
+
+            # CASE 1A: `curr` is KEPT, only it's LEFT subtree may be in range
+            if (self.cmp_fn(curr.key, hi) == BST.CMPValues.GREATER.value):
+                curr = curr.left_child
+
+            # CASE 1B: `curr` & it's LEFT subtree are in range, detach both
+            else:
+                replacement = curr.right_child
+                self.__detach_node(curr, replacement)
+                curr = replacement
+
+    def delete_range(self, lo, hi):
+        """
+        DELETES every BST node whose key is between `lo` & `hi` (inclusive).
+        Subtrees that lie entirely within the range are DETACHED whole, so
+        only the nodes along the two boundary paths are ever visited.
+
+        :Parameters:
+            - `lo`: the LOWER bound (inclusive) of the keys to be deleted
+            - `hi`: the UPPER bound (inclusive) of the keys to be deleted
+        """
+
+        # STEP 1: Ensure the range is NOT inverted
+        if (self.cmp_fn(lo, hi) == BST.CMPValues.GREATER.value):
+            raise ValueError("`lo` must be LESS than or EQUAL to `hi`")
+
+        # STEP 2: Find the HIGHEST node whose key is within the range
+        split = self.root
+        while (split != None):
+
+            # CASE 2A: Every key in range is to the RIGHT
+            if (self.cmp_fn(split.key, lo) == BST.CMPValues.LESS.value):
+                split = split.right_child
+
+            # CASE 2B: Every key in range is to the LEFT
+            elif (self.cmp_fn(split.key, hi) == BST.CMPValues.GREATER.value):
+                split = split.left_child
+
+            # CASE 2C: Found the node where the range SPLITS
+            else:
+                break
+
+        # STEP 3: NO keys in the BST are within the range
+        if (split is None):
+            return
+
+        # STEP 4: Trim the in-range keys out of both subtrees of `split`
+        self.__trim_greater(split.left_child, lo)
+        self.__trim_lesser(split.right_child, hi)
+        left = split.left_child
+        right = split.right_child
+
+        # STEP 5: Join the REMAINING subtrees, all `left` keys are less than
+        #         all `right` keys
+        if ((left != None) and (right != None)):
+            max_left = self.max_node(left)
+            max_left.right_child = right
+            right.parent = max_left
+            split.right_child = None
+            right = None
+
+        # STEP 6: Replace `split` with the JOINED subtree
+        self.__detach_node(split, left if (left != None) else right)
+
+    def __iterative_inorder(self, root):
+        """
+        ITERATIVELY yields every node in the subtree rooted at `root` in
+        key ORDER, using an explicit stack instead of recursion.
+
+        :Parameters:
+            - `root`: the ROOT node of the BST or subtree
+        """
+
+        # STEP 1: Initialise the stack of nodes still to be visited
+        stack = []
+        curr = root
+        while (stack or (curr != None)):
+
+            # STEP 2: Descend to the LEFT-most unvisited node
+            while (curr != None):
+                stack.append(curr)
+                curr = curr.left_child
+
+            # STEP 3: Visit the node & continue with it's RIGHT subtree
+            curr = stack.pop()
+            yield curr
+            curr = curr.right_child
+
+    def __build_balanced(self, keys):
+        """
+        BUILDS a minimum-height BST from the SORTED `keys` ITERATIVELY. The
+        ROOT of every subtree is the 1st of the run of keys EQUAL to it's
+        middle key, so EQUAL keys always go RIGHT (as `insert_node` puts
+        them) & `search` & `delete_node` still find them. With many EQUAL
+        keys the tree is therefore taller, which is why an explicit stack
+        is used rather than recursion.
+
+        :Parameters:
+            - `keys`: a SORTED `list` of keys
+
+        :Return:
+            A POINTER to the ROOT of the newly built BST
+        """
+
+        # STEP 1: Each entry is a slice `keys[lo:hi]` still to be built, the
+        #         parent node of it's ROOT & the side it hangs off
+        wrap = cmp_to_key(self.cmp_fn)
+        root = None
+        stack = [(0, len(keys), None, False)]
+        while (stack):
+            lo, hi, parent, is_right = stack.pop()
+
+            # CASE A: NO keys remain, the child stays `None`
+            if (lo >= hi):
+                continue
+
+            # CASE B: The ROOT is the 1st key EQUAL to the middle key
+            mid = (lo + hi) // 2
+            mid = bisect_left(keys, wrap(keys[mid]), lo, mid, key = wrap)
+            node = BST.Node(keys[mid])
+            node.parent = parent
+            if (parent is None):
+                root = node
+            elif (is_right):
+                parent.right_child = node
+            else:
+                parent.left_child = node
+
+            # STEP 2: Build the LEFT & RIGHT subtrees
+            stack.append((lo, mid, node, False))
+            stack.append((mid + 1, hi, node, True))
+        return root
+
+    def merge(self, other, unique = False):
+        """
+        MERGES the keys of `other` into the BST & rebuilds it as a perfectly
+        BALANCED tree in O(m + n) time. The `other` BST is left unchanged.
+
+        :Parameters:
+            - `other`: the BST whose keys are to be merged
+            - `unique` (optional): if `True`, only ONE of every group of EQUAL
+              keys is kept (default `False`)
+
+        :Return:
+            A POINTER to the ROOT node of the merged BST
+        """
+
+        # STEP 1: Ensure `other` is of type `BST`
+        if (not isinstance(other, BST)):
+            raise TypeError("`other` must be of TYPE `BST`")
+
+        # STEP 2: Stream both BSTs in key ORDER
+        stream1 = self.__iterative_inorder(self.root)
+        stream2 = self.__iterative_inorder(other.root)
+        node1 = next(stream1, None)
+        node2 = next(stream2, None)
+
+        # STEP 3: Merge the two sorted streams, EQUAL keys from `self` first
+        keys = []
+        while ((node1 != None) or (node2 != None)):
+            if ((node2 is None) or ((node1 != None) and (self.cmp_fn(node2.key,
+                node1.key) != BST.CMPValues.LESS.value))):
+                key = node1.key
+                node1 = next(stream1, None)
+            else:
+                key = node2.key
+                node2 = next(stream2, None)
+
+            # STEP 3A: Skip keys EQUAL to the last kept key if `unique`
+            if (unique and keys and (self.cmp_fn(key, keys[-1])
+                                     == BST.CMPValues.EQUAL.value)):
+                continue
+            keys.append(key)
+
+        # STEP 4: Rebuild the BST from the merged keys
+        self.root = self.__build_balanced(keys)
+        return self.root
+
+    @classmethod
+    def from_iterable(cls, data, cmp_fn):
+        """
+        BUILDS a minimum-height BST from UNSORTED `data`, by sorting it once
+        & splitting on the median, rather than inserting every key.
+
+        :Parameters:
+            - `data`: an ITERABLE of keys to be stored in the BST
+            - `cmp_fn`: a custom function for COMPARING the keys
+
+        :Return:
+            The NEWLY built BST
+        """
+
+        # STEP 1: Initialise an empty BST (also validates `cmp_fn`)
+        bst = cls(cmp_fn)
+
+        # STEP 2: Sort the keys ONCE with the BST comparison function
+        keys = sorted(data, key = cmp_to_key(cmp_fn))
+
+        # STEP 3: Build the BST from the median down
+        bst.root = bst.__build_balanced(keys)
+        return bst
+
     def inorder_walk(self, root, operation = print):
         """
         Performs an ALL-tree TRAVERSAL in the following order:
@@ -499,6 +762,14 @@ class BST(object):
             self.postorder_walk(root.right_child)
             operation(root.key)
 
+    def __iter__(self):
+        """
+        YIELDS the key of every BST node in key ORDER, ITERATIVELY & using
+        O(h) memory, so the BST can be consumed as a sorted stream.
+        """
+        for node in self.__iterative_inorder(self.root):
+            yield node.key
+
     def __iterative_search(self, target_key):
         """
         ITERATIVELY searches the BST for a node with `target_key`.
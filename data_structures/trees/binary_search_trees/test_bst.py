@@ -0,0 +1,128 @@
+# @file     test_bst.py
+# @brief    A file for testing the binary search tree (BST)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from bst import BST
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def keys_of(bst):
+    return list(bst)
+
+def check_invariant(root):
+    """
+    CHECKS every key in a LEFT subtree is LESS & every key in a RIGHT
+    subtree GREATER or EQUAL, along with the parent links, & returns the
+    number of nodes. An explicit stack is used as EQUAL keys make the tree
+    tall.
+    """
+    count = 0
+    stack = [(root, None, None, None)]
+    while (stack):
+        node, parent, lo, hi = stack.pop()
+        if (node is None):
+            continue
+        assert node.parent is parent
+        assert (lo is None) or (node.key >= lo)
+        assert (hi is None) or (node.key < hi)
+        stack.append((node.left_child, node, lo, node.key))
+        stack.append((node.right_child, node, node.key, hi))
+        count += 1
+    return count
+
+def test_from_iterable_sorts_and_balances():
+    data = random.Random(1).sample(range(10_000), 1023)
+    bst = BST.from_iterable(data, cmp_fn)
+    assert keys_of(bst) == sorted(data)
+    assert check_invariant(bst.root) == 1023
+
+def test_from_iterable_duplicates_go_right():
+    rng = random.Random(2)
+    data = [rng.randrange(20) for _ in range(2_000)] + [7] * 3_000
+    bst = BST.from_iterable(data, cmp_fn)
+    assert keys_of(bst) == sorted(data)
+    check_invariant(bst.root)
+
+    # Every copy of every key can be found & deleted one at a time
+    for key in rng.sample(data, len(data)):
+        node = bst.search(key)
+        assert (node is not None) and (node.key == key)
+        bst.delete_node(node)
+    assert bst.root is None
+
+def test_from_iterable_empty():
+    assert BST.from_iterable([], cmp_fn).root is None
+
+def test_merge_keeps_duplicates():
+    bst1 = BST.from_iterable([1, 3, 3, 5, 9], cmp_fn)
+    bst2 = BST.from_iterable([3, 3, 4, 9, 10], cmp_fn)
+    bst1.merge(bst2)
+    assert keys_of(bst1) == [1, 3, 3, 3, 3, 4, 5, 9, 9, 10]
+    assert keys_of(bst2) == [3, 3, 4, 9, 10]
+    check_invariant(bst1.root)
+    for key in (3, 3, 3, 3, 9, 9):
+        bst1.delete_node(bst1.search(key))
+    assert bst1.search(3) is None
+    assert keys_of(bst1) == [1, 4, 5, 10]
+
+def test_merge_unique():
+    bst1 = BST.from_iterable([1, 2, 2, 5], cmp_fn)
+    bst1.merge(BST.from_iterable([2, 5, 6], cmp_fn), unique = True)
+    assert keys_of(bst1) == [1, 2, 5, 6]
+    assert check_invariant(bst1.root) == 4
+
+def test_merge_then_insert_equal_key():
+    bst = BST.from_iterable([4, 4, 4, 4], cmp_fn)
+    bst.merge(BST.from_iterable([4, 4], cmp_fn))
+    bst.insert_node(4)
+    assert check_invariant(bst.root) == 7
+    assert keys_of(bst) == [4] * 7
+
+def test_delete_range_matches_filter():
+    rng = random.Random(3)
+    for _ in range(200):
+        data = [rng.randrange(50) for _ in range(rng.randrange(0, 60))]
+        bst = BST(cmp_fn)
+        for key in data:
+            bst.insert_node(key)
+        lo = rng.randrange(-5, 55)
+        hi = lo + rng.randrange(0, 20)
+        bst.delete_range(lo, hi)
+        assert keys_of(bst) == sorted(k for k in data if not (lo <= k <= hi))
+        check_invariant(bst.root)
+
+def test_delete_range_everything_and_nothing():
+    bst = BST.from_iterable(range(100), cmp_fn)
+    bst.delete_range(200, 300)
+    assert keys_of(bst) == list(range(100))
+    bst.delete_range(0, 99)
+    assert bst.root is None
+
+def test_delete_range_rejects_inverted_range():
+    bst = BST.from_iterable([1, 2, 3], cmp_fn)
+    with pytest.raises(ValueError):
+        bst.delete_range(3, 1)
+
+def height(root):
+    level, depth = [root] if root else [], 0
+    while (level):
+        level = [c for n in level for c in (n.left_child, n.right_child) if c]
+        depth += 1
+    return depth
+
+def test_from_iterable_has_minimal_height():
+    for n in (1, 2, 3, 7, 8, 100, 1024):
+        data = list(range(n))
+        random.Random(n).shuffle(data)
+        bst = BST.from_iterable(iter(data), cmp_fn)
+        assert height(bst.root) == n.bit_length()
+        assert bst.root.parent is None
@@ -0,0 +1,503 @@
+# @file     interval_tree.py
+# @brief    A file for implementing an AVL-balanced interval tree
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+from enum import Enum
+
+# ---------------------------------------------------------------------------- #
+
+class IntervalTree(object):
+    """
+    An INTERFACE for an interval tree, balanced as an AVL tree.
+    """
+
+    class CMPValues(Enum):
+        """
+        The OUTPUT values permitted by `cmp_fn`, a COMPARISON function that
+        takes 2 variables & outputs which of the variables is less than, equal
+        to, or greater than the other.
+        """
+        LESS = -1
+        EQUAL = 0
+        GREATER = 1
+
+    class BFValues(Enum):
+        """
+        BALANCE FACTOR values that indicate whether the LEFT or RIGHT subtrees
+        are taller or equal in height.
+        """
+        RIGHT = -1
+        EQUAL = 0
+        LEFT = 1
+
+    class Node(object):
+        """
+        A NODE for an interval tree, storing the closed interval [key, high].
+        """
+
+        def __init__(self, key, high):
+            self._key = key
+            self._high = high
+            self._max_high = high
+            self._height = 1
+            self._left_child = None
+            self._right_child = None
+
+        @property
+        def key(self):
+            """
+            The LOW endpoint of the interval, used to ORDER the nodes.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def high(self):
+            """
+            The HIGH endpoint of the interval.
+            """
+            return self._high
+
+        @high.setter
+        def high(self, new_high):
+            self._high = new_high
+
+        @high.deleter
+        def high(self):
+            del self._high
+
+        @property
+        def max_high(self):
+            """
+            The LARGEST high endpoint of any interval in the subtree rooted at
+            this node.
+            """
+            return self._max_high
+
+        @max_high.setter
+        def max_high(self, new_max_high):
+            self._max_high = new_max_high
+
+        @max_high.deleter
+        def max_high(self):
+            del self._max_high
+
+        @property
+        def height(self):
+            """
+            HEIGHT is the number of nodes between a given root node & the
+            farthest leaf node.
+            """
+            return self._height
+
+        @height.setter
+        def height(self, new_height):
+            self._height = new_height
+
+        @height.deleter
+        def height(self):
+            del self._height
+
+        @property
+        def left_child(self):
+            """
+            The LEFT CHILD of the node: has an interval LESS than the parent.
+            """
+            return self._left_child
+
+        @left_child.setter
+        def left_child(self, new_left_child):
+
+            # STEP 1: Ensure `new_left_child` is `IntervalTree.Node` or `None`
+            if (isinstance(new_left_child, IntervalTree.Node)
+                or (new_left_child is None)):
+                self._left_child = new_left_child
+                return
+
+            # STEP 2: `new_left_child` is an INAPPROPRIATE type
+            raise TypeError("`new_left_child` must be of TYPE `IntervalTree.Node` or `None`")
+
+        @left_child.deleter
+        def left_child(self):
+            del self._left_child
+
+        @property
+        def right_child(self):
+            """
+            The RIGHT CHILD of the node: has an interval GREATER or EQUAL to
+            the parent.
+            """
+            return self._right_child
+
+        @right_child.setter
+        def right_child(self, new_right_child):
+
+            # STEP 1: Ensure `new_right_child` is `IntervalTree.Node` or `None`
+            if (isinstance(new_right_child, IntervalTree.Node)
+                or (new_right_child is None)):
+                self._right_child = new_right_child
+                return
+
+            # STEP 2: `new_right_child` is an INAPPROPRIATE type
+            raise TypeError("`new_right_child` must be of TYPE `IntervalTree.Node` or `None`")
+
+        @right_child.deleter
+        def right_child(self):
+            del self._right_child
+
+    def __init__(self, cmp_fn):
+
+        # STEP 1: Ensure `cmp_fn` is a function
+        if (not callable(cmp_fn)):
+            raise TypeError("`cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign interval tree attributes
+        self._cmp_fn = cmp_fn
+        self._root = None
+
+    @property
+    def cmp_fn(self):
+        """
+        A custom function for COMPARING interval endpoints.
+
+        :Parameters:
+            - 'v1': The 1st variable for comparison
+            - 'v2': The 2nd variable for comparison
+
+        :Return:
+            - `1`: if `v1` is GREATER than `v2`, OR
+            - `0`: if `v1` & `v2` are EQUAL, OR
+            - `-1`: if `v1` is LESS than `v2`
+        """
+        return self._cmp_fn
+
+    @cmp_fn.setter
+    def cmp_fn(self, new_cmp_fn):
+
+        # STEP 1: Ensure `new_cmp_fn` is of type 'function'
+        if (not callable(new_cmp_fn)):
+            raise TypeError("`new_cmp_fn` must be of TYPE 'function'")
+
+        # STEP 2: Assign the new comparison function
+        self._cmp_fn = new_cmp_fn
+
+    @cmp_fn.deleter
+    def cmp_fn(self):
+        del self._cmp_fn
+
+    @property
+    def root(self):
+        """
+        The TOP or FIRST node in the interval tree.
+        """
+        return self._root
+
+    @root.setter
+    def root(self, new_root):
+
+        # STEP 1: Ensure `new_root` is of type `IntervalTree.Node` or `None`
+        if (isinstance(new_root, IntervalTree.Node) or (new_root is None)):
+            self._root = new_root
+            return
+
+        # STEP 2: `new_root` is an INAPPROPRIATE type
+        raise TypeError("`new_root` must be of TYPE `IntervalTree.Node` or `None`")
+
+    @root.deleter
+    def root(self):
+        del self._root
+
+    def __node_height(self, node):
+        """
+        RETRIEVES the height of a given `node`, where an EMPTY node is 0.
+        """
+        return node.height if node else 0
+
+    def __balance_factor(self, node):
+        """
+        CALCULATES the HEIGHT DIFFERENCE between the LEFT & RIGHT subtrees of
+        a given `node`.
+        """
+        if not node:
+            return 0
+        return (self.__node_height(node.left_child)
+                - self.__node_height(node.right_child))
+
+    def __update_node(self, node):
+        """
+        RECALCULATES the HEIGHT & MAX HIGH endpoint of `node` from it's
+        children, which must already be up to date.
+
+        :Parameters:
+            - `node`: The node to be updated
+        """
+
+        # STEP 1: Recalculate the height
+        node.height = 1 + max(self.__node_height(node.left_child),
+                            self.__node_height(node.right_child))
+
+        # STEP 2: Recalculate the largest high endpoint in the subtree
+        max_high = node.high
+        for child in (node.left_child, node.right_child):
+            if (child and (self.cmp_fn(child.max_high, max_high)
+                           == IntervalTree.CMPValues.GREATER.value)):
+                max_high = child.max_high
+        node.max_high = max_high
+
+    def __left_rotate(self, node):
+        """
+        LEFT ROTATES `node` & returns the child node that replaced it.
+        """
+
+        # STEP 1: Assign the NEW parent & right child nodes of `node`
+        node_p = node.right_child
+        node.right_child = node_p.left_child
+        node_p.left_child = node
+
+        # STEP 2: The demoted node is updated FIRST as it is now the child
+        self.__update_node(node)
+        self.__update_node(node_p)
+        return node_p
+
+    def __right_rotate(self, node):
+        """
+        RIGHT ROTATES `node` & returns the child node that replaced it.
+        """
+
+        # STEP 1: Assign the NEW parent & left child nodes of `node`
+        node_p = node.left_child
+        node.left_child = node_p.right_child
+        node_p.right_child = node
+
+        # STEP 2: The demoted node is updated FIRST as it is now the child
+        self.__update_node(node)
+        self.__update_node(node_p)
+        return node_p
+
+    def __rebalance(self, root):
+        """
+        UPDATES `root` & performs any rotations needed to restore the AVL
+        balance of the subtree rooted at `root`.
+
+        :Return:
+            A POINTER to the new root of the subtree
+        """
+
+        # STEP 1: Update `root` & get the balance factor
+        self.__update_node(root)
+        balance_factor = self.__balance_factor(root)
+
+        # CASE 2A: Height of the LEFT subtree > RIGHT subtree
+        if (balance_factor > IntervalTree.BFValues.LEFT.value):
+            if (self.__balance_factor(root.left_child)
+                < IntervalTree.BFValues.EQUAL.value):
+                root.left_child = self.__left_rotate(root.left_child)
+            return self.__right_rotate(root)
+
+        # CASE 2B: Height of the LEFT subtree < RIGHT subtree
+        if (balance_factor < IntervalTree.BFValues.RIGHT.value):
+            if (self.__balance_factor(root.right_child)
+                > IntervalTree.BFValues.EQUAL.value):
+                root.right_child = self.__right_rotate(root.right_child)
+            return self.__left_rotate(root)
+        return root
+
+    def __cmp_interval(self, low, high, node):
+        """
+        COMPARES the interval [`low`, `high`] against the interval of `node`,
+        by the LOW endpoints first & then by the HIGH endpoints.
+        """
+        result = self.cmp_fn(low, node.key)
+        if (result != IntervalTree.CMPValues.EQUAL.value):
+            return result
+        return self.cmp_fn(high, node.high)
+
+    def __recursive_insert(self, root, new_node):
+        """
+        INSERTS `new_node` into the subtree rooted at `root` RECURSIVELY.
+
+        :Return:
+            A POINTER to the new root of the subtree
+        """
+
+        # BASE CASE: Traversed into an EMPTY slot
+        if not root:
+            return new_node
+
+        # RECURSIVE CASE: Traverse LEFT if LESS, otherwise RIGHT
+        if (self.__cmp_interval(new_node.key, new_node.high, root)
+            == IntervalTree.CMPValues.LESS.value):
+            root.left_child = self.__recursive_insert(root.left_child, new_node)
+        else:
+            root.right_child = self.__recursive_insert(root.right_child, new_node)
+        return self.__rebalance(root)
+
+    def insert_node(self, low, high):
+        """
+        INSERTS the closed interval [`low`, `high`] into the interval tree.
+
+        :Parameters:
+            - `low`: the LOW endpoint of the interval
+            - `high`: the HIGH endpoint of the interval
+
+        :Return:
+            A POINTER to the newly inserted node
+        """
+
+        # STEP 1: Ensure the interval is NOT inverted
+        if (self.cmp_fn(low, high) == IntervalTree.CMPValues.GREATER.value):
+            raise ValueError("`low` must be LESS than or EQUAL to `high`")
+
+        # STEP 2: Perform the insertion recursively
+        new_node = IntervalTree.Node(low, high)
+        self.root = self.__recursive_insert(self.root, new_node)
+        return new_node
+
+    def min_node(self, root):
+        """
+        RETRIEVES the node with the SMALLEST interval in the subtree.
+
+        :Paramters:
+            - `root`: is the ROOT node of the entire tree or subtree
+
+        :Return:
+            A POINTER to the node with the SMALLEST interval
+        """
+
+        # STEP 1: Ensure the `root` is a valid node
+        if (not isinstance(root, IntervalTree.Node)):
+            raise TypeError("`root` must be of TYPE `IntervalTree.Node`")
+
+        # STEP 2: Keep traversing the LEFT-most child provided one exists
+        curr_node = root
+        while (curr_node.left_child != None):
+            curr_node = curr_node.left_child
+        return curr_node
+
+    def __recursive_delete(self, root, low, high):
+        """
+        DELETES the node with the interval [`low`, `high`] RECURSIVELY.
+
+        :Return:
+            A POINTER to the new root of the subtree
+        """
+
+        # BASE CASE: The interval does NOT exist
+        if not root:
+            return None
+
+        # RECURSIVE CASE 1: Traverse towards the matching node
+        result = self.__cmp_interval(low, high, root)
+        if (result == IntervalTree.CMPValues.LESS.value):
+            root.left_child = self.__recursive_delete(root.left_child, low, high)
+        elif (result == IntervalTree.CMPValues.GREATER.value):
+            root.right_child = self.__recursive_delete(root.right_child, low, high)
+
+        # CASE 2A: Node to be deleted has at most ONE child
+        elif (root.left_child is None):
+            return root.right_child
+        elif (root.right_child is None):
+            return root.left_child
+
+        # CASE 2B: Node to be deleted has TWO children, take the successor
+        else:
+            temp = self.min_node(root.right_child)
+            root.key, root.high = temp.key, temp.high
+            root.right_child = self.__recursive_delete(root.right_child,
+                                                       temp.key, temp.high)
+        return self.__rebalance(root)
+
+    def delete_node(self, low, high):
+        """
+        DELETES the closed interval [`low`, `high`] from the interval tree.
+
+        :Parameters:
+            - `low`: the LOW endpoint of the interval
+            - `high`: the HIGH endpoint of the interval
+        """
+        self.root = self.__recursive_delete(self.root, low, high)
+
+    def __recursive_overlapping(self, root, a, b, result):
+        """
+        COLLECTS every node in the subtree rooted at `root` whose interval
+        overlaps [`a`, `b`] into `result`.
+        """
+
+        # BASE CASE: NO interval in this subtree reaches `a`
+        if ((root is None) or (self.cmp_fn(root.max_high, a)
+                               == IntervalTree.CMPValues.LESS.value)):
+            return
+
+        # STEP 1: The LEFT subtree may overlap as it's `max_high` reaches `a`
+        self.__recursive_overlapping(root.left_child, a, b, result)
+
+        # STEP 2: Every interval from `root` onwards starts AFTER `b`
+        if (self.cmp_fn(root.key, b) == IntervalTree.CMPValues.GREATER.value):
+            return
+
+        # STEP 3: Check `root` itself, then the RIGHT subtree
+        if (self.cmp_fn(root.high, a) != IntervalTree.CMPValues.LESS.value):
+            result.append(root)
+        self.__recursive_overlapping(root.right_child, a, b, result)
+
+    def overlapping(self, a, b):
+        """
+        FINDS every interval that OVERLAPS the closed interval [`a`, `b`].
+
+        :Parameters:
+            - `a`: the LOW endpoint of the query interval
+            - `b`: the HIGH endpoint of the query interval
+
+        :Return:
+            A `list` of POINTERS to the overlapping nodes, in interval order
+        """
+
+        # STEP 1: Ensure the query interval is NOT inverted
+        if (self.cmp_fn(a, b) == IntervalTree.CMPValues.GREATER.value):
+            raise ValueError("`a` must be LESS than or EQUAL to `b`")
+
+        # STEP 2: Prune subtrees via `max_high` & the LOW endpoint ordering
+        result = []
+        self.__recursive_overlapping(self.root, a, b, result)
+        return result
+
+    def stabbing(self, point):
+        """
+        FINDS every interval that CONTAINS `point`.
+
+        :Parameters:
+            - `point`: the value to be stabbed
+
+        :Return:
+            A `list` of POINTERS to the nodes containing `point`
+        """
+        return self.overlapping(point, point)
+
+    def inorder_walk(self, root, operation = print):
+        """
+        Performs a tree TRAVERSAL in the following order:
+        1. LEFT subtree
+        2. ROOT node
+        3. RIGHT subtree
+
+        :Parameters:
+            - `root`: the ROOT node of the interval tree
+            - `operation`: a function (default `print`) that specifies the
+              ACTION to be performed on the (LOW, HIGH) interval of every
+              visited node
+        """
+
+        # STEP 1: Ensure the root is not NULL
+        if root:
+            self.inorder_walk(root.left_child, operation)
+            operation((root.key, root.high))
+            self.inorder_walk(root.right_child, operation)
@@ -0,0 +1,68 @@
+# @file     test_interval_tree.py
+# @brief    A file for testing the interval tree
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from interval_tree import IntervalTree
+
+# ---------------------------------------------------------------------------- #
+
+def cmp_fn(v1, v2):
+    return (v1 > v2) - (v1 < v2)
+
+def check_node(node):
+    """
+    CHECKS the AVL balance & `max_high` of every node, returning the height.
+    """
+    if (node is None):
+        return 0
+    left = check_node(node.left_child)
+    right = check_node(node.right_child)
+    assert abs(left - right) <= 1
+    highs = [node.high] + [child.max_high for child in
+                           (node.left_child, node.right_child) if (child is not None)]
+    assert node.max_high == max(highs)
+    return 1 + max(left, right)
+
+def pairs(nodes):
+    return sorted((node.key, node.high) for node in nodes)
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(4)
+    tree = IntervalTree(cmp_fn)
+    intervals = []
+    for _ in range(500):
+        low = rng.randrange(1000)
+        intervals.append((low, low + rng.randrange(50)))
+        tree.insert_node(*intervals[-1])
+    check_node(tree.root)
+    for _ in range(200):
+        a = rng.randrange(1050)
+        b = a + rng.randrange(30)
+        expected = sorted(i for i in intervals if (i[0] <= b) and (a <= i[1]))
+        assert pairs(tree.overlapping(a, b)) == expected
+        assert pairs(tree.stabbing(a)) == sorted(i for i in intervals if i[0] <= a <= i[1])
+
+def test_delete_keeps_max_high():
+    rng = random.Random(5)
+    tree = IntervalTree(cmp_fn)
+    intervals = [(low, low + rng.randrange(100)) for low in rng.sample(range(300), 100)]
+    for interval in intervals:
+        tree.insert_node(*interval)
+    for interval in intervals[:60]:
+        tree.delete_node(*interval)
+        check_node(tree.root)
+    remaining = sorted(intervals[60:])
+    assert pairs(tree.overlapping(-1, 1000)) == remaining
+
+def test_rejects_inverted_intervals():
+    tree = IntervalTree(cmp_fn)
+    with pytest.raises(ValueError):
+        tree.insert_node(5, 1)
+    with pytest.raises(ValueError):
+        tree.overlapping(5, 1)
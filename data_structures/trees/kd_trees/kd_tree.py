@@ -0,0 +1,449 @@
+# @file     kd_tree.py
+# @brief    A file for implementing a k-dimensional tree (KDT)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import heapq
+import random
+
+# ---------------------------------------------------------------------------- #
+
+class KDT(object):
+    """
+    An INTERFACE for a k-dimensional tree (KDT).
+    """
+
+    class Node(object):
+        """
+        A NODE for a k-dimensional tree (KDT).
+        """
+
+        def __init__(self, key, axis):
+            self._key = key
+            self._axis = axis
+            self._parent = None
+            self._left_child = None
+            self._right_child = None
+
+        @property
+        def key(self):
+            """
+            The POINT (i.e. a `tuple` of coordinates) of the KDT node.
+            """
+            return self._key
+
+        @key.setter
+        def key(self, new_key):
+            self._key = new_key
+
+        @key.deleter
+        def key(self):
+            del self._key
+
+        @property
+        def axis(self):
+            """
+            The DIMENSION that the KDT node splits it's subtrees along.
+            """
+            return self._axis
+
+        @axis.setter
+        def axis(self, new_axis):
+            self._axis = new_axis
+
+        @axis.deleter
+        def axis(self):
+            del self._axis
+
+        @property
+        def parent(self):
+            """
+            The PARENT node of the current KDT node.
+            """
+            return self._parent
+
+        @parent.setter
+        def parent(self, new_parent):
+
+            # STEP 1: Ensure `new_parent` is of type `KDT.Node` or `None`
+            if (isinstance(new_parent, KDT.Node) or (new_parent is None)):
+                self._parent = new_parent
+                return
+
+            # STEP 2: `new_parent` is an INAPPROPRIATE type
+            raise TypeError("`new_parent` must be of TYPE `KDT.Node` or `None`")
+
+        @parent.deleter
+        def parent(self):
+            del self._parent
+
+        @property
+        def left_child(self):
+            """
+            The LEFT CHILD of the KDT node: has a coordinate LESS than the
+            parent along the parent's `axis`.
+            """
+            return self._left_child
+
+        @left_child.setter
+        def left_child(self, new_left_child):
+
+            # STEP 1: Ensure `new_left_child` is of type `KDT.Node` or `None`
+            if (isinstance(new_left_child, KDT.Node) or (new_left_child is None)):
+                self._left_child = new_left_child
+                return
+
+            # STEP 2: `new_left_child` is an INAPPROPRIATE type
+            raise TypeError("`new_left_child` must be of TYPE `KDT.Node` or `None`")
+
+        @left_child.deleter
+        def left_child(self):
+            del self._left_child
+
+        @property
+        def right_child(self):
+            """
+            The RIGHT CHILD of the KDT node: has a coordinate GREATER or EQUAL
+            to the parent along the parent's `axis`.
+            """
+            return self._right_child
+
+        @right_child.setter
+        def right_child(self, new_right_child):
+
+            # STEP 1: Ensure `new_right_child` is of type `KDT.Node` or `None`
+            if (isinstance(new_right_child, KDT.Node) or (new_right_child is None)):
+                self._right_child = new_right_child
+                return
+
+            # STEP 2: `new_right_child` is an INAPPROPRIATE type
+            raise TypeError("`new_right_child` must be of TYPE `KDT.Node` or `None`")
+
+        @right_child.deleter
+        def right_child(self):
+            del self._right_child
+
+    def __init__(self, dimensions, points = None):
+
+        # STEP 1: Ensure `dimensions` is a positive `int`
+        if (not isinstance(dimensions, int)):
+            raise TypeError("`dimensions` must be of TYPE `int`")
+        elif (dimensions < 1):
+            raise ValueError("`dimensions` must be at LEAST 1")
+
+        # STEP 2: Assign KDT attributes
+        self._dimensions = dimensions
+        self._root = None
+
+        # STEP 3: Bulk construct the KDT if any points were given
+        if (points is not None):
+            self.build(points)
+
+    @property
+    def dimensions(self):
+        """
+        The NUMBER of coordinates in every KDT point.
+        """
+        return self._dimensions
+
+    @property
+    def root(self):
+        """
+        The TOP or FIRST node in the KDT.
+        """
+        return self._root
+
+    @root.setter
+    def root(self, new_root):
+
+        # STEP 1: Ensure `new_root` is of type `KDT.Node` or `None`
+        if (isinstance(new_root, KDT.Node) or (new_root is None)):
+            self._root = new_root
+            return
+
+        # STEP 2: `new_root` is an INAPPROPRIATE type
+        raise TypeError("`new_root` must be of TYPE `KDT.Node` or `None`")
+
+    @root.deleter
+    def root(self):
+        del self._root
+
+    def __check_point(self, point, name = "point"):
+        """
+        ENSURES `point` has exactly `dimensions` coordinates.
+        """
+        if (len(point) != self.dimensions):
+            raise ValueError("`{}` must have {} coordinates".format(
+                name, self.dimensions))
+
+    @staticmethod
+    def __select(values, k):
+        """
+        FINDS the `k`-th SMALLEST of `values` in expected O(n) time by
+        quickselect, rather than sorting them.
+
+        :Parameters:
+            - `values`: a NON-empty `list` of coordinates
+            - `k`: the 0-based RANK of the coordinate to be found
+
+        :Return:
+            The `k`-th SMALLEST coordinate
+        """
+        while (True):
+
+            # STEP 1: Count the values LESS than & EQUAL to a random pivot
+            pivot = random.choice(values)
+            lower = [value for value in values if value < pivot]
+            equal = sum(1 for value in values if value == pivot)
+
+            # CASE A: The `k`-th value is LESS than the pivot
+            if (k < len(lower)):
+                values = lower
+
+            # CASE B: The `k`-th value is the pivot
+            elif (k < len(lower) + equal):
+                return pivot
+
+            # CASE C: The `k`-th value is GREATER than the pivot
+            else:
+                k -= len(lower) + equal
+                values = [value for value in values if value > pivot]
+
+    def __build_balanced(self, points):
+        """
+        BUILDS a KDT from `points` ITERATIVELY by splitting every subtree on
+        the median of it's axis, which is SELECTED in expected O(n) time so
+        the whole build is O(n log n). The ROOT of every subtree is a point
+        EQUAL to the median, with every point LESS than it going LEFT & the
+        rest RIGHT (as `insert_node` puts them). With many EQUAL coordinates
+        the tree is therefore taller, which is why an explicit stack is used
+        rather than recursion.
+
+        :Parameters:
+            - `points`: a `list` of points to build the KDT from
+
+        :Return:
+            A POINTER to the ROOT of the newly built KDT
+        """
+
+        # STEP 1: Each entry is the points of a subtree still to be built,
+        #         it's depth, the parent node of it's ROOT & the side it
+        #         hangs off
+        root = None
+        stack = [(points, 0, None, False)]
+        while (stack):
+            points, depth, parent, is_right = stack.pop()
+
+            # CASE A: NO points remain, the child stays `None`
+            if (not points):
+                continue
+
+            # CASE B: Split the points around the median along `axis`
+            axis = depth % self.dimensions
+            median = KDT.__select([point[axis] for point in points], len(points) // 2)
+            left = [point for point in points if point[axis] < median]
+            right = [point for point in points if point[axis] >= median]
+            for i, point in enumerate(right):
+                if (point[axis] == median):
+                    break
+            node = KDT.Node(tuple(right.pop(i)), axis)
+            node.parent = parent
+            if (parent is None):
+                root = node
+            elif (is_right):
+                parent.right_child = node
+            else:
+                parent.left_child = node
+
+            # STEP 2: Build the LEFT & RIGHT subtrees
+            stack.append((left, depth + 1, node, False))
+            stack.append((right, depth + 1, node, True))
+        return root
+
+    def build(self, points):
+        """
+        REPLACES the contents of the KDT with a BALANCED tree built from
+        `points`, by splitting every subtree on the median of it's axis.
+
+        :Parameters:
+            - `points`: an ITERABLE of points with `dimensions` coordinates
+        """
+
+        # STEP 1: Ensure every point has the correct number of coordinates
+        points = list(points)
+        for point in points:
+            self.__check_point(point)
+
+        # STEP 2: Build the KDT from the median down
+        self.root = self.__build_balanced(points)
+
+    def insert_node(self, point):
+        """
+        INSERTS a new KDT node ITERATIVELY.
+
+        :Parameters:
+            - `point`: the POINT of the new KDT node to be inserted
+
+        :Return:
+            A POINTER to the newly inserted KDT node
+        """
+
+        # STEP 1: Ensure the point has the correct number of coordinates
+        self.__check_point(point)
+        point = tuple(point)
+
+        # STEP 2: Traverse the KDT to an empty slot
+        prev = None
+        curr = self.root
+        while (curr):
+            prev = curr
+            if (point[curr.axis] < curr.key[curr.axis]):
+                curr = curr.left_child
+            else:
+                curr = curr.right_child
+
+        # STEP 3A: KDT is EMPTY, insert at the ROOT
+        if (prev is None):
+            self.root = KDT.Node(point, 0)
+            return self.root
+
+        # STEP 3B: Attach the new node below `prev`
+        new_node = KDT.Node(point, (prev.axis + 1) % self.dimensions)
+        new_node.parent = prev
+        if (point[prev.axis] < prev.key[prev.axis]):
+            prev.left_child = new_node
+        else:
+            prev.right_child = new_node
+        return new_node
+
+    def search(self, point):
+        """
+        SEARCHES the KDT for a node with the same `point`.
+
+        :Parameters:
+            - `point`: the POINT to search for in the KDT
+
+        :Return:
+            - A POINTER to the KDT node that MATCHES `point`, OR
+            - `None`: if NO match was found
+        """
+
+        # STEP 1: Traverse the KDT along the splitting axis of every node
+        point = tuple(point)
+        curr = self.root
+        while (curr != None):
+            if (curr.key == point):
+                return curr
+            elif (point[curr.axis] < curr.key[curr.axis]):
+                curr = curr.left_child
+            else:
+                curr = curr.right_child
+
+        # STEP 2: `point` does not exist in the KDT
+        return None
+
+    def range_search(self, box):
+        """
+        FINDS every KDT node whose point lies within `box` (inclusive).
+
+        :Parameters:
+            - `box`: a PAIR `(lows, highs)` of the corner points of the box
+
+        :Return:
+            A `list` of POINTERS to the KDT nodes within `box`
+        """
+
+        # STEP 1: Ensure both corners have the correct number of coordinates
+        lows, highs = box
+        self.__check_point(lows, "lows")
+        self.__check_point(highs, "highs")
+
+        # STEP 2: Traverse ITERATIVELY, skipping subtrees outside the box
+        result = []
+        stack = [self.root] if self.root else []
+        while (stack):
+            node = stack.pop()
+            key = node.key
+            axis = node.axis
+
+            # STEP 3: Check if the node's point is within the box
+            if all(lo <= x <= hi for lo, x, hi in zip(lows, key, highs)):
+                result.append(node)
+
+            # STEP 4: Only visit the sides of the split the box reaches
+            if ((node.left_child != None) and (lows[axis] < key[axis])):
+                stack.append(node.left_child)
+            if ((node.right_child != None) and (highs[axis] >= key[axis])):
+                stack.append(node.right_child)
+        return result
+
+    def nearest(self, point, k = 1):
+        """
+        FINDS the `k` KDT nodes NEAREST to `point` by euclidean distance.
+
+        :Parameters:
+            - `point`: the POINT to query
+            - `k` (optional): the NUMBER of neighbours to find (default 1)
+
+        :Return:
+            A `list` of POINTERS to the nearest KDT nodes, closest first
+        """
+
+        # STEP 1: Ensure the query is valid
+        self.__check_point(point)
+        if (not isinstance(k, int)):
+            raise TypeError("`k` must be of TYPE `int`")
+        elif (k < 1):
+            raise ValueError("`k` must be at LEAST 1")
+
+        # STEP 2: Search the KDT ITERATIVELY, keeping the `k` best nodes in
+        #         a max-heap of `(-distance, id, node)` entries. Each stack
+        #         entry is a subtree & the squared distance from `point` to
+        #         the split that separates it from `point`
+        point = tuple(point)
+        heap = []
+        stack = [(self.root, 0)]
+        while (stack):
+            node, bound = stack.pop()
+
+            # STEP 3: Skip subtrees that can NOT hold a closer point
+            if ((node is None) or ((len(heap) == k) and (bound >= -heap[0][0]))):
+                continue
+
+            # STEP 4: Offer the current node to the heap
+            dist = sum((a - b) * (a - b) for a, b in zip(point, node.key))
+            if (len(heap) < k):
+                heapq.heappush(heap, (-dist, id(node), node))
+            elif (dist < -heap[0][0]):
+                heapq.heapreplace(heap, (-dist, id(node), node))
+
+            # STEP 5: Visit the side of the split containing `point` first,
+            #         so the FAR side is pruned by the best nodes found
+            diff = point[node.axis] - node.key[node.axis]
+            if (diff < 0):
+                near, far = node.left_child, node.right_child
+            else:
+                near, far = node.right_child, node.left_child
+            stack.append((far, diff * diff))
+            stack.append((near, bound))
+        return [node for _, _, node in sorted(heap, key = lambda e: -e[0])]
+
+    def inorder_walk(self, root, operation = print):
+        """
+        Performs an ALL-tree TRAVERSAL in the following order:
+        1. LEFT subtree
+        2. ROOT node
+        3. RIGHT subtree
+
+        :Parameters:
+            - `root`: the ROOT node of the KDT
+            - `operation`: a function (default `print`) that specifies the
+              ACTION to be performed on the KEY of every visited KDT node
+        """
+
+        # Ensure the root exists to continue traversals
+        if root:
+            self.inorder_walk(root.left_child, operation)
+            operation(root.key)
+            self.inorder_walk(root.right_child, operation)
@@ -0,0 +1,69 @@
+# @file     test_kd_tree.py
+# @brief    A file for testing the k-d tree (KDT)
+# @author   Jude Thaddeau Data
+# @note     GitHub: https://github.com/jtd-117
+# ---------------------------------------------------------------------------- #
+
+import random
+
+import pytest
+
+from kd_tree import KDT
+
+# ---------------------------------------------------------------------------- #
+
+def random_points(rng, n, dims, span = 50):
+    return [tuple(rng.randrange(span) for _ in range(dims)) for _ in range(n)]
+
+def dist(p, q):
+    return sum((a - b) * (a - b) for a, b in zip(p, q))
+
+def test_build_and_insert_are_searchable():
+    rng = random.Random(6)
+    points = random_points(rng, 400, 3, span = 8)
+    tree = KDT(3, points[:300])
+    for point in points[300:]:
+        tree.insert_node(point)
+    for point in points:
+        node = tree.search(point)
+        assert (node is not None) and (node.key == point)
+    assert tree.search((99, 99, 99)) is None
+
+def test_range_search_matches_brute_force():
+    rng = random.Random(7)
+    points = random_points(rng, 500, 2)
+    tree = KDT(2, points)
+    for _ in range(100):
+        lows = (rng.randrange(50), rng.randrange(50))
+        highs = (lows[0] + rng.randrange(15), lows[1] + rng.randrange(15))
+        found = sorted(node.key for node in tree.range_search((lows, highs)))
+        assert found == sorted(p for p in points
+                               if all(lo <= x <= hi for lo, x, hi in zip(lows, p, highs)))
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(8)
+    points = random_points(rng, 300, 2, span = 1000)
+    tree = KDT(2, points)
+    for _ in range(50):
+        query = (rng.randrange(1000), rng.randrange(1000))
+        found = [dist(node.key, query) for node in tree.nearest(query, k = 5)]
+        assert found == sorted(dist(p, query) for p in points)[:5]
+
+def test_rejects_points_of_the_wrong_dimension():
+    tree = KDT(2)
+    with pytest.raises(ValueError):
+        tree.insert_node((1, 2, 3))
+
+def test_many_duplicate_points():
+    points = [(0, 0)] * 3000 + [(1, 1)] * 10
+    tree = KDT(2, points)
+    assert tree.search((0, 0)).key == (0, 0)
+    assert len(tree.range_search(((0, 0), (0, 0)))) == 3000
+    assert [node.key for node in tree.nearest((1, 1), k = 12)] == [(1, 1)] * 10 + [(0, 0)] * 2
+    assert [node.key for node in tree.nearest((0, 0), k = 3)] == [(0, 0)] * 3
+
+def test_build_splits_on_the_median():
+    tree = KDT(1, [(x,) for x in range(7)])
+    assert tree.root.key == (3,)
+    assert (tree.root.left_child.key, tree.root.right_child.key) == ((1,), (5,))
+    assert tree.root.left_child.parent is tree.root